@@ -148,7 +148,7 @@ class HbnbFacade:
         return [r.to_dict() for r in self.repo.list(Review)]
 
     def list_reviews_for_place(self, place_id: str) -> List[Dict[str, Any]]:
-        return [r.to_dict() for r in self.repo.list(Review, predicate=lambda x: x.place_id == place_id)]
+        return [r.to_dict() for r in self.repo.list(Review, where={"place_id": place_id})]
 
     def update_review(self, review_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         r = self.repo.get(Review, review_id)
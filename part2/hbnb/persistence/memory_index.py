@@ -0,0 +1,61 @@
+"""
+Secondary indexes for MemoryRepository.
+
+Each index maps an attribute value to the ids of the objects holding it.
+The value seen at indexing time is remembered per id, because the facade
+mutates objects in place before calling ``update``; the old entry can
+then still be found and moved.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Set
+
+
+class HashIndex:
+    """Equality index on one attribute, optionally unique."""
+
+    def __init__(self, field: str, unique: bool = False):
+        self.field = field
+        self.unique = unique
+        self._entries: Dict[Any, Set[str]] = {}
+        self._values: Dict[str, Any] = {}
+
+    def check(self, obj) -> None:
+        """Raise ValueError if indexing ``obj`` would break uniqueness."""
+        if not self.unique:
+            return
+        value = getattr(obj, self.field, None)
+        holders = self._entries.get(value, ())
+        if any(holder != obj.id for holder in holders):
+            raise ValueError(f"{type(obj).__name__} with {self.field}={value!r} already exists")
+
+    def insert(self, obj) -> None:
+        """Index ``obj`` (or move it if its value changed)."""
+        value = getattr(obj, self.field, None)
+        if obj.id in self._values:
+            if self._values[obj.id] == value:
+                return
+            self.remove(obj.id)
+        self._entries.setdefault(value, set()).add(obj.id)
+        self._values[obj.id] = value
+
+    def remove(self, obj_id: str) -> None:
+        """Drop ``obj_id`` from the index if present."""
+        if obj_id not in self._values:
+            return
+        value = self._values.pop(obj_id)
+        ids = self._entries.get(value)
+        if ids is not None:
+            ids.discard(obj_id)
+            if not ids:
+                del self._entries[value]
+
+    def lookup(self, value: Any) -> Set[str]:
+        """Ids whose indexed value equals ``value``."""
+        return self._entries.get(value, set())
+
+    def lookup_many(self, values: Iterable[Any]) -> Set[str]:
+        """Ids whose indexed value is any of ``values``."""
+        found: Set[str] = set()
+        for value in values:
+            found |= self._entries.get(value, set())
+        return found
@@ -1,19 +1,51 @@
 from __future__ import annotations
-from typing import Dict, Type, TypeVar, List, Optional, Callable
+from typing import Any, Dict, Type, TypeVar, List, Optional, Callable
 from dataclasses import asdict
+from .memory_index import HashIndex
 
 T = TypeVar("T")
 
+# Secondary indexes per model class name: field -> unique?
+DEFAULT_INDEXES: Dict[str, Dict[str, bool]] = {
+    "User": {"email": True},
+    "Place": {"owner_id": False},
+    "Review": {"place_id": False, "user_id": False},
+}
+
 class MemoryRepository:
     """Simple in-memory repo keyed by model class name then id."""
 
-    def __init__(self):
+    def __init__(self, indexes: Optional[Dict[str, Dict[str, bool]]] = None):
         self._db: Dict[str, Dict[str, object]] = {}
+        self._indexes: Dict[str, Dict[str, HashIndex]] = {}
+        declared = DEFAULT_INDEXES if indexes is None else indexes
+        for cls_name, fields in declared.items():
+            for field, unique in fields.items():
+                self._indexes.setdefault(cls_name, {})[field] = HashIndex(field, unique)
 
     def _bucket(self, cls: Type[T]) -> Dict[str, T]:
         return self._db.setdefault(cls.__name__, {})  # type: ignore
 
+    def declare_index(self, cls: Type[T], field: str, unique: bool = False) -> None:
+        """Add a secondary index on ``cls.field`` and build it from existing rows."""
+        index = HashIndex(field, unique)
+        for obj in self._bucket(cls).values():
+            index.check(obj)
+            index.insert(obj)
+        self._indexes.setdefault(cls.__name__, {})[field] = index
+
+    def _index_for(self, cls: Type[T]) -> Dict[str, HashIndex]:
+        return self._indexes.get(cls.__name__, {})
+
+    def _reindex(self, obj) -> None:
+        indexes = self._index_for(type(obj)).values()
+        for index in indexes:
+            index.check(obj)
+        for index in indexes:
+            index.insert(obj)
+
     def add(self, obj: T) -> T:
+        self._reindex(obj)
         bucket = self._bucket(type(obj))
         bucket[obj.id] = obj
         return obj
@@ -21,14 +53,31 @@ class MemoryRepository:
     def get(self, cls: Type[T], obj_id: str) -> Optional[T]:
         return self._bucket(cls).get(obj_id)  # type: ignore
 
-    def list(self, cls: Type[T], predicate: Optional[Callable[[T], bool]] = None) -> List[T]:
-        values = list(self._bucket(cls).values())  # type: ignore
+    def list(self, cls: Type[T], predicate: Optional[Callable[[T], bool]] = None,
+             where: Optional[Dict[str, Any]] = None) -> List[T]:
+        """List objects, optionally matching ``where`` field equalities.
+
+        When a ``where`` field is indexed only the matching ids are visited.
+        """
+        bucket = self._bucket(cls)
+        indexes = self._index_for(cls)
+        where = where or {}
+        indexed = [f for f in where if f in indexes]
+        if indexed:
+            ids = min((indexes[f].lookup(where[f]) for f in indexed), key=len)
+            values = [bucket[i] for i in ids if i in bucket]  # type: ignore
+        else:
+            values = list(bucket.values())  # type: ignore
+        if where:
+            values = [v for v in values
+                      if all(getattr(v, f, None) == val for f, val in where.items())]
         return [v for v in values if predicate(v)] if predicate else values
 
     def update(self, obj: T) -> T:
         bucket = self._bucket(type(obj))
         if obj.id not in bucket:
             raise KeyError(f"{type(obj).__name__}({obj.id}) not found")
+        self._reindex(obj)
         bucket[obj.id] = obj
         return obj
 
@@ -36,3 +85,5 @@ class MemoryRepository:
         bucket = self._bucket(cls)
         if obj_id in bucket:
             del bucket[obj_id]
+            for index in self._index_for(cls).values():
+                index.remove(obj_id)
@@ -0,0 +1,32 @@
+import unittest
+from hbnb.persistence.memory_repo import MemoryRepository
+from hbnb.bl.user import User
+from hbnb.bl.place import Place
+from hbnb.bl.review import Review
+
+class MemoryRepoIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.repo = MemoryRepository()
+        self.user = self.repo.add(User(email="a@b.com", password="pw"))
+
+    def test_unique_email(self):
+        with self.assertRaises(ValueError):
+            self.repo.add(User(email="a@b.com", password="pw"))
+        self.assertEqual(self.repo.list(User, where={"email": "a@b.com"}), [self.user])
+
+    def test_index_follows_updates_and_deletes(self):
+        place = self.repo.add(Place(name="P", owner_id=self.user.id))
+        place.owner_id = "other"
+        self.repo.update(place)
+        self.assertEqual(self.repo.list(Place, where={"owner_id": self.user.id}), [])
+        self.assertEqual(self.repo.list(Place, where={"owner_id": "other"}), [place])
+        self.repo.delete(Place, place.id)
+        self.assertEqual(self.repo.list(Place, where={"owner_id": "other"}), [])
+
+    def test_reviews_by_place(self):
+        for i in range(6):
+            self.repo.add(Review(text="t", user_id=self.user.id, place_id=f"p{i % 2}"))
+        self.assertEqual(len(self.repo.list(Review, where={"place_id": "p1"})), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,4 @@
-from flask import Flask
+from flask import Flask, g
 from flask_restx import Api
 from flask_jwt_extended import JWTManager
 from flask_sqlalchemy import SQLAlchemy
@@ -6,11 +6,17 @@ from flask_cors import CORS
 from hbnb.errors import register_error_handlers
 from hbnb.facade import HbnbFacade
 from hbnb.persistence.user_repository import UserRepository
+from hbnb.persistence.cache import CachedRepository, make_cache
+from hbnb.persistence.spatial import install_spatial_indexes
+from hbnb.persistence.migrations import RATING_COLUMN, upgrade_schema
+from hbnb.api.serializers import json_backend
 from hbnb.api.v1.users import ns as users_ns
 from hbnb.api.v1.amenities import ns as amenities_ns
 from hbnb.api.v1.places import ns as places_ns
 from hbnb.api.v1.reviews import ns as reviews_ns
 from hbnb.api.v1.auth import ns as auth_ns
+from hbnb.api.v1.admin import ns as admin_ns
+from hbnb.cli import db_cli, index_cli
 from hbnb.bl.user import bcrypt
 from hbnb.bl.base import Base
 from config import config
@@ -22,8 +28,12 @@ def create_app(config_name="development") -> Flask:
     app = Flask(__name__)
     app.config.from_object(config[config_name])
 
+    # Encoder of list responses (orjson when installed, unless configured)
+    app.config["JSON_DUMPS"] = json_backend(app.config["JSON_BACKEND"])
+
     # Initialize extensions
-    CORS(app)  # Enable CORS for all routes
+    # Enable CORS for all routes; pages advertise the next one in headers
+    CORS(app, expose_headers=["Link", "X-Next-Cursor"])
     bcrypt.init_app(app)
     jwt = JWTManager(app)
     db.init_app(app)
@@ -31,12 +41,50 @@ def create_app(config_name="development") -> Flask:
     # Create database tables
     with app.app_context():
         db.create_all()
+        # create_all() never alters existing tables: upgrade them in place
+        with db.engine.begin() as connection:
+            upgraded = upgrade_schema(connection)
+        # R*Tree for bounding-box searches on SQLite (indexes existing rows)
+        with db.engine.begin() as connection:
+            install_spatial_indexes(connection)
 
         # Initialize UserRepository with database session
-        user_repo = UserRepository(db.session)
+        repo = UserRepository(db.session)
+
+        # Serve hot entities (owners, amenities, places) from the cache
+        cache = make_cache(app.config["CACHE_BACKEND"],
+                           max_entries=app.config["CACHE_MAX_ENTRIES"],
+                           ttl=app.config["CACHE_TTL_SECONDS"],
+                           url=app.config["CACHE_URL"],
+                           # A per-process stand-in only where one process runs
+                           local=app.debug or app.testing)
+        if cache is not None:
+            repo = CachedRepository(repo, cache)
+
+        # Attach shared facade with the repository
+        app.config["FACADE"] = HbnbFacade(repo=repo,
+                                          index_max_age=app.config["PLACE_INDEX_MAX_AGE"],
+                                          range_facets=app.config["PLACE_RANGE_FACETS"])
+        if RATING_COLUMN in upgraded.get("places", ()):
+            # Rating aggregates just added start at 0: fill them from reviews
+            app.config["FACADE"].recompute_place_ratings()
+
+    # One transaction per request: facade writes join this unit of work
+    # and everything is committed (or rolled back) once at teardown.
+    @app.before_request
+    def begin_unit_of_work():
+        repo.begin()
+
+    @app.after_request
+    def flag_failed_request(response):
+        if response.status_code >= 400:
+            g.unit_of_work_failed = True
+        return response
 
-        # Attach shared facade with the UserRepository
-        app.config["FACADE"] = HbnbFacade(repo=user_repo)
+    @app.teardown_request
+    def end_unit_of_work(exc):
+        if repo.in_unit_of_work():
+            repo.end(error=exc is not None or g.get("unit_of_work_failed", False))
 
     # Initialize API
     api = Api(
@@ -53,8 +101,11 @@ def create_app(config_name="development") -> Flask:
     api.add_namespace(places_ns, path="/api/v1/places")
     api.add_namespace(reviews_ns, path="/api/v1/reviews")
     api.add_namespace(auth_ns, path="/api/v1/auth")
+    api.add_namespace(admin_ns, path="/api/v1/admin")
 
     register_error_handlers(app)
+    app.cli.add_command(index_cli)
+    app.cli.add_command(db_cli)
     return app
 
 if __name__ == "__main__":
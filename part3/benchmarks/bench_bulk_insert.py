@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-row repository inserts vs. add_many bulk inserts.
+
+Usage:
+    python benchmarks/bench_bulk_insert.py [bulk_rows] [per_row_rows]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from hbnb.bl.base import Base
+from hbnb.bl.user import User
+from hbnb.bl.amenity import Amenity  # noqa: F401 (registers the mapper)
+from hbnb.bl.review import Review  # noqa: F401 (registers the mapper)
+from hbnb.bl.place import Place
+from hbnb.persistence.sqlalchemy_repo import SQLAlchemyRepository
+
+
+def make_places(count, owner_id):
+    for i in range(count):
+        yield Place(name=f"Place {i}", description="bench", price=float(i % 500),
+                    latitude=(i % 180) - 90.0, longitude=(i % 360) - 180.0,
+                    owner_id=owner_id)
+
+
+def run(bulk_rows, per_row_rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            repo = SQLAlchemyRepository(session)
+            owner = repo.add(User(email="bench@example.com", password="x",
+                                  first_name="B", last_name="B"))
+
+            start = time.perf_counter()
+            for place in make_places(per_row_rows, owner.id):
+                repo.add(place)
+            per_row = (time.perf_counter() - start) / per_row_rows
+
+            start = time.perf_counter()
+            repo.add_many(make_places(bulk_rows, owner.id))
+            bulk = (time.perf_counter() - start) / bulk_rows
+
+        engine.dispose()
+
+    print(f"add()      : {per_row * 1e6:9.1f} us/row ({per_row_rows} rows)")
+    print(f"add_many() : {bulk * 1e6:9.1f} us/row ({bulk_rows} rows)")
+    print(f"speedup    : {per_row / bulk:9.1f}x")
+    print(f"1M rows    : {per_row * 1e6:9.0f} s per-row vs {bulk * 1e6:.0f} s bulk")
+
+
+if __name__ == "__main__":
+    bulk_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    per_row_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    run(bulk_rows, per_row_rows)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: radius search latency with the spatial indexes.
+
+Places are spread over Europe-sized coordinates; each query asks for the
+50 nearest places within 10 km of a random point.
+
+Usage:
+    python benchmarks/bench_geo_search.py [sqlite_rows] [memory_rows] [queries]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from hbnb.bl.base import Base
+from hbnb.bl.user import User
+from hbnb.bl.amenity import Amenity  # noqa: F401 (registers the mapper)
+from hbnb.bl.review import Review  # noqa: F401 (registers the mapper)
+from hbnb.bl.place import Place
+from hbnb.facade import HbnbFacade
+from hbnb.persistence.memory_repo import MemoryRepository
+from hbnb.persistence.sqlalchemy_repo import SQLAlchemyRepository
+
+
+def make_places(count, owner_id, rng):
+    for i in range(count):
+        yield Place(name=f"Place {i}", price=float(i % 500),
+                    latitude=rng.uniform(36.0, 60.0), longitude=rng.uniform(-10.0, 30.0),
+                    owner_id=owner_id)
+
+
+def time_queries(facade, queries, rng):
+    points = [(rng.uniform(36.0, 60.0), rng.uniform(-10.0, 30.0)) for _ in range(queries)]
+    timings = []
+    for lat, lng in points:
+        start = time.perf_counter()
+        facade.list_places_near(lat, lng, 10, limit=50)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2], timings[int(len(timings) * 0.95)]
+
+
+def report(label, rows, timings):
+    p50, p95 = timings
+    print(f"{label:7}: {rows:8} places  p50 {p50 * 1e3:6.2f} ms  p95 {p95 * 1e3:6.2f} ms")
+
+
+def run(sqlite_rows, memory_rows, queries):
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            repo = SQLAlchemyRepository(session)
+            owner = repo.add(User(email="bench@example.com", password="x",
+                                  first_name="B", last_name="B"))
+            repo.add_many(make_places(sqlite_rows, owner.id, rng))
+            report("sqlite", sqlite_rows, time_queries(HbnbFacade(repo=repo), queries, rng))
+        engine.dispose()
+
+    repo = MemoryRepository()
+    owner = repo.add(User(email="bench@example.com", password="x", first_name="B", last_name="B"))
+    repo.add_many(make_places(memory_rows, owner.id, rng))
+    report("memory", memory_rows, time_queries(HbnbFacade(repo=repo), queries, rng))
+
+
+if __name__ == "__main__":
+    sqlite_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    memory_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+    queries = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    run(sqlite_rows, memory_rows, queries)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-place cost of encoding a /places page.
+
+Compares Flask-RESTX ``marshal`` followed by ``json.dumps`` (the path of
+``@ns.marshal_list_with``) with the compiled encoders of
+hbnb.api.serializers, on the stdlib and (when installed) orjson backends.
+
+Usage:
+    python benchmarks/bench_serialize.py [places] [amenities_per_place]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask_restx import marshal
+from hbnb.api.serializers import compile_encoder, json_backend, orjson
+from hbnb.api.v1.places import place_model
+from hbnb.bl.user import User
+from hbnb.facade import HbnbFacade
+from hbnb.persistence.memory_repo import MemoryRepository
+
+
+def make_places(count, amenities_per_place):
+    repo = MemoryRepository()
+    facade = HbnbFacade(repo=repo)
+    owner = repo.add(User(email="bench@example.com", password="x", first_name="B",
+                          last_name="B")).id
+    amenities = [facade.create_amenity({"name": f"Amenity {i}"})["id"] for i in range(20)]
+    for i in range(count):
+        facade.create_place({"name": f"Place {i}", "description": "bench", "price": float(i % 500),
+                             "latitude": (i % 180) - 90.0, "longitude": (i % 360) - 180.0,
+                             "owner_id": owner,
+                             "amenity_ids": amenities[i % 20:][:amenities_per_place]})
+    return facade.list_places()
+
+
+def per_item(encode, places, rounds=5):
+    """Best time per place over ``rounds`` encodings of the whole list."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        encode(places)
+        best = min(best, time.perf_counter() - start)
+    return best / len(places)
+
+
+def run(count, amenities_per_place):
+    places = make_places(count, amenities_per_place)
+    encoder = compile_encoder(place_model)
+    stdlib = json_backend("json")
+    runs = [
+        ("marshal + json.dumps", lambda items: json.dumps(marshal(items, place_model))),
+        ("compiled + json", lambda items: stdlib([encoder(item) for item in items])),
+    ]
+    if orjson is not None:
+        fast = json_backend("orjson")
+        runs.append(("compiled + orjson", lambda items: fast([encoder(item) for item in items])))
+
+    baseline = None
+    for name, encode in runs:
+        cost = per_item(encode, places)
+        baseline = baseline or cost
+        print(f"{name:22}: {cost * 1e6:7.1f} us/place  ({baseline / cost:5.1f}x)")
+    print(f"({count} places, {amenities_per_place} amenities each"
+          f"{'' if orjson is not None else '; orjson not installed'})")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    amenities_per_place = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    run(count, amenities_per_place)
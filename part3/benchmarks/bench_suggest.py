@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark: autocomplete latency of the place name prefix index.
+
+Names are one to three made-up words; one query in three follows a
+review-count change, as on a busy site. Queries use prefixes of one,
+two, three and five characters and ask for 10 suggestions.
+
+Usage:
+    python benchmarks/bench_suggest.py [places] [queries]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hbnb.indexes import PlaceSuggester
+
+SYLLABLES = "ba be bi bo mou ta te lo ra ri ca co sa su na ne".split()
+
+
+def word(rng):
+    return "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4)))
+
+
+def run(places, queries):
+    rng = random.Random(42)
+    records = [{"id": f"p{i}", "name": " ".join(word(rng) for _ in range(rng.randint(1, 3))),
+                "review_count": rng.randint(0, 50)} for i in range(places)]
+    index = PlaceSuggester()
+    start = time.perf_counter()
+    index.rebuild(records)
+    print(f"build  : {places:8} places  {time.perf_counter() - start:6.2f} s")
+
+    timings = []
+    for i in range(queries):
+        if i % 3 == 0:
+            record = records[rng.randrange(places)]
+            record["review_count"] += 1
+            index.add(dict(record))
+        prefix = word(rng)[:rng.choice((1, 2, 3, 5))]
+        start = time.perf_counter()
+        index.suggest(prefix, 10)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    p50, p99 = timings[len(timings) // 2], timings[int(len(timings) * 0.99)]
+    print(f"suggest: {queries:8} queries p50 {p50 * 1e3:6.3f} ms  p99 {p99 * 1e3:6.3f} ms")
+
+
+if __name__ == "__main__":
+    places = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    run(places, queries)
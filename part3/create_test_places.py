@@ -5,6 +5,7 @@ Script to create test places in the database
 from app import create_app, db
 from hbnb.bl.place import Place
 from hbnb.bl.user import User
+from hbnb.persistence.sqlalchemy_repo import SQLAlchemyRepository
 
 def create_test_places():
     """Create test places for testing the frontend"""
@@ -66,19 +67,23 @@ def create_test_places():
             }
         ]
 
-        created = 0
+        # One IN query for the names that already exist, then one bulk insert
+        names = [place_data['name'] for place_data in test_places]
+        existing = {
+            name for (name,) in
+            db.session.query(Place.name).filter(Place.name.in_(names))
+        }
+
+        new_places = []
         for place_data in test_places:
-            # Check if place with same name exists
-            existing = db.session.query(Place).filter_by(name=place_data['name']).first()
-            if not existing:
-                place = Place(**place_data)
-                db.session.add(place)
-                created += 1
-                print(f"Created: {place_data['name']} - ${place_data['price']}")
+            if place_data['name'] not in existing:
+                new_places.append(Place(**place_data))
             else:
                 print(f"Skipped (exists): {place_data['name']}")
 
-        db.session.commit()
+        created = SQLAlchemyRepository(db.session).add_many(new_places)
+        for place in new_places:
+            print(f"Created: {place.name} - ${place.price}")
 
         total = db.session.query(Place).count()
         print(f"\n✓ Created {created} new places")
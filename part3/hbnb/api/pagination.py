@@ -0,0 +1,48 @@
+from urllib.parse import urlencode
+from flask import current_app, request
+from flask_restx import reqparse, abort
+from hbnb.utils import encode_cursor, decode_cursor
+
+
+def add_page_arguments(parser: reqparse.RequestParser) -> reqparse.RequestParser:
+    """Add the keyset pagination query arguments to a parser."""
+    parser.add_argument("limit", type=int, location="args",
+                        help="Page size (bounded by PAGE_SIZE_MAX)")
+    parser.add_argument("cursor", type=str, location="args",
+                        help="Opaque cursor returned in the previous page's Link header")
+    return parser
+
+
+def page_args(args, sort=None):
+    """Validate pagination arguments; returns (seek key, limit)."""
+    limit = args.get("limit")
+    if limit is None:
+        limit = current_app.config["PAGE_SIZE_DEFAULT"]
+    maximum = current_app.config["PAGE_SIZE_MAX"]
+    if not 1 <= limit <= maximum:
+        abort(400, f"limit must be between 1 and {maximum}")
+    return decode_cursor(args.get("cursor"), sort), limit
+
+
+def paged(items, limit, sort=None, field=None):
+    """
+    Build a (body, status, headers) response for one page.
+
+    ``items`` is expected to hold up to ``limit + 1`` rows: the extra
+    look-ahead row only tells us a next page exists and is dropped.
+    ``sort`` is the page's sort field ("-" prefixed if descending), if
+    not the default created_at order, and ``field`` the item key holding
+    the sort value when it is not named after the sort.
+    """
+    headers = {}
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        field = field or (sort.lstrip("-") if sort else "created_at")
+        cursor = encode_cursor(last[field], last["id"], sort)
+        query = request.args.to_dict(flat=False)
+        query["cursor"] = [cursor]
+        query["limit"] = [str(limit)]
+        headers["Link"] = f'<{request.base_url}?{urlencode(query, doseq=True)}>; rel="next"'
+        headers["X-Next-Cursor"] = cursor
+    return items, 200, headers
@@ -0,0 +1,228 @@
+"""
+Fast JSON serialization of API models.
+
+``marshal`` walks every field of every nested model per item, asking
+each field object for its value, and the result is then encoded a second
+time by the JSON representation. For large lists that dominates the
+request. Here each (model, mask) pair is compiled once into a plain
+Python function building the output dict in one expression, and the
+result is encoded by the configured JSON backend: orjson when it is
+installed, the stdlib ``json`` module otherwise.
+
+The Flask-RESTX models stay the single description of the output: they
+are compiled as they are and still document the endpoints. Output is the
+same as ``marshal``'s (same keys, defaults and number coercions); field
+types without a compiled form fall back to the field's own ``output``.
+"""
+from __future__ import annotations
+import json
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, List, Optional
+from flask import Response, current_app, has_app_context, request
+from flask_restx import abort, fields, marshal
+from flask_restx.mask import Mask, ParseError
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+Encoder = Callable[[Any], Any]
+
+
+# ----- JSON backends -----
+def _stdlib_dumps(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def json_backend(name: Optional[str] = "auto") -> Callable[[Any], bytes]:
+    """
+    JSON encoder to bytes for a JSON_BACKEND setting.
+
+    Args:
+        name: "orjson", "json" (stdlib), or "auto" for orjson when it is
+            installed and the stdlib otherwise
+    """
+    if not name or name == "auto":
+        return orjson.dumps if orjson is not None else _stdlib_dumps
+    if name == "orjson":
+        if orjson is None:
+            raise RuntimeError("JSON_BACKEND 'orjson' requires the 'orjson' package")
+        return orjson.dumps
+    if name == "json":
+        return _stdlib_dumps
+    raise ValueError(f"unknown JSON backend {name!r}")
+
+
+def json_response(data: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Response with ``data`` encoded by the app's JSON backend."""
+    dumps = current_app.config.get("JSON_DUMPS") or _stdlib_dumps
+    return Response(dumps(data), status=status, headers=headers, mimetype="application/json")
+
+
+# ----- Compiled encoders -----
+def _str(value):
+    return value if value is None or type(value) is str else str(value)
+
+
+def _float(value):
+    return value if value is None or type(value) is float else float(value)
+
+
+def _int(value):
+    return value if value is None or type(value) is int else int(value)
+
+
+def _bool(value):
+    return value if value is None else bool(value)
+
+
+_SCALARS = ((fields.Boolean, _bool), (fields.Float, _float), (fields.Integer, _int),
+            (fields.String, _str))
+# Types with compiled forms; anything else (subclasses included) falls back
+_COMPILED = {fields.Boolean, fields.Float, fields.Integer, fields.String, fields.Raw,
+             fields.List, fields.Nested}
+
+
+def _scalar(field: fields.Raw) -> Optional[Callable[[Any], Any]]:
+    for cls, convert in _SCALARS:
+        if isinstance(field, cls):
+            return convert
+    return None
+
+
+class _Compiler:
+    """Generates the source of one encoder and collects the names it uses."""
+
+    def __init__(self):
+        self.names: Dict[str, Any] = {}
+        self.sources: List[str] = []
+
+    def bind(self, value: Any) -> str:
+        name = f"_v{len(self.names)}"
+        self.names[name] = value
+        return name
+
+    def model(self, model, mask, skip_none: bool = False) -> str:
+        """Name of a function encoding one object of ``model``."""
+        if any(isinstance(field, fields.Wildcard) for field in model.values()):
+            return self.bind(lambda obj: marshal(obj, model, skip_none=skip_none, mask=mask))
+        items = []
+        for name, field in model.items():
+            if mask is not None and name not in mask:
+                continue
+            submask = mask.get(name) if mask is not None else None
+            items.append(f"{name!r}: {self.field(name, field, submask)}")
+        body = "{" + ", ".join(items) + "}"
+        if skip_none:
+            body = f"{body}\n    return {{k: v for k, v in out.items() if v is not None}}"
+        else:
+            body = f"{body}\n    return out"
+        encoder = f"_encode{len(self.sources)}"
+        self.sources.append(f"def {encoder}(obj):\n    get = obj.get\n    out = {body}\n")
+        return encoder
+
+    def field(self, name: str, field: fields.Raw, mask) -> str:
+        """Expression of a field's output value, reading ``get``."""
+        if isinstance(field, type):
+            field = field()
+        key = field.attribute if field.attribute is not None else name
+        if type(field) not in _COMPILED or not isinstance(key, str) or "." in key:
+            return f"{self.bind(field)}.output({name!r}, obj)"
+        value = f"get({key!r})"
+        default = field.default
+        if isinstance(field, fields.Nested):
+            nested = self.model(field.nested, mask if isinstance(mask, Mask) else None,
+                                field.skip_none)
+            if field.allow_null:
+                return f"(None if (v := {value}) is None else {nested}(v))"
+            if default is not None:
+                return f"({self.bind(default)} if (v := {value}) is None else {nested}(v))"
+            return f"{nested}({value} or {{}})"
+        if isinstance(field, fields.List):
+            container = field.container
+            if isinstance(container, fields.Nested):
+                inner = self.model(container.nested, mask if isinstance(mask, Mask) else None,
+                                   container.skip_none)
+            elif type(container) in _COMPILED and not isinstance(container, fields.List):
+                inner = self.bind(_scalar(container) or (lambda item: item))
+            else:
+                return f"{self.bind(field)}.output({name!r}, obj)"
+            return (f"({self.bind(default)} if (v := {value}) is None "
+                    f"else [{inner}(item) for item in v])")
+        convert = _scalar(field)
+        if default is not None:
+            value = f"(v if (v := {value}) is not None else {self.bind(default)})"
+        return f"{self.bind(convert)}({value})" if convert else value
+
+
+def compile_encoder(model, mask: Optional[str] = None, skip_none: bool = False) -> Encoder:
+    """
+    Compile a Flask-RESTX model (and field mask) into a function encoding
+    one object (a dict) the way ``marshal`` would.
+    """
+    parsed = Mask(mask) if mask else None
+    compiler = _Compiler()
+    entry = compiler.model(model, parsed, skip_none)
+    namespace = dict(compiler.names)
+    exec("\n".join(compiler.sources), namespace)
+    return namespace[entry]
+
+
+_MODELS: Dict[int, Any] = {}
+
+
+@lru_cache(maxsize=256)
+def _encoder(model_id: int, mask: Optional[str]) -> Encoder:
+    return compile_encoder(_MODELS[model_id], mask)
+
+
+def encoder(model, mask: Optional[str] = None) -> Encoder:
+    """Compiled encoder of ``model`` under ``mask``, compiled once and cached."""
+    _MODELS.setdefault(id(model), model)
+    try:
+        return _encoder(id(model), mask or None)
+    except ParseError as e:
+        abort(400, f"invalid field mask: {e}")
+
+
+def parse_mask(mask: str) -> Mask:
+    """Parsed field mask; a malformed one aborts the request with 400."""
+    try:
+        return Mask(mask)
+    except ParseError as e:
+        abort(400, f"invalid field mask: {e}")
+
+
+def header_mask() -> Optional[str]:
+    """Field mask of the request's X-Fields header (None without one)."""
+    if not has_app_context():
+        return None
+    return request.headers.get(current_app.config["RESTX_MASK_HEADER"]) or None
+
+
+def serialize(data: Any, model, mask: Optional[str] = None, status: int = 200,
+              headers: Optional[Dict[str, str]] = None) -> Response:
+    """JSON response of an object, or a list of objects, of ``model``."""
+    encode = encoder(model, mask)
+    body = [encode(item) for item in data] if isinstance(data, list) else encode(data)
+    return json_response(body, status, headers)
+
+
+def serialize_list_with(ns, model, description: str = "Success"):
+    """
+    Drop-in for ``ns.marshal_list_with(model)`` on GET handlers.
+
+    The handler returns a list (optionally with status and headers, as
+    from ``paged``); the list is encoded by the compiled encoder of
+    ``model`` and the JSON backend. The model still documents the
+    response, and an X-Fields header mask is honoured as by marshal_with.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            data, status, headers = result if isinstance(result, tuple) else (result, 200, None)
+            return serialize(data, model, header_mask(), status, headers)
+        return ns.response(200, description, [model])(wrapper)
+    return decorator
@@ -0,0 +1,16 @@
+import json
+from flask import Response, stream_with_context
+
+
+def ndjson_response(rows) -> Response:
+    """
+    Stream an iterable of dicts as newline-delimited JSON.
+
+    Rows are encoded one at a time as the client reads, so a facade
+    generator backed by a streaming repository cursor never holds the
+    whole table in memory.
+    """
+    def generate():
+        for row in rows:
+            yield json.dumps(row) + "\n"
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
@@ -0,0 +1,143 @@
+from flask_restx import Namespace, Resource, fields, reqparse
+from flask_jwt_extended import jwt_required, get_jwt
+from hbnb.api import facade
+from hbnb.api.serializers import serialize_list_with
+from hbnb.geo import parse_bbox
+
+ns = Namespace("admin", description="Operational endpoints (Admin only)")
+
+cache_stats_model = ns.model("CacheStats", {
+    "enabled": fields.Boolean,
+    "hits": fields.Integer,
+    "misses": fields.Integer,
+    "evictions": fields.Integer,
+    "invalidations": fields.Integer,
+    "size": fields.Integer,
+})
+
+@ns.route("/cache")
+class CacheStats(Resource):
+    @ns.marshal_with(cache_stats_model)
+    @jwt_required()
+    def get(self):
+        """Entity cache hit/miss/eviction counters (Admin only)"""
+        require_admin()
+        stats = facade().cache_stats()
+        if stats is None:
+            return {"enabled": False}
+        return dict(stats, enabled=True)
+
+place_stats_model = ns.model("PlaceStats", {
+    "places": fields.Integer,
+    "owners": fields.Integer,
+    "reviews": fields.Integer,
+    "price_min": fields.Float,
+    "price_max": fields.Float,
+    "price_mean": fields.Float,
+    "rating_mean": fields.Float(description="Mean rating over all reviews"),
+})
+
+price_percentile_model = ns.model("PricePercentile", {
+    "percentile": fields.Float,
+    "price": fields.Float,
+})
+
+price_percentiles_model = ns.model("PricePercentiles", {
+    "places": fields.Integer,
+    "percentiles": fields.List(fields.Nested(price_percentile_model)),
+})
+
+region_price_model = ns.model("RegionPrice", {
+    "south": fields.Float,
+    "west": fields.Float,
+    "north": fields.Float,
+    "east": fields.Float,
+    "places": fields.Integer,
+    "price_mean": fields.Float,
+})
+
+owner_places_model = ns.model("OwnerPlaces", {
+    "owner_id": fields.String,
+    "first_name": fields.String,
+    "last_name": fields.String,
+    "places": fields.Integer,
+})
+
+stats_parser = reqparse.RequestParser()
+stats_parser.add_argument("bbox", type=str, location="args",
+                          help="'west,south,east,north': only count places inside the box")
+
+percentiles_parser = stats_parser.copy()
+percentiles_parser.add_argument("p", type=str, location="args",
+                                help="Comma-separated percentiles (default 25,50,75,90,99)")
+
+regions_parser = stats_parser.copy()
+regions_parser.add_argument("cell_deg", type=float, location="args", default=1.0,
+                            help="Grid cell size in degrees")
+regions_parser.add_argument("limit", type=int, location="args", default=100,
+                            help="Number of cells, most places first")
+
+owners_parser = stats_parser.copy()
+owners_parser.add_argument("limit", type=int, location="args", default=10,
+                           help="Number of owners (1-1000)")
+
+def require_admin():
+    if not get_jwt().get("is_admin", False):
+        ns.abort(403, "Admin privileges required")
+
+def stats_bbox(args):
+    try:
+        return parse_bbox(args["bbox"]) if args["bbox"] else None
+    except ValueError as e:
+        ns.abort(400, str(e))
+
+@ns.route("/stats/places")
+class PlaceStats(Resource):
+    @ns.expect(stats_parser)
+    @ns.marshal_with(place_stats_model)
+    @jwt_required()
+    def get(self):
+        """Place, owner and review counts with price and rating aggregates (Admin only)"""
+        require_admin()
+        return facade().place_stats(stats_bbox(stats_parser.parse_args()))
+
+@ns.route("/stats/price-percentiles")
+class PricePercentiles(Resource):
+    @ns.expect(percentiles_parser)
+    @ns.marshal_with(price_percentiles_model)
+    @jwt_required()
+    def get(self):
+        """Price percentiles (Admin only)"""
+        require_admin()
+        args = percentiles_parser.parse_args()
+        try:
+            percentiles = [float(p) for p in args["p"].split(",")] if args["p"] else None
+        except ValueError:
+            ns.abort(400, "p must be comma-separated numbers")
+        return facade().place_price_percentiles(percentiles, stats_bbox(args))
+
+@ns.route("/stats/price-by-region")
+class PriceByRegion(Resource):
+    @ns.expect(regions_parser)
+    @serialize_list_with(ns, region_price_model)
+    @jwt_required()
+    def get(self):
+        """Place count and mean price per grid cell (Admin only)"""
+        require_admin()
+        args = regions_parser.parse_args()
+        if args["limit"] < 1:
+            ns.abort(400, "limit must be positive")
+        return facade().place_price_by_region(args["cell_deg"], stats_bbox(args), args["limit"])
+
+@ns.route("/stats/owners")
+class PlacesPerOwner(Resource):
+    @ns.expect(owners_parser)
+    @serialize_list_with(ns, owner_places_model)
+    @jwt_required()
+    def get(self):
+        """Owners with the most places (Admin only)"""
+        require_admin()
+        args = owners_parser.parse_args()
+        if not 1 <= args["limit"] <= 1000:
+            ns.abort(400, "limit must be between 1 and 1000")
+        return facade().places_per_owner(args["limit"], stats_bbox(args))
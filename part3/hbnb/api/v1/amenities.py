@@ -1,6 +1,8 @@
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, reqparse
 from flask_jwt_extended import jwt_required, get_jwt
 from hbnb.api import facade
+from hbnb.api.pagination import add_page_arguments, page_args, paged
+from hbnb.api.serializers import serialize_list_with
 
 ns = Namespace("amenities", description="Amenity operations")
 
@@ -12,11 +14,15 @@ amenity_model = ns.model("Amenity", {
     "updated_at": fields.String(readonly=True),
 })
 
+list_parser = add_page_arguments(reqparse.RequestParser())
+
 @ns.route("")
 class AmenityList(Resource):
-    @ns.marshal_list_with(amenity_model)
+    @ns.expect(list_parser)
+    @serialize_list_with(ns, amenity_model)
     def get(self):
-        return facade().list_amenities()
+        after, limit = page_args(list_parser.parse_args())
+        return paged(facade().list_amenities(after=after, limit=limit + 1), limit)
 
     @ns.expect(amenity_model, validate=True)
     @ns.marshal_with(amenity_model, code=201)
@@ -1,6 +1,12 @@
-from flask_restx import Namespace, Resource, fields
+from flask import current_app
+from flask_restx import Namespace, Resource, fields, inputs, reqparse
+from flask_restx.mask import Mask
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from hbnb.api import facade
+from hbnb.api.pagination import add_page_arguments, page_args, paged
+from hbnb.api.serializers import header_mask, parse_mask, serialize, serialize_list_with
+from hbnb.api.streaming import ndjson_response
+from hbnb.geo import parse_bbox, parse_point
 
 ns = Namespace("places", description="Place operations")
 
@@ -29,13 +35,206 @@ place_model = ns.model("Place", {
     "amenities": fields.List(fields.Nested(amenity_inline), readonly=True),
     "created_at": fields.String(readonly=True),
     "updated_at": fields.String(readonly=True),
+    "review_count": fields.Integer(readonly=True),
+    "rating": fields.Float(readonly=True, description="Average review rating (0 without reviews)"),
+    "rating_histogram": fields.List(fields.Integer, readonly=True,
+                                    description="Number of reviews per rating, index 0 to 5"),
+    "distance_km": fields.Float(readonly=True, description="Distance from the search point (geo searches only)"),
+    "score": fields.Float(readonly=True, description="Ranking score (sort=top only)"),
+    "similarity": fields.Float(readonly=True, description="Cosine similarity (similar places only)"),
 })
 
+place_card_model = ns.model("PlaceCard", {
+    "id": fields.String,
+    "name": fields.String,
+    "price": fields.Float,
+    "created_at": fields.String,
+    "review_count": fields.Integer,
+    "rating": fields.Float(description="Average review rating (0 without reviews)"),
+})
+
+facet_bucket = ns.model("FacetBucket", {
+    "id": fields.String(description="Amenity id (amenities facet)"),
+    "name": fields.String(description="Amenity name (amenities facet)"),
+    "key": fields.String(description="Bucket label such as '50-100' or '500+' (range facets)"),
+    "min": fields.Float(description="Inclusive lower edge (range facets)"),
+    "max": fields.Float(description="Exclusive upper edge, absent on the last bucket"),
+    "count": fields.Integer(description="Places of the result in the bucket"),
+})
+
+place_facets_model = ns.model("PlaceFacets", {
+    "*": fields.Wildcard(fields.List(fields.Nested(facet_bucket, skip_none=True))),
+})
+
+place_included_model = ns.model("PlaceIncluded", {
+    "owners": fields.List(fields.Nested(owner_inline)),
+    "amenities": fields.List(fields.Nested(amenity_inline)),
+})
+
+place_page_model = ns.model("PlacePage", {
+    "places": fields.List(fields.Nested(place_model)),
+    "total": fields.Integer(description="Places matching the filters, over all pages"),
+    "facets": fields.Nested(place_facets_model),
+    "included": fields.Nested(place_included_model, skip_none=True,
+                              description="Owners and amenities of the places, each once "
+                                          "(compound responses)"),
+})
+
+list_parser = reqparse.RequestParser()
+list_parser.add_argument("q", type=str, location="args",
+                         help="Full-text search over name and description, most relevant first")
+list_parser.add_argument("min_price", type=float, location="args", help="Minimum price per night")
+list_parser.add_argument("max_price", type=float, location="args", help="Maximum price per night")
+list_parser.add_argument("min_rating", type=float, location="args", help="Minimum average rating")
+list_parser.add_argument("amenities", type=str, location="args",
+                         help="Comma-separated amenity names or ids the places must offer")
+list_parser.add_argument("amenity_match", type=str, location="args", default="all",
+                         choices=("all", "any"), help="Require all of the amenities, or any")
+list_parser.add_argument("facets", type=str, location="args",
+                         help="Comma-separated facets to count ('amenities' or a range "
+                              "facet of PLACE_RANGE_FACETS such as 'price' or 'rating'); "
+                              "the response becomes {places, total, facets}")
+list_parser.add_argument("sort", type=str, location="args",
+                         choices=("price", "-price", "rating", "-rating", "top"),
+                         help="Sort field, '-' prefixed for descending, or 'top' for the best "
+                              "rated and most recent places first (default: creation order)")
+list_parser.add_argument("compound", type=inputs.boolean, location="args", default=False,
+                         help="Side-load expanded relations: places keep owner_id and "
+                              "amenity_ids, and the response becomes {places, included} "
+                              "with each owner and amenity listed once")
+list_parser.add_argument("near", type=str, location="args",
+                         help="'lat,lng': places within radius_km, nearest first")
+list_parser.add_argument("radius_km", type=float, location="args",
+                         help="Search radius for near (default GEO_RADIUS_DEFAULT_KM)")
+list_parser.add_argument("bbox", type=str, location="args",
+                         help="'west,south,east,north': places inside the box, nearest to its centre first")
+
+def add_projection_arguments(parser):
+    """Add the fields/expand query arguments to a parser."""
+    parser.add_argument("fields", type=str, location="args",
+                        help="Comma-separated place fields to return (default: all); "
+                             "only their columns are read")
+    parser.add_argument("expand", type=str, location="args",
+                        help="Comma-separated relations to embed: owner, amenities "
+                             "(default: both; empty for none)")
+    return parser
+
+add_projection_arguments(list_parser)
+add_page_arguments(list_parser)
+
+def geo_search(args, limit, expand):
+    """Answer a near/bbox search (one distance-ordered page, no cursor)."""
+    if args["near"] and args["bbox"]:
+        ns.abort(400, "near and bbox are mutually exclusive")
+    if args["cursor"]:
+        ns.abort(400, "cursor is not supported with near/bbox")
+    prices = {"min_price": args["min_price"], "max_price": args["max_price"]}
+    try:
+        if args["bbox"]:
+            return facade().list_places_in_bbox(parse_bbox(args["bbox"]), limit=limit,
+                                                expand=expand, **prices)
+        lat, lng = parse_point(args["near"])
+    except ValueError as e:
+        ns.abort(400, str(e))
+    radius = args["radius_km"]
+    if radius is None:
+        radius = current_app.config["GEO_RADIUS_DEFAULT_KM"]
+    maximum = current_app.config["GEO_RADIUS_MAX_KM"]
+    if not 0 < radius <= maximum:
+        ns.abort(400, f"radius_km must be in (0, {maximum}]")
+    return facade().list_places_near(lat, lng, radius, limit=limit, expand=expand, **prices)
+
+def split_list(value):
+    return [item.strip() for item in value.split(",") if item.strip()] if value else []
+
+def place_projection(args):
+    """
+    Validate the fields/expand arguments.
+
+    Returns (fields, expand, mask): the requested fields (None for all),
+    the relations to expand, and the field mask to encode places with.
+    The mask leaves out relations that are not expanded; in a compound
+    response it shows their id fields instead. Without ``fields``, an
+    X-Fields header mask selects them (with its nested masks).
+    """
+    relations = facade().PLACE_RELATIONS
+    wanted = split_list(args["fields"]) or None
+    nested = {}
+    header = header_mask() if wanted is None else None
+    if header:
+        parsed = parse_mask(header)
+        wanted = None if "*" in parsed else list(parsed)
+        nested = {name: str(sub) for name, sub in parsed.items() if isinstance(sub, Mask)}
+    expand = split_list(args["expand"]) if args["expand"] is not None else list(relations)
+    unknown = set(wanted or ()) - set(place_model)
+    if unknown:
+        ns.abort(400, f"unknown fields: {', '.join(sorted(unknown))}")
+    unknown = set(expand) - set(relations)
+    if unknown:
+        ns.abort(400, f"expand must be among: {', '.join(relations)}")
+    expand = [name for name in expand if wanted is None or name in wanted]
+    shown = []
+    for name in wanted or place_model:
+        if name in relations:
+            if name not in expand:
+                continue
+            if args.get("compound"):
+                name = relations[name]
+        name += nested.get(name, "")
+        if name not in shown:
+            shown.append(name)
+    return wanted, expand, ",".join(shown)
+
+def text_search(args, limit, expand):
+    """Answer a q= search (one relevance-ordered page, no cursor)."""
+    if args["near"] or args["bbox"] or args["sort"]:
+        ns.abort(400, "q cannot be combined with near, bbox or sort")
+    if args["cursor"]:
+        ns.abort(400, "cursor is not supported with q")
+    return facade().search_places(args["q"], min_price=args["min_price"],
+                                  max_price=args["max_price"],
+                                  min_rating=args["min_rating"], limit=limit, expand=expand)
+
 @ns.route("")
 class PlaceList(Resource):
-    @ns.marshal_list_with(place_model)
+    @ns.expect(list_parser)
+    @ns.response(200, "Places (a PlacePage when facets or compound are requested)", [place_model])
     def get(self):
-        return facade().list_places()
+        args = list_parser.parse_args()
+        after, limit = page_args(args, args["sort"])
+        wanted, expand, mask = place_projection(args)
+        amenities = split_list(args["amenities"])
+        facets = split_list(args["facets"])
+        known = facade().place_facet_names
+        if set(facets) - set(known):
+            ns.abort(400, f"facets must be among: {', '.join(known)}")
+        # Compound responses side-load relations instead of embedding them
+        embed = [] if args["compound"] else expand
+        if args["q"] is not None or args["near"] or args["bbox"]:
+            if amenities or facets:
+                ns.abort(400, "amenities and facets cannot be combined with q, near or bbox")
+            search = text_search if args["q"] is not None else geo_search
+            places, status, headers = search(args, limit, embed), 200, {}
+            body = {"places": places}
+        else:
+            amenity_ids = facade().resolve_amenities(amenities) if amenities else None
+            filters = {"min_price": args["min_price"], "max_price": args["max_price"],
+                       "min_rating": args["min_rating"], "amenity_ids": amenity_ids,
+                       "match_all": args["amenity_match"] == "all"}
+            places = facade().list_places(sort=args["sort"], after=after, limit=limit + 1,
+                                          fields=wanted, expand=embed, **filters)
+            places, status, headers = paged(places, limit, args["sort"],
+                                            field="score" if args["sort"] == "top" else None)
+            body = {"places": places}
+            if facets:
+                counts = facade().place_facets(facets=facets, **filters)
+                body.update(total=counts.pop("total"), facets=counts)
+        if args["compound"]:
+            body["included"] = facade().place_included(places, expand)
+        if len(body) == 1:
+            return serialize(places, place_model, mask, status, headers)
+        envelope = ",".join(f"places{{{mask}}}" if key == "places" else key for key in body)
+        return serialize(body, place_page_model, envelope, status, headers)
 
     @ns.expect(place_model, validate=True)
     @ns.marshal_with(place_model, code=201)
@@ -47,11 +246,137 @@ class PlaceList(Resource):
         payload['owner_id'] = current_user_id
         return facade().create_place(ns.payload), 201
 
+cards_parser = add_page_arguments(reqparse.RequestParser())
+
+@ns.route("/cards")
+class PlaceCards(Resource):
+    @ns.expect(cards_parser)
+    @serialize_list_with(ns, place_card_model)
+    def get(self):
+        """Place cards for listing pages, in creation order, without owners or amenities"""
+        after, limit = page_args(cards_parser.parse_args())
+        return paged(facade().list_place_cards(after=after, limit=limit + 1), limit)
+
+@ns.route("/export")
+class PlaceExport(Resource):
+    @jwt_required()
+    @ns.produces(["application/x-ndjson"])
+    def get(self):
+        """Stream all places as NDJSON (Admin only)"""
+        claims = get_jwt()
+        if not claims.get("is_admin", False):
+            ns.abort(403, "Admin privileges required")
+
+        return ndjson_response(facade().iter_places())
+
+price_percentiles_model = ns.model("PricePercentiles", {
+    "p25": fields.Float,
+    "p50": fields.Float,
+    "p75": fields.Float,
+    "p95": fields.Float,
+})
+
+price_bin_model = ns.model("PriceBin", {
+    "min": fields.Float,
+    "max": fields.Float,
+    "count": fields.Integer,
+})
+
+price_stats_model = ns.model("PriceStats", {
+    "count": fields.Integer(description="Places inside the box"),
+    "min": fields.Float,
+    "max": fields.Float,
+    "mean": fields.Float,
+    "percentiles": fields.Nested(price_percentiles_model),
+    "histogram": fields.List(fields.Nested(price_bin_model)),
+    "price_rank": fields.Float(description="Share of the places priced at or below price"),
+})
+
+price_stats_parser = reqparse.RequestParser()
+price_stats_parser.add_argument("bbox", type=str, location="args",
+                                help="'west,south,east,north' (default: every place)")
+price_stats_parser.add_argument("bins", type=int, location="args", default=10,
+                                help="Histogram bins (1-50)")
+price_stats_parser.add_argument("price", type=float, location="args",
+                                help="A price to rank against the others")
+
+@ns.route("/stats/price")
+class PlacePriceStats(Resource):
+    @ns.expect(price_stats_parser)
+    @ns.marshal_with(price_stats_model)
+    def get(self):
+        """Price distribution of the places in an area (percentiles within 1%)"""
+        args = price_stats_parser.parse_args()
+        if not 1 <= args["bins"] <= 50:
+            ns.abort(400, "bins must be between 1 and 50")
+        try:
+            bbox = parse_bbox(args["bbox"]) if args["bbox"] else None
+        except ValueError as e:
+            ns.abort(400, str(e))
+        return facade().place_price_stats(bbox, bins=args["bins"], price=args["price"])
+
+suggestion_model = ns.model("PlaceSuggestion", {
+    "id": fields.String,
+    "name": fields.String,
+    "review_count": fields.Integer,
+})
+
+suggest_parser = reqparse.RequestParser()
+suggest_parser.add_argument("prefix", type=str, location="args", required=True,
+                            help="Start of a word of the place name")
+suggest_parser.add_argument("limit", type=int, location="args", default=10,
+                            help="Number of suggestions (1-25)")
+
+@ns.route("/suggest")
+class PlaceSuggest(Resource):
+    @ns.expect(suggest_parser)
+    @serialize_list_with(ns, suggestion_model)
+    def get(self):
+        """Autocomplete place names, most reviewed first"""
+        args = suggest_parser.parse_args()
+        if not 1 <= args["limit"] <= 25:
+            ns.abort(400, "limit must be between 1 and 25")
+        return facade().suggest_places(args["prefix"], args["limit"])
+
+nearby_parser = reqparse.RequestParser()
+nearby_parser.add_argument("k", type=int, location="args", default=20,
+                           help="Number of neighbours (1-100)")
+
+@ns.route("/<string:place_id>/nearby")
+class PlaceNearby(Resource):
+    @ns.expect(nearby_parser)
+    @serialize_list_with(ns, place_model)
+    def get(self, place_id):
+        """The k places nearest to a place, nearest first"""
+        k = nearby_parser.parse_args()["k"]
+        if not 1 <= k <= 100:
+            ns.abort(400, "k must be between 1 and 100")
+        return facade().list_nearby_places(place_id, k)
+
+similar_parser = reqparse.RequestParser()
+similar_parser.add_argument("k", type=int, location="args", default=10,
+                            help="Number of places (1-50)")
+
+@ns.route("/<string:place_id>/similar")
+class PlaceSimilar(Resource):
+    @ns.expect(similar_parser)
+    @serialize_list_with(ns, place_model)
+    def get(self, place_id):
+        """The k places most alike in amenities, price and location"""
+        k = similar_parser.parse_args()["k"]
+        if not 1 <= k <= 50:
+            ns.abort(400, "k must be between 1 and 50")
+        return facade().list_similar_places(place_id, k)
+
+item_parser = add_projection_arguments(reqparse.RequestParser())
+
 @ns.route("/<string:place_id>")
 class PlaceItem(Resource):
-    @ns.marshal_with(place_model)
+    @ns.expect(item_parser)
+    @ns.response(200, "Place", place_model)
     def get(self, place_id):
-        return facade().get_place(place_id)
+        _, expand, mask = place_projection(item_parser.parse_args())
+        return serialize(facade().get_place(place_id, expand=expand), place_model, mask)
 
     @ns.expect(place_model, validate=True)
     @ns.marshal_with(place_model)
@@ -64,8 +389,7 @@ class PlaceItem(Resource):
 
         # Check ownership unless user is admin
         if not is_admin:
-            place = facade().get_place(place_id)
-            if place.owner_id != current_user_id:
+            if facade().get_place_owner_id(place_id) != current_user_id:
                 ns.abort(403, "Permission denied to update this place")
 
         return facade().update_place(place_id, ns.payload)
@@ -80,8 +404,7 @@ class PlaceItem(Resource):
 
         # Check ownership unless user is admin
         if not is_admin:
-            place = facade().get_place(place_id)
-            if place.owner_id != current_user_id:
+            if facade().get_place_owner_id(place_id) != current_user_id:
                 ns.abort(403, "Permission denied to delete this place")
 
         facade().delete_place(place_id)
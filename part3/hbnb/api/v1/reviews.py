@@ -1,6 +1,9 @@
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, reqparse
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from hbnb.api import facade
+from hbnb.api.pagination import add_page_arguments, page_args, paged
+from hbnb.api.serializers import serialize_list_with
+from hbnb.api.streaming import ndjson_response
 
 ns = Namespace("reviews", description="Review operations")
 
@@ -14,11 +17,15 @@ review_model = ns.model("Review", {
     "updated_at": fields.String(readonly=True),
 })
 
+list_parser = add_page_arguments(reqparse.RequestParser())
+
 @ns.route("")
 class ReviewList(Resource):
-    @ns.marshal_list_with(review_model)
+    @ns.expect(list_parser)
+    @serialize_list_with(ns, review_model)
     def get(self):
-        return facade().list_reviews()
+        after, limit = page_args(list_parser.parse_args())
+        return paged(facade().list_reviews(after=after, limit=limit + 1), limit)
 
     @ns.expect(review_model, validate=True)
     @ns.marshal_with(review_model, code=201)
@@ -28,8 +35,7 @@ class ReviewList(Resource):
         current_user_id = get_jwt_identity()
         payload = ns.payload
         payload['user_id'] = current_user_id
-        place = facade().get_place(payload['place_id'])
-        if place.get('owner_id') == current_user_id:
+        if facade().get_place_owner_id(payload['place_id']) == current_user_id:
             ns.abort(403, "Owners cannot review their own places")
             existing_reviews = facade().list_reviews_for_place(payload['place_id'])
             for review in existing_reviews:
@@ -37,6 +43,18 @@ class ReviewList(Resource):
                     ns.abort(403, "User has already reviewed this place")
         return facade().create_review(ns.payload), 201
 
+@ns.route("/export")
+class ReviewExport(Resource):
+    @jwt_required()
+    @ns.produces(["application/x-ndjson"])
+    def get(self):
+        """Stream all reviews as NDJSON (Admin only)"""
+        claims = get_jwt()
+        if not claims.get("is_admin", False):
+            ns.abort(403, "Admin privileges required")
+
+        return ndjson_response(facade().iter_reviews())
+
 @ns.route("/<string:review_id>")
 class ReviewItem(Resource):
     @ns.marshal_with(review_model)
@@ -78,6 +96,6 @@ class ReviewItem(Resource):
 
 @ns.route("/place/<string:place_id>")
 class PlaceReviews(Resource):
-    @ns.marshal_list_with(review_model)
+    @serialize_list_with(ns, review_model)
     def get(self, place_id):
         return facade().list_reviews_for_place(place_id)
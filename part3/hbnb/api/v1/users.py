@@ -1,6 +1,9 @@
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, reqparse
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from hbnb.api import facade
+from hbnb.api.pagination import add_page_arguments, page_args, paged
+from hbnb.api.serializers import serialize_list_with
+from hbnb.api.streaming import ndjson_response
 
 ns = Namespace("users", description="User operations")
 
@@ -37,12 +40,16 @@ admin_user_update_model = ns.model("AdminUserUpdate", {
     "last_name": fields.String(description="User last name"),
 })
 
+list_parser = add_page_arguments(reqparse.RequestParser())
+
 @ns.route("")
 class UserList(Resource):
-    @ns.marshal_list_with(user_response)
+    @ns.expect(list_parser)
+    @serialize_list_with(ns, user_response)
     def get(self):
         """List all users (passwords excluded)"""
-        return facade().list_users()
+        after, limit = page_args(list_parser.parse_args())
+        return paged(facade().list_users(after=after, limit=limit + 1), limit)
 
     @ns.expect(user_model, validate=True)
     @ns.marshal_with(user_response, code=201)
@@ -59,6 +66,18 @@ class UserList(Resource):
         return facade().create_user(payload), 201
 
 
+@ns.route("/export")
+class UserExport(Resource):
+    @jwt_required()
+    @ns.produces(["application/x-ndjson"])
+    def get(self):
+        """Stream all users (passwords excluded) as NDJSON (Admin only)"""
+        claims = get_jwt()
+        if not claims.get("is_admin", False):
+            ns.abort(403, "Admin privileges required")
+
+        return ndjson_response(facade().iter_users())
+
 @ns.route("/<string:user_id>")
 class UserItem(Resource):
     @ns.marshal_with(user_response)
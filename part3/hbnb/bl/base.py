@@ -1,9 +1,8 @@
 from __future__ import annotations
 import uuid
 from datetime import datetime
-from sqlalchemy import String, DateTime, Table, Column, ForeignKey
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy.sql import func
+from sqlalchemy import String, DateTime, Table, Column, ForeignKey, Index
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, declared_attr
 
 ISO = "%Y-%m-%dT%H:%M:%S.%fZ"
 
@@ -32,6 +31,11 @@ class BaseModel(Base):
     """
     __abstract__ = True  # Don't create a table for BaseModel itself
 
+    @declared_attr.directive
+    def __table_args__(cls):
+        # Composite (created_at, id) index backing keyset pagination
+        return (Index(f"ix_{cls.__tablename__}_created_at_id", "created_at", "id"),)
+
     # Primary key
     id: Mapped[str] = mapped_column(
         String(60),
@@ -39,17 +43,20 @@ class BaseModel(Base):
         default=lambda: str(uuid.uuid4())
     )
 
-    # Timestamps
+    # Timestamps (both are set client-side so every row carries the same
+    # microsecond precision; keyset cursors compare on created_at exactly.
+    # Rows written by the former server default are normalised by
+    # hbnb.persistence.migrations.upgrade_schema)
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=func.now(),
+        default=datetime.utcnow,
         nullable=False
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=func.now(),
-        onupdate=func.now(),
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
         nullable=False
     )
 
@@ -65,6 +72,21 @@ class BaseModel(Base):
                 result[column.name] = value
         return result
 
+    @classmethod
+    def column_attribute(cls, name: str) -> str:
+        """Name of the mapped attribute storing the table column ``name``."""
+        try:
+            column = cls.__table__.c[name]
+        except KeyError:
+            raise ValueError(f"{cls.__name__} has no column {name!r}") from None
+        return cls.__mapper__.get_property_by_column(column).key
+
+    @classmethod
+    def row_to_dict(cls, row: dict) -> dict:
+        """to_dict() of a partial row of stored column values (see repository rows())"""
+        return {name: value.strftime(ISO) if isinstance(value, datetime) else value
+                for name, value in row.items()}
+
     def touch(self) -> None:
         """Update the updated_at timestamp"""
         self.updated_at = datetime.utcnow()
@@ -1,5 +1,5 @@
-from typing import List, TYPE_CHECKING
-from sqlalchemy import String, Float, ForeignKey, Text
+from typing import Dict, List, TYPE_CHECKING
+from sqlalchemy import String, Float, ForeignKey, Text, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .base import BaseModel, place_amenity
 import json
@@ -9,6 +9,9 @@ if TYPE_CHECKING:
     from .review import Review
     from .amenity import Amenity
 
+# Possible review ratings; one histogram column per value
+STARS = range(0, 6)
+
 
 class Place(BaseModel):
     """
@@ -24,15 +27,36 @@ class Place(BaseModel):
         owner: User who owns this place (many-to-one)
         reviews: List of reviews for this place (one-to-many)
         amenities: List of amenities for this place (many-to-many)
+        review_count: Number of reviews (maintained by the facade)
+        rating_sum: Sum of review ratings (maintained by the facade)
+        rating_count_0..rating_count_5: Reviews per rating value
+        rating: Average rating, 0 when there are no reviews
     """
     __tablename__ = 'places'
+    __table_args__ = (
+        Index("ix_places_created_at_id", "created_at", "id"),
+        # Bounding-box prefilter where no R*Tree is available (MySQL)
+        Index("ix_places_latitude_longitude", "latitude", "longitude"),
+    )
 
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=True)
-    price: Mapped[float] = mapped_column(Float, nullable=False)
+    price: Mapped[float] = mapped_column(Float, nullable=False, index=True)
     latitude: Mapped[float] = mapped_column(Float, nullable=False)
     longitude: Mapped[float] = mapped_column(Float, nullable=False)
-    owner_id: Mapped[str] = mapped_column(String(60), ForeignKey('users.id'), nullable=False)
+    owner_id: Mapped[str] = mapped_column(String(60), ForeignKey('users.id'), nullable=False, index=True)
+
+    # Review aggregates, updated in place as reviews change so readers
+    # never have to load review rows
+    review_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating_count_0: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating_count_1: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating_count_2: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating_count_3: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating_count_4: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating_count_5: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating: Mapped[float] = mapped_column(Float, default=0.0, nullable=False, index=True)
 
     # Relationships
     owner: Mapped["User"] = relationship("User", back_populates="places")
@@ -65,6 +89,28 @@ class Place(BaseModel):
         self.longitude = longitude
         self.owner_id = owner_id
         self.amenity_ids = amenity_ids or []
+        self.review_count = 0
+        self.rating_sum = 0
+        for star in STARS:
+            setattr(self, f"rating_count_{star}", 0)
+        self.rating = 0.0
+
+    # rating = rating_sum / review_count, kept in step by increment()
+    RATING_AVERAGE = {"rating": ("rating_sum", "review_count")}
+
+    @staticmethod
+    def rating_deltas(rating: int, sign: int) -> Dict[str, int]:
+        """Aggregate changes for adding (sign=1) or removing (sign=-1) a rating."""
+        return {
+            "review_count": sign,
+            "rating_sum": sign * rating,
+            f"rating_count_{rating}": sign,
+        }
+
+    @property
+    def rating_histogram(self) -> List[int]:
+        """Number of reviews per rating value, index 0 to 5."""
+        return [getattr(self, f"rating_count_{star}") for star in STARS]
 
     @property
     def amenity_ids(self) -> List[str]:
@@ -79,6 +125,13 @@ class Place(BaseModel):
         """Set amenity_ids to JSON storage"""
         self._amenity_ids_json = json.dumps(value if value else [])
 
+    @classmethod
+    def row_to_dict(cls, row: dict) -> dict:
+        d = super().row_to_dict(row)
+        if "amenity_ids" in d:
+            d["amenity_ids"] = json.loads(d["amenity_ids"]) if d["amenity_ids"] else []
+        return d
+
     def validate(self) -> None:
         """Validate place data"""
         if not self.name:
@@ -23,8 +23,8 @@ class Review(BaseModel):
     __tablename__ = 'reviews'
 
     text: Mapped[str] = mapped_column(Text, nullable=False)
-    user_id: Mapped[str] = mapped_column(String(60), ForeignKey('users.id'), nullable=False)
-    place_id: Mapped[str] = mapped_column(String(60), ForeignKey('places.id'), nullable=False)
+    user_id: Mapped[str] = mapped_column(String(60), ForeignKey('users.id'), nullable=False, index=True)
+    place_id: Mapped[str] = mapped_column(String(60), ForeignKey('places.id'), nullable=False, index=True)
     rating: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
     # Relationships
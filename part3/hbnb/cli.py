@@ -0,0 +1,33 @@
+"""
+Flask CLI commands (``flask --app app index rebuild``, ``flask --app app db upgrade``).
+"""
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from hbnb.persistence.migrations import RATING_COLUMN, upgrade_schema
+
+index_cli = AppGroup("index", help="Maintain the search indexes.")
+
+
+@index_cli.command("rebuild")
+def rebuild_indexes():
+    """Re-index every place for full-text search (after bulk loads or a VACUUM)."""
+    count = current_app.config["FACADE"].rebuild_search_index()
+    click.echo(f"Indexed {count} places for full-text search")
+
+
+db_cli = AppGroup("db", help="Maintain the database schema.")
+
+
+@db_cli.command("upgrade")
+def upgrade_database():
+    """Upgrade existing tables in place (also run at startup)."""
+    engine = current_app.extensions["sqlalchemy"].engine
+    with engine.begin() as connection:
+        created = upgrade_schema(connection)
+    for table, names in created.items():
+        click.echo(f"{table}: added {', '.join(names)}")
+    if RATING_COLUMN in created.get("places", ()):
+        count = current_app.config["FACADE"].recompute_place_ratings()
+        click.echo(f"Recomputed the rating aggregates of {count} places")
+    click.echo("Database schema is up to date")
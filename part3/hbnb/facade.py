@@ -1,13 +1,31 @@
 from __future__ import annotations
-from typing import Dict, Any, List, Union
+import heapq
+from datetime import datetime
+from functools import wraps
+from itertools import islice
+from typing import Dict, Any, Iterator, List, Set, Tuple, Union
 from .persistence.memory_repo import MemoryRepository
-from .persistence.sqlalchemy_repo import SQLAlchemyRepository
+from .persistence.sqlalchemy_repo import SQLAlchemyRepository, IN_CHUNK_SIZE, chunked
 from .persistence.user_repository import UserRepository
+from .persistence.query import QuerySpec
 from .bl.user import User
 from .bl.amenity import Amenity
-from .bl.place import Place
+from .bl.place import Place, STARS
 from .bl.review import Review
+from .bl.base import ISO
 from .errors import NotFound, BadRequest
+from .geo import BBox, bbox_around, bbox_center, haversine_km
+from .indexes import (PlaceIndexes, PlaceKDTree, PlaceSuggester, PlaceAmenityIndex, PlaceCards,
+                      PlaceColumns, PlacePriceSketches, PlaceScores, PlaceSimilarity)
+
+
+def transactional(method):
+    """Run a facade write method inside a single repository unit of work."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.repo.unit_of_work():
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class HbnbFacade:
@@ -17,17 +35,60 @@ class HbnbFacade:
     Supports both in-memory and SQLAlchemy repositories.
     """
 
-    def __init__(self, repo: Union[MemoryRepository, SQLAlchemyRepository, UserRepository, None] = None):
+    def __init__(self, repo: Union[MemoryRepository, SQLAlchemyRepository, UserRepository, None] = None,
+                 index_max_age: float | None = None,
+                 range_facets: Dict[str, Tuple[str, List[float]]] | None = None):
         """
         Initialize the facade with a repository.
 
         Args:
             repo: Repository instance (MemoryRepository, SQLAlchemyRepository, or UserRepository).
                   Defaults to MemoryRepository if None.
+            index_max_age: Seconds after which in-process place indexes are
+                  rebuilt from the repository (None: only follow this
+                  facade's writes)
+            range_facets: Range facets of the places list, as facet name ->
+                  (place field, bucket edges); defaults to price and rating bands
         """
         self.repo = repo or MemoryRepository()
+        self.indexes = PlaceIndexes(self._place_records, max_age=index_max_age)
+        self.indexes.register(PlaceKDTree())
+        self.indexes.register(PlaceSuggester())
+        amenity_index = self.indexes.register(PlaceAmenityIndex(range_facets))
+        # Facets place_facets can count: amenities, then the range facets
+        self.place_facet_names = ("amenities",) + tuple(amenity_index.ranges)
+        self.indexes.register(PlaceColumns())
+        self.indexes.register(PlacePriceSketches())
+        self.indexes.register(PlaceScores())
+        self.indexes.register(PlaceSimilarity())
+        self.indexes.register(PlaceCards())
+
+    def _place_records(self) -> Iterator[Dict[str, Any]]:
+        """Every place as a plain record, for building place indexes."""
+        for place in self.repo.stream(Place):
+            yield place.to_dict()
+
+    def _place_saved(self, place: Place) -> None:
+        """Update the place indexes once the current write commits."""
+        record = place.to_dict()
+        self.repo.on_commit(lambda: self.indexes.saved(record))
+
+    @staticmethod
+    def _paged(query: QuerySpec | None, after, limit: int | None) -> QuerySpec | None:
+        """
+        Add keyset pagination to a spec.
+
+        Pages are ordered by (created_at, id); ``after`` is the seek key of
+        the last row already returned, so every page costs the same
+        regardless of depth. Without after/limit the spec is unchanged.
+        """
+        if after is None and limit is None:
+            return query
+        query = query or QuerySpec()
+        return query.order_by("created_at", "id").seek_after(after).limit(limit)
 
     # ===== Users =====
+    @transactional
     def create_user(self, user_data: dict):
         """Create a new user with hashed password"""
         from hbnb.bl.user import User
@@ -48,20 +109,25 @@ class HbnbFacade:
 
     def get_user_by_email(self, email: str) -> User | None:
         """Get user by email address - returns User object (for authentication)"""
-        # Use UserRepository's specialized method if available
-        if isinstance(self.repo, UserRepository):
+        # Use UserRepository's specialized method if available (also
+        # through a CachedRepository wrapping one)
+        if hasattr(self.repo, "get_by_email"):
             return self.repo.get_by_email(email)
 
-        # Fallback for MemoryRepository
-        users = self.repo.list(User)
-        for user in users:
-            if user.email == email:
-                return user  # Return User object, not dict
-        return None
+        # Fallback for other repositories
+        users = self.repo.list(User, query=QuerySpec(email=email).limit(1))
+        return users[0] if users else None  # Return User object, not dict
 
-    def list_users(self) -> List[Dict[str, Any]]:
-        return [self._user_public(u) for u in self.repo.list(User)]
+    def list_users(self, after=None, limit: int | None = None) -> List[Dict[str, Any]]:
+        users = self.repo.list(User, query=self._paged(None, after, limit))
+        return [self._user_public(u) for u in users]
 
+    def iter_users(self) -> Iterator[Dict[str, Any]]:
+        """Stream every user (password excluded) in constant memory."""
+        for user in self.repo.stream(User):
+            yield self._user_public(user)
+
+    @transactional
     def update_user(self, user_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         user = self.repo.get(User, user_id)
         if not user:
@@ -88,6 +154,7 @@ class HbnbFacade:
         return d
 
     # ===== Amenities =====
+    @transactional
     def create_amenity(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         amenity = Amenity(**payload)
         amenity.validate()
@@ -100,9 +167,11 @@ class HbnbFacade:
             raise NotFound()
         return a.to_dict()
 
-    def list_amenities(self) -> List[Dict[str, Any]]:
-        return [a.to_dict() for a in self.repo.list(Amenity)]
+    def list_amenities(self, after=None, limit: int | None = None) -> List[Dict[str, Any]]:
+        amenities = self.repo.list(Amenity, query=self._paged(None, after, limit))
+        return [a.to_dict() for a in amenities]
 
+    @transactional
     def update_amenity(self, amenity_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         a = self.repo.get(Amenity, amenity_id)
         if not a:
@@ -117,43 +186,365 @@ class HbnbFacade:
         return a.to_dict()
 
     # ===== Places =====
+    @transactional
     def create_place(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        # Ensure owner exists
-        owner_id = payload.get("owner_id")
-        if not self.repo.get(User, owner_id):
-            raise BadRequest("owner_id must reference an existing User")
-
-        # Ensure amenities exist
-        for aid in payload.get("amenity_ids", []) or []:
-            if not self.repo.get(Amenity, aid):
-                raise BadRequest("amenity_ids must reference existing Amenities")
+        # Ensure owner and amenities exist
+        self._require_ids(User, [payload.get("owner_id")],
+                          "owner_id must reference an existing User")
+        self._require_ids(Amenity, payload.get("amenity_ids", []) or [],
+                          "amenity_ids must reference existing Amenities")
 
         place = Place(**payload)
         place.validate()
         self.repo.add(place)
+        self._place_saved(place)
         return self._place_expanded(place)
 
-    def get_place(self, place_id: str) -> Dict[str, Any]:
+    def get_place(self, place_id: str, expand: List[str] | None = None) -> Dict[str, Any]:
+        """A place with the relations in ``expand`` (by default all) embedded."""
+        _, expand = self._place_projection(None, expand)
         p = self.repo.get(Place, place_id)
         if not p:
             raise NotFound()
-        return self._place_expanded(p)
+        return self._places_expanded([p], expand)[0]
+
+    def get_place_owner_id(self, place_id: str) -> str:
+        """Owner of a place, for permission checks (no expansion)."""
+        p = self.repo.get(Place, place_id)
+        if not p:
+            raise NotFound()
+        return p.owner_id
+
+    # Sort orders accepted by list_places ("-" for descending; "top" is
+    # the best-first ranking of the score index)
+    PLACE_SORTS = ("price", "-price", "rating", "-rating", "top")
+
+    # Amenity matches up to this size are passed to the query as an id
+    # list; larger (hence denser) ones filter the ordered rows instead
+    AMENITY_IN_MAX = 2000
+
+    # Relations a place can be expanded with, and the column holding their ids
+    PLACE_RELATIONS = {"owner": "owner_id", "amenities": "amenity_ids"}
+
+    # Place fields computed rather than stored, and the columns they are computed from
+    PLACE_DERIVED = {
+        "rating_histogram": tuple(f"rating_count_{star}" for star in STARS),
+        "distance_km": (), "score": (), "similarity": (),
+    }
+
+    def list_places(self, min_price: float | None = None, max_price: float | None = None,
+                    after=None, limit: int | None = None, min_rating: float | None = None,
+                    sort: str | None = None, amenity_ids: List[str] | None = None,
+                    match_all: bool = True, fields: List[str] | None = None,
+                    expand: List[str] | None = None) -> List[Dict[str, Any]]:
+        """
+        List places, optionally filtered by price, average rating and amenities.
+
+        With ``sort``, pages are ordered by (sort field, id) and ``after``
+        is the (value, id) of the last row already returned; otherwise the
+        default (created_at, id) keyset order applies. ``sort="top"``
+        pages through the score index instead, best first, each place
+        carrying its ``score``.
+
+        ``amenity_ids`` keeps places offering all of them (any of them
+        unless ``match_all``), as answered by the amenity bitmap index.
+
+        ``fields`` limits the place fields needed: only their columns (plus
+        the id and sort key) are read from the repository. ``expand`` lists
+        the relations (PLACE_RELATIONS) to embed, by default all of them;
+        a relation outside ``fields`` is never loaded.
+        """
+        columns, expand = self._place_projection(fields, expand, sort)
+        if sort == "top":
+            return self._top_places(after, limit, amenity_ids=amenity_ids, match_all=match_all,
+                                    min_price=min_price, max_price=max_price,
+                                    min_rating=min_rating, columns=columns, expand=expand)
+        query = None
+        if min_price is not None or max_price is not None or min_rating is not None:
+            query = QuerySpec().between("price", min_price, max_price)
+            query.between("rating", min_rating, None)
+        if sort is None:
+            query = self._paged(query, after, limit)
+        elif sort not in self.PLACE_SORTS:
+            raise BadRequest(f"sort must be one of {', '.join(self.PLACE_SORTS)}")
+        else:
+            tie = "-id" if sort.startswith("-") else "id"
+            query = (query or QuerySpec()).order_by(sort, tie).seek_after(after).limit(limit)
+        if amenity_ids is None:
+            return self._records_expanded(list(self._select_places(query, columns)), expand)
+
+        index = self.indexes.get(PlaceAmenityIndex.name)
+        result = index.select(amenity_ids, match_all, min_price=min_price,
+                              max_price=max_price, min_rating=min_rating)
+        query = query or QuerySpec()
+        if not result:
+            places = []
+        elif len(result) <= self.AMENITY_IN_MAX:
+            places = list(self._select_places(query.where_in("id", index.ids(result)), columns))
+        else:
+            rows = (p for p in self._select_places(query.limit(None), columns, stream=True)
+                    if index.contains(result, p["id"]))
+            places = list(islice(rows, limit)) if limit is not None else list(rows)
+        return self._records_expanded(places, expand)
+
+    def _place_projection(self, fields: List[str] | None, expand: List[str] | None,
+                          sort: str | None = None) -> Tuple[List[str] | None, Set[str]]:
+        """
+        Columns to read and relations to expand for the place ``fields``
+        of a listing; columns are None when every field is wanted. The id
+        and the sort key are always read, for cursors.
+        """
+        expand = set(self.PLACE_RELATIONS if expand is None else expand)
+        unknown = expand - set(self.PLACE_RELATIONS)
+        if unknown:
+            raise BadRequest(f"cannot expand: {', '.join(sorted(unknown))}")
+        if fields is None:
+            return None, expand
+        columns = {"id", "created_at" if sort in (None, "top") else sort.lstrip("-")}
+        for field in fields:
+            if field in self.PLACE_RELATIONS:
+                columns.add(self.PLACE_RELATIONS[field])
+            elif field in self.PLACE_DERIVED:
+                columns.update(self.PLACE_DERIVED[field])
+            elif field in Place.__table__.c:
+                columns.add(field)
+            else:
+                raise BadRequest(f"unknown place field: {field}")
+        return sorted(columns), expand & set(fields)
+
+    def _select_places(self, query: QuerySpec | None, columns: List[str] | None,
+                       stream: bool = False) -> Iterator[Dict[str, Any]]:
+        """Records of the places matching ``query``: whole rows, or just ``columns``."""
+        if columns is not None:
+            return (Place.row_to_dict(row) for row in self.repo.rows(Place, columns, query))
+        places = self.repo.stream(Place, query=query) if stream else self.repo.list(Place, query=query)
+        return (place.to_dict() for place in places)
+
+    def _places_by_id(self, place_ids: List[str],
+                      columns: List[str] | None) -> Dict[str, Dict[str, Any]]:
+        """Records of the places with these ids, keyed by id."""
+        if columns is None:
+            return {place_id: place.to_dict()
+                    for place_id, place in self.repo.get_many(Place, place_ids).items()}
+        found = {}
+        for chunk in chunked(place_ids, IN_CHUNK_SIZE):
+            found.update((record["id"], record)
+                         for record in self._select_places(QuerySpec().where_in("id", chunk), columns))
+        return found
+
+    def _top_places(self, after, limit: int | None, amenity_ids: List[str] | None = None,
+                    match_all: bool = True, min_price: float | None = None,
+                    max_price: float | None = None, min_rating: float | None = None,
+                    columns: List[str] | None = None,
+                    expand: Set[str] | None = None) -> List[Dict[str, Any]]:
+        """
+        Places best first from the score index; filters are applied while
+        walking the ranking, with the amenity bitmap index.
+        """
+        scores = self.indexes.get(PlaceScores.name)
+        if amenity_ids is None and min_price is None and max_price is None and min_rating is None:
+            ranked = scores.top(limit, after) if limit is not None else list(scores.iter_top(after))
+        else:
+            index = self.indexes.get(PlaceAmenityIndex.name)
+            result = index.select(amenity_ids, match_all, min_price=min_price,
+                                  max_price=max_price, min_rating=min_rating)
+            matches = (pair for pair in scores.iter_top(after) if index.contains(result, pair[0]))
+            ranked = list(islice(matches, limit)) if limit is not None else list(matches)
+        found = self._places_by_id([place_id for place_id, _ in ranked], columns)
+        ranked = [(found[place_id], score) for place_id, score in ranked if place_id in found]
+        places = self._records_expanded([place for place, _ in ranked], expand)
+        for place, (_, score) in zip(places, ranked):
+            place["score"] = score
+        return places
+
+    def list_place_cards(self, after=None, limit: int | None = None) -> List[Dict[str, Any]]:
+        """
+        Place cards (id, name, price, created_at and rating aggregates) in
+        the default (created_at, id) order of list_places, served from the
+        card projection without reading or expanding place rows.
+        """
+        if after is not None:
+            created_at, place_id = after
+            after = (created_at.strftime(ISO) if isinstance(created_at, datetime) else created_at,
+                     place_id)
+        return self.indexes.get(PlaceCards.name).page(limit, after)
+
+    def place_facets(self, amenity_ids: List[str] | None = None, match_all: bool = True,
+                     min_price: float | None = None, max_price: float | None = None,
+                     min_rating: float | None = None,
+                     facets: List[str] | None = None) -> Dict[str, Any]:
+        """
+        Size of a list_places result and its facet counts, all from one
+        bitmap of the amenity index (no place rows are read).
+
+        Args:
+            facets: Facets to count (default: all of place_facet_names)
 
-    def list_places(self) -> List[Dict[str, Any]]:
-        return [self._place_expanded(p) for p in self.repo.list(Place)]
+        Returns:
+            ``{"total": n, "amenities": [{"id", "name", "count"}, ...],
+            <range facet>: [{"key", "min", "max", "count"}, ...]}``, most
+            common amenity first and buckets in range order
+        """
+        facets = self.place_facet_names if facets is None else facets
+        unknown = set(facets) - set(self.place_facet_names)
+        if unknown:
+            raise BadRequest(f"unknown facets: {', '.join(sorted(unknown))}")
+        index = self.indexes.get(PlaceAmenityIndex.name)
+        result = index.select(amenity_ids, match_all, min_price=min_price,
+                              max_price=max_price, min_rating=min_rating)
+        body: Dict[str, Any] = {"total": len(result)}
+        if "amenities" in facets:
+            counts = index.facets(result)
+            names = self.repo.get_many(Amenity, counts) if counts else {}
+            amenities = [{"id": a, "name": names[a].name, "count": n}
+                         for a, n in counts.items() if a in names]
+            amenities.sort(key=lambda f: (-f["count"], f["name"]))
+            body["amenities"] = amenities
+        body.update(index.range_facets(result, [f for f in facets if f != "amenities"]))
+        return body
+
+    def resolve_amenities(self, keys: List[str]) -> List[str]:
+        """
+        Amenity ids for a list of amenity names (case-insensitive) or ids.
 
+        Raises:
+            BadRequest: if a key is neither
+        """
+        by_name = {a.name.lower(): a.id for a in self.repo.stream(Amenity)}
+        ids = [by_name.get(key.lower(), key) for key in keys]
+        unknown = {key for key, amenity_id in zip(keys, ids) if amenity_id == key}
+        unknown -= self.repo.exists_many(Amenity, unknown) if unknown else set()
+        if unknown:
+            raise BadRequest(f"unknown amenities: {', '.join(sorted(unknown))}")
+        return ids
+
+    def list_places_near(self, lat: float, lng: float, radius_km: float,
+                         min_price: float | None = None, max_price: float | None = None,
+                         limit: int | None = None,
+                         expand: List[str] | None = None) -> List[Dict[str, Any]]:
+        """
+        Places within ``radius_km`` of a point, nearest first.
+
+        Each place carries its ``distance_km``.
+        """
+        query = QuerySpec().between("price", min_price, max_price)
+        query.within(bbox_around(lat, lng, radius_km))
+        return self._places_by_distance(query, lat, lng, radius_km, limit, expand)
+
+    def list_places_in_bbox(self, bbox: BBox, min_price: float | None = None,
+                            max_price: float | None = None,
+                            limit: int | None = None,
+                            expand: List[str] | None = None) -> List[Dict[str, Any]]:
+        """Places inside ``(south, west, north, east)``, nearest to its centre first."""
+        query = QuerySpec().between("price", min_price, max_price).within(bbox)
+        lat, lng = bbox_center(bbox)
+        return self._places_by_distance(query, lat, lng, None, limit, expand)
+
+    def search_places(self, q: str, min_price: float | None = None,
+                      max_price: float | None = None, min_rating: float | None = None,
+                      limit: int | None = None,
+                      expand: List[str] | None = None) -> List[Dict[str, Any]]:
+        """
+        Places whose name or description contains every word of ``q``,
+        most relevant first (BM25, name matches weigh more).
+        """
+        _, expand = self._place_projection(None, expand)
+        query = QuerySpec().between("price", min_price, max_price)
+        query.between("rating", min_rating, None)
+        hits = self.repo.search(Place, q, query=query, limit=limit)
+        return self._places_expanded([place for place, _ in hits], expand)
+
+    @transactional
+    def rebuild_search_index(self) -> int:
+        """Re-index every place for full-text search; returns the place count."""
+        return self.repo.rebuild_text_index(Place)
+
+    def _places_by_distance(self, query: QuerySpec, lat: float, lng: float,
+                            radius_km: float | None, limit: int | None,
+                            expand: List[str] | None = None) -> List[Dict[str, Any]]:
+        # The spatial index narrows rows to the box; only (id, lat, lng) is
+        # read for those, and just the nearest ``limit`` are loaded in full.
+        scored: List[Tuple[float, str]] = []
+        for place_id, place_lat, place_lng in self.repo.locate(Place, query):
+            distance = haversine_km(lat, lng, place_lat, place_lng)
+            if radius_km is None or distance <= radius_km:
+                scored.append((distance, place_id))
+        nearest = heapq.nsmallest(limit, scored) if limit is not None else sorted(scored)
+        _, expand = self._place_projection(None, expand)
+        return self._places_with_distance(nearest, expand)
+
+    def _places_with_distance(self, nearest: List[Tuple[float, str]],
+                              expand: Set[str] | None = None) -> List[Dict[str, Any]]:
+        """Expand ``(distance_km, place_id)`` pairs in order, adding ``distance_km``."""
+        places = self.repo.get_many(Place, [place_id for _, place_id in nearest])
+        result = self._places_expanded([places[i] for _, i in nearest if i in places], expand)
+        distances = {place_id: distance for distance, place_id in nearest}
+        for d in result:
+            d["distance_km"] = round(distances[d["id"]], 3)
+        return result
+
+    def list_nearby_places(self, place_id: str, k: int = 20) -> List[Dict[str, Any]]:
+        """The ``k`` places nearest to a place (itself excluded), nearest first."""
+        p = self.repo.get(Place, place_id)
+        if not p:
+            raise NotFound()
+        tree = self.indexes.get(PlaceKDTree.name)
+        return self._places_with_distance(tree.nearest(p.latitude, p.longitude, k, exclude=[place_id]))
+
+    def list_similar_places(self, place_id: str, k: int = 10) -> List[Dict[str, Any]]:
+        """
+        The ``k`` places most alike in amenities, price and location, most
+        similar first; each place carries its ``similarity`` (cosine).
+        """
+        if not self.repo.exists_many(Place, [place_id]):
+            raise NotFound()
+        ranked = self.indexes.get(PlaceSimilarity.name).similar(place_id, k)
+        found = self.repo.get_many(Place, [other_id for other_id, _ in ranked])
+        ranked = [(found[other_id], similarity) for other_id, similarity in ranked
+                  if other_id in found]
+        places = self._places_expanded([place for place, _ in ranked])
+        for place, (_, similarity) in zip(places, ranked):
+            place["similarity"] = similarity
+        return places
+
+    def suggest_places(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Places with a name word starting with ``prefix``, most reviewed first."""
+        return self.indexes.get(PlaceSuggester.name).suggest(prefix, limit)
+
+    def iter_places(self, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every expanded place in constant memory.
+
+        Places are read in keyset pages rather than through one open
+        streaming cursor, because expanding each batch issues owner and
+        amenity queries on the same connection (which MySQL's unbuffered
+        cursors do not allow mid-stream).
+        """
+        after = None
+        while True:
+            batch = self.repo.list(Place, query=self._paged(None, after, batch_size))
+            if not batch:
+                return
+            yield from self._places_expanded(batch)
+            after = (batch[-1].created_at, batch[-1].id)
+
+    def list_places_by_owner(self, owner_id: str) -> List[Dict[str, Any]]:
+        places = self.repo.list(Place, query=QuerySpec(owner_id=owner_id))
+        return self._places_expanded(places)
+
+    @transactional
     def update_place(self, place_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         p = self.repo.get(Place, place_id)
         if not p:
             raise NotFound()
 
-        if "owner_id" in payload and not self.repo.get(User, payload["owner_id"]):
-            raise BadRequest("owner_id must reference an existing User")
+        if "owner_id" in payload:
+            self._require_ids(User, [payload["owner_id"]],
+                              "owner_id must reference an existing User")
 
         if "amenity_ids" in payload:
-            for aid in payload["amenity_ids"] or []:
-                if not self.repo.get(Amenity, aid):
-                    raise BadRequest("amenity_ids must reference existing Amenities")
+            self._require_ids(Amenity, payload["amenity_ids"] or [],
+                              "amenity_ids must reference existing Amenities")
 
         for k, v in payload.items():
             if k == "id":
@@ -162,34 +553,207 @@ class HbnbFacade:
         p.validate()
         p.touch()
         self.repo.update(p)
+        self._place_saved(p)
         return self._place_expanded(p)
 
+    @transactional
+    def delete_place(self, place_id: str) -> None:
+        if not self.repo.get(Place, place_id):
+            raise NotFound()
+        self.repo.delete(Place, place_id)
+        self.repo.on_commit(lambda: self.indexes.deleted(place_id))
+
     def _place_expanded(self, place: Place) -> Dict[str, Any]:
-        d = place.to_dict()
-        owner = self.repo.get(User, place.owner_id)
-        d["owner"] = None if not owner else {
-            "id": owner.id,
-            "first_name": owner.first_name,
-            "last_name": owner.last_name,
-            "email": owner.email,
-        }
-        d["amenities"] = [
-            self.repo.get(Amenity, aid).to_dict()
-            for aid in place.amenity_ids
-            if self.repo.get(Amenity, aid)
-        ]
-        return d
+        return self._places_expanded([place])[0]
+
+    def _places_expanded(self, places: List[Place],
+                         expand: Set[str] | None = None) -> List[Dict[str, Any]]:
+        """Expand places with owner and amenities using one batch per relation."""
+        return self._records_expanded([place.to_dict() for place in places], expand)
+
+    def _records_expanded(self, records: List[Dict[str, Any]],
+                          expand: Set[str] | None = None) -> List[Dict[str, Any]]:
+        """
+        Add the relations in ``expand`` (by default all) to place records,
+        using one batch per relation, and their rating histogram. Records
+        may hold only some columns; relations are read from their id columns.
+        """
+        related = self._place_relations(records, expand)
+        if "owner" in related:
+            owners = related["owner"]
+            for d in records:
+                d["owner"] = owners.get(d["owner_id"])
+        if "amenities" in related:
+            amenities = related["amenities"]
+            for d in records:
+                d["amenities"] = [amenities[aid] for aid in d["amenity_ids"] if aid in amenities]
+        for d in records:
+            if "rating_count_0" in d:
+                d["rating_histogram"] = [d[f"rating_count_{star}"] for star in STARS]
+        return records
+
+    def _place_relations(self, records: List[Dict[str, Any]],
+                         expand: Set[str] | None = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Relation -> id -> related dict for the relations in ``expand`` (by
+        default all) of place records, one batch per relation. Ids keep the
+        order in which the records first reference them.
+        """
+        if expand is None:
+            expand = self.PLACE_RELATIONS
+        related = {}
+        if "owner" in expand:
+            owner_ids = list(dict.fromkeys(d["owner_id"] for d in records))
+            owners = self.repo.get_many(User, owner_ids) if owner_ids else {}
+            related["owner"] = {
+                owner.id: {
+                    "id": owner.id,
+                    "first_name": owner.first_name,
+                    "last_name": owner.last_name,
+                    "email": owner.email,
+                }
+                for owner in (owners.get(i) for i in owner_ids) if owner
+            }
+        if "amenities" in expand:
+            amenity_ids = list(dict.fromkeys(aid for d in records for aid in d["amenity_ids"]))
+            amenities = self.repo.get_many(Amenity, amenity_ids) if amenity_ids else {}
+            related["amenities"] = {aid: amenities[aid].to_dict()
+                                    for aid in amenity_ids if aid in amenities}
+        return related
+
+    def place_included(self, places: List[Dict[str, Any]],
+                       expand: List[str] | None = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Side-loaded relations of place dicts, for compound responses: the
+        owners and amenities (those in ``expand``, by default both) they
+        reference, each listed once, as ``{"owners": [...], "amenities": [...]}``.
+        """
+        _, expand = self._place_projection(None, expand)
+        related = self._place_relations(places, expand)
+        included = {}
+        if "owner" in related:
+            included["owners"] = list(related["owner"].values())
+        if "amenities" in related:
+            included["amenities"] = list(related["amenities"].values())
+        return included
+
+    def _require_ids(self, cls, ids: List[str], message: str) -> None:
+        """Raise BadRequest unless every id references an existing ``cls`` row."""
+        wanted = set(ids)
+        if not wanted:
+            return
+        if None in wanted or wanted - self.repo.exists_many(cls, wanted):
+            raise BadRequest(message)
+
+    def cache_stats(self) -> Dict[str, int] | None:
+        """Entity cache counters, or None when the repository is not cached."""
+        stats = getattr(self.repo, "cache_stats", None)
+        return stats() if stats else None
+
+    # ===== Place analytics =====
+    # Percentiles reported by place_price_stats
+    PRICE_STATS_PERCENTILES = (25, 50, 75, 95)
+
+    def place_price_stats(self, bbox: BBox | None = None, bins: int = 10,
+                          price: float | None = None) -> Dict[str, Any]:
+        """
+        Price distribution of the places inside ``bbox``, merged from the
+        per-cell price sketches (no price is read or sorted).
+
+        Count, mean, min and max are exact; percentiles and the histogram
+        place each price within 1% of its value.
+
+        Args:
+            bins: Equal-width histogram bins between min and max
+            price: Also report the share of places priced at or below it
+
+        Returns:
+            ``{"count", "min", "max", "mean", "percentiles": {"p25", ...},
+            "histogram": [{"min", "max", "count"}, ...], "price_rank"}``
+        """
+        sketch, prices = self.indexes.get(PlacePriceSketches.name).summary(bbox)
+        values = sketch.quantiles([p / 100 for p in self.PRICE_STATS_PERCENTILES])
+        low, high = prices or (None, None)
+        histogram = []
+        if sketch.count:
+            width = (high - low) / bins
+            histogram = [{"min": low + i * width, "max": low + (i + 1) * width, "count": count}
+                         for i, count in enumerate(sketch.histogram(low, high, bins))]
+        return {"count": sketch.count, "min": low, "max": high, "mean": sketch.mean,
+                "percentiles": {f"p{p}": value
+                                for p, value in zip(self.PRICE_STATS_PERCENTILES, values)},
+                "histogram": histogram,
+                "price_rank": sketch.rank(price) if price is not None else None}
+
+    def place_stats(self, bbox: BBox | None = None) -> Dict[str, Any]:
+        """Place, owner and review counts with price and rating aggregates."""
+        columns = self.indexes.get(PlaceColumns.name)
+        return columns.summary(columns.mask(bbox))
+
+    # Percentiles place_price_percentiles reports by default
+    PRICE_PERCENTILES = (25, 50, 75, 90, 99)
+
+    def place_price_percentiles(self, percentiles: List[float] | None = None,
+                                bbox: BBox | None = None) -> Dict[str, Any]:
+        """
+        Price percentiles (linearly interpolated) of the places in ``bbox``.
+
+        Returns:
+            ``{"places": n, "percentiles": [{"percentile", "price"}, ...]}``
+        """
+        percentiles = self.PRICE_PERCENTILES if percentiles is None else percentiles
+        if any(not 0 <= p <= 100 for p in percentiles):
+            raise BadRequest("percentiles must be between 0 and 100")
+        columns = self.indexes.get(PlaceColumns.name)
+        mask = columns.mask(bbox)
+        prices = columns.quantiles("price", [p / 100 for p in percentiles], mask)
+        return {"places": mask.count(1),
+                "percentiles": [{"percentile": p, "price": price}
+                                for p, price in zip(percentiles, prices)]}
+
+    def place_price_by_region(self, cell_deg: float = 1.0, bbox: BBox | None = None,
+                              limit: int | None = None) -> List[Dict[str, Any]]:
+        """
+        Place count and mean price per ``cell_deg`` x ``cell_deg`` grid cell.
+
+        Returns:
+            ``[{"south", "west", "north", "east", "places", "price_mean"}, ...]``,
+            the cells with the most places first
+        """
+        if not 0 < cell_deg <= 90:
+            raise BadRequest("cell_deg must be in (0, 90]")
+        columns = self.indexes.get(PlaceColumns.name)
+        sums = columns.group_sums(columns.cells(cell_deg), "price", columns.mask(bbox))
+        regions = [{"south": i * cell_deg, "west": j * cell_deg,
+                    "north": (i + 1) * cell_deg, "east": (j + 1) * cell_deg,
+                    "places": count, "price_mean": total / count}
+                   for (i, j), (count, total) in sums.items()]
+        regions.sort(key=lambda r: (-r["places"], r["south"], r["west"]))
+        return regions[:limit] if limit is not None else regions
+
+    def places_per_owner(self, limit: int = 10, bbox: BBox | None = None) -> List[Dict[str, Any]]:
+        """The owners with the most places, with their place counts."""
+        columns = self.indexes.get(PlaceColumns.name)
+        counts = columns.owner_counts(columns.mask(bbox), limit)
+        users = self.repo.get_many(User, [owner_id for owner_id, _ in counts])
+        return [{"owner_id": owner_id,
+                 "first_name": users[owner_id].first_name if owner_id in users else None,
+                 "last_name": users[owner_id].last_name if owner_id in users else None,
+                 "places": places}
+                for owner_id, places in counts]
 
     # ===== Reviews =====
+    @transactional
     def create_review(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        if not self.repo.get(User, payload.get("user_id")):
-            raise BadRequest("user_id must reference an existing User")
-        if not self.repo.get(Place, payload.get("place_id")):
-            raise BadRequest("place_id must reference an existing Place")
+        self._require_ids(User, [payload.get("user_id")],
+                          "user_id must reference an existing User")
+        self._require_ids(Place, [payload.get("place_id")],
+                          "place_id must reference an existing Place")
 
         review = Review(**payload)
         review.validate()
         self.repo.add(review)
+        self._rate(review.place_id, review.rating, 1)
         return review.to_dict()
 
     def get_review(self, review_id: str) -> Dict[str, Any]:
@@ -198,24 +762,31 @@ class HbnbFacade:
             raise NotFound()
         return r.to_dict()
 
-    def list_reviews(self) -> List[Dict[str, Any]]:
-        return [r.to_dict() for r in self.repo.list(Review)]
+    def list_reviews(self, after=None, limit: int | None = None) -> List[Dict[str, Any]]:
+        reviews = self.repo.list(Review, query=self._paged(None, after, limit))
+        return [r.to_dict() for r in reviews]
+
+    def iter_reviews(self) -> Iterator[Dict[str, Any]]:
+        """Stream every review in constant memory."""
+        for review in self.repo.stream(Review):
+            yield review.to_dict()
 
     def list_reviews_for_place(self, place_id: str) -> List[Dict[str, Any]]:
-        return [
-            r.to_dict()
-            for r in self.repo.list(Review, predicate=lambda x: x.place_id == place_id)
-        ]
+        return [r.to_dict() for r in self.get_reviews_by_place(place_id)]
 
     def get_reviews_by_place(self, place_id: str) -> List[Review]:
         """Get all Review objects for a specific place (for validation in Task 3)"""
-        all_reviews = self.repo.list(Review)
-        return [review for review in all_reviews if review.place_id == place_id]
+        return self.repo.list(Review, query=QuerySpec(place_id=place_id))
 
+    def list_reviews_by_user(self, user_id: str) -> List[Dict[str, Any]]:
+        return [r.to_dict() for r in self.repo.list(Review, query=QuerySpec(user_id=user_id))]
+
+    @transactional
     def update_review(self, review_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         r = self.repo.get(Review, review_id)
         if not r:
             raise NotFound()
+        rated = (r.place_id, r.rating)
         for k, v in payload.items():
             if k == "id":
                 continue
@@ -223,9 +794,54 @@ class HbnbFacade:
         r.validate()
         r.touch()
         self.repo.update(r)
+        if (r.place_id, r.rating) != rated:
+            self._rate(rated[0], rated[1], -1)
+            self._rate(r.place_id, r.rating, 1)
         return r.to_dict()
 
+    @transactional
     def delete_review(self, review_id: str) -> None:
-        if not self.repo.get(Review, review_id):
+        r = self.repo.get(Review, review_id)
+        if not r:
             raise NotFound()
+        place_id, rating = r.place_id, r.rating
         self.repo.delete(Review, review_id)
+        self._rate(place_id, rating, -1)
+
+    def _rate(self, place_id: str, rating: int, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a rating from a place's aggregates."""
+        self.repo.increment(Place, place_id, Place.rating_deltas(rating, sign),
+                            averages=Place.RATING_AVERAGE)
+        if self.indexes.active:
+            place = self.repo.get(Place, place_id)
+            if place is not None:
+                self._place_saved(place)
+
+    @transactional
+    def recompute_place_ratings(self, batch_size: int = 500) -> int:
+        """
+        Rebuild every place's rating aggregates from its reviews.
+
+        For data written before the aggregates existed (or by tools
+        bypassing the facade). Returns the number of places updated.
+        """
+        histograms: Dict[str, List[int]] = {}
+        for review in self.repo.stream(Review):
+            histograms.setdefault(review.place_id, [0] * len(STARS))[review.rating] += 1
+
+        count, after = 0, None
+        while True:
+            batch = self.repo.list(Place, query=self._paged(None, after, batch_size))
+            if not batch:
+                return count
+            for place in batch:
+                histogram = histograms.get(place.id, [0] * len(STARS))
+                for star, stars in zip(STARS, histogram):
+                    setattr(place, f"rating_count_{star}", stars)
+                place.review_count = sum(histogram)
+                place.rating_sum = sum(star * stars for star, stars in zip(STARS, histogram))
+                place.rating = place.rating_sum / place.review_count if place.review_count else 0.0
+                self._place_saved(place)
+            self.repo.update_many(batch)
+            count += len(batch)
+            after = (batch[-1].created_at, batch[-1].id)
@@ -0,0 +1,108 @@
+"""
+Geographic helpers shared by the repositories and the facade.
+
+Bounding boxes are ``(south, west, north, east)`` tuples in degrees. A
+box whose west edge is greater than its east edge crosses the
+antimeridian and covers ``lng >= west OR lng <= east``.
+"""
+from __future__ import annotations
+import math
+from typing import Optional, Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+
+BBox = Tuple[float, float, float, float]
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points, in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bbox_around(lat: float, lng: float, radius_km: float) -> BBox:
+    """
+    Smallest box containing every point within ``radius_km`` of a centre.
+
+    Used as an index prefilter; exact distances are checked afterwards.
+    Near a pole the box spans every longitude.
+    """
+    dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    south, north = max(-90.0, lat - dlat), min(90.0, lat + dlat)
+    if south <= -90.0 or north >= 90.0:
+        return south, -180.0, north, 180.0
+    # Longitude half-width of the circle at its widest latitude
+    dlng = math.degrees(math.asin(min(1.0, math.sin(radius_km / EARTH_RADIUS_KM)
+                                      / math.cos(math.radians(lat)))))
+    if dlng >= 180.0:
+        return south, -180.0, north, 180.0
+    west, east = lng - dlng, lng + dlng
+    if west < -180.0:
+        west += 360.0
+    if east > 180.0:
+        east -= 360.0
+    return south, west, north, east
+
+
+def bbox_center(bbox: BBox) -> Tuple[float, float]:
+    """Centre point of a box (antimeridian aware)."""
+    south, west, north, east = bbox
+    if west > east:
+        east += 360.0
+    lng = (west + east) / 2
+    if lng > 180.0:
+        lng -= 360.0
+    return (south + north) / 2, lng
+
+
+def in_bbox(lat: Optional[float], lng: Optional[float], bbox: BBox) -> bool:
+    """Whether a point lies inside (or on the edge of) a box."""
+    if lat is None or lng is None:
+        return False
+    south, west, north, east = bbox
+    if not south <= lat <= north:
+        return False
+    if west <= east:
+        return west <= lng <= east
+    return lng >= west or lng <= east
+
+
+def lng_ranges(bbox: BBox) -> Tuple[Tuple[float, float], ...]:
+    """The box's longitude span as one or two non-wrapping ranges."""
+    _, west, _, east = bbox
+    if west <= east:
+        return ((west, east),)
+    return ((west, 180.0), (-180.0, east))
+
+
+def validate_bbox(bbox: BBox) -> BBox:
+    """Raise ValueError unless ``bbox`` is a usable box."""
+    south, west, north, east = (float(v) for v in bbox)
+    if not (-90.0 <= south <= north <= 90.0):
+        raise ValueError("bbox latitudes must satisfy -90 <= south <= north <= 90")
+    if not (-180.0 <= west <= 180.0 and -180.0 <= east <= 180.0):
+        raise ValueError("bbox longitudes must be in [-180,180]")
+    return south, west, north, east
+
+
+def parse_point(value: str) -> Tuple[float, float]:
+    """Parse ``"lat,lng"``; raises ValueError."""
+    parts = value.split(",")
+    if len(parts) != 2:
+        raise ValueError("expected 'lat,lng'")
+    lat, lng = (float(p) for p in parts)
+    if not (-90.0 <= lat <= 90.0 and -180.0 <= lng <= 180.0):
+        raise ValueError("coordinates out of range")
+    return lat, lng
+
+
+def parse_bbox(value: str) -> BBox:
+    """Parse GeoJSON-ordered ``"west,south,east,north"``; raises ValueError."""
+    parts = value.split(",")
+    if len(parts) != 4:
+        raise ValueError("expected 'west,south,east,north'")
+    west, south, east, north = (float(p) for p in parts)
+    return validate_bbox((south, west, north, east))
@@ -0,0 +1,16 @@
+"""
+In-process place indexes (read models maintained from facade writes)
+"""
+from hbnb.indexes.base import PlaceIndex, PlaceIndexes, PlaceRecord
+from hbnb.indexes.bitmap import Bitmap, PlaceAmenityIndex
+from hbnb.indexes.cards import PlaceCards
+from hbnb.indexes.columns import PlaceColumns
+from hbnb.indexes.kdtree import PlaceKDTree
+from hbnb.indexes.price_sketches import PlacePriceSketches
+from hbnb.indexes.scores import PlaceScores
+from hbnb.indexes.similar import PlaceSimilarity
+from hbnb.indexes.suggest import PlaceSuggester
+
+__all__ = ['PlaceIndex', 'PlaceIndexes', 'PlaceRecord', 'Bitmap', 'PlaceAmenityIndex',
+           'PlaceCards', 'PlaceColumns', 'PlaceKDTree', 'PlacePriceSketches', 'PlaceScores',
+           'PlaceSimilarity', 'PlaceSuggester']
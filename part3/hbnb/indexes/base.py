@@ -0,0 +1,125 @@
+"""
+In-process read models over places.
+
+A PlaceIndex consumes place records (``Place.to_dict()`` output) and
+answers one kind of query from its own data structures instead of the
+database. PlaceIndexes holds the indexes of a facade:
+
+- indexes are built lazily from the repository on first use;
+- facade writes are applied incrementally, after the unit of work
+  commits (a rolled-back write never reaches an index);
+- with ``max_age`` set, an index older than that is rebuilt on its
+  next use, which picks up writes made by other worker processes.
+"""
+from __future__ import annotations
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, Optional
+
+PlaceRecord = Dict[str, Any]
+
+
+class PlaceIndex(ABC):
+    """
+    Base class for read models over place records.
+
+    Subclasses implement clear/add/remove (a subclass missing one cannot
+    be instantiated), and may override rebuild for a faster bulk build.
+    Queries and changes are serialized on ``lock``.
+    """
+
+    name = ""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every indexed place."""
+
+    @abstractmethod
+    def add(self, place: PlaceRecord) -> None:
+        """Index a new place, or re-index a changed one."""
+
+    @abstractmethod
+    def remove(self, place_id: str) -> None:
+        """Forget a place if present."""
+
+    def rebuild(self, places: Iterable[PlaceRecord]) -> None:
+        """Replace the contents with ``places``."""
+        with self.lock:
+            self.clear()
+            for place in places:
+                self.add(place)
+
+
+class PlaceIndexes:
+    """Registry of a facade's place indexes."""
+
+    def __init__(self, source: Callable[[], Iterable[PlaceRecord]],
+                 max_age: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            source: Returns every place record, for (re)builds
+            max_age: Seconds after which an index is rebuilt on next use
+                (None: never, rely on this process's write hooks alone)
+            clock: Time source, injectable for tests
+        """
+        self._source = source
+        self.max_age = max_age
+        self._clock = clock
+        self._indexes: Dict[str, PlaceIndex] = {}
+        self._built: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def register(self, index: PlaceIndex) -> PlaceIndex:
+        """Add an index; it is built on first use."""
+        self._indexes[index.name] = index
+        return index
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._indexes
+
+    @property
+    def active(self) -> bool:
+        """Whether any index has been built (and so follows writes)."""
+        return bool(self._built)
+
+    def get(self, name: str) -> PlaceIndex:
+        """Return an index, building or refreshing it first if needed."""
+        index = self._indexes[name]
+        built = self._built.get(name)
+        if built is None or (self.max_age is not None and self._clock() - built > self.max_age):
+            self.rebuild(name)
+        return index
+
+    def rebuild(self, name: Optional[str] = None) -> None:
+        """Rebuild one index (or every index) from the source."""
+        names = [name] if name else list(self._indexes)
+        for index_name in names:
+            index = self._indexes[index_name]
+            with index.lock:
+                # Marked first so writes committed during the build queue
+                # up on the index lock instead of being skipped
+                with self._lock:
+                    self._built[index_name] = self._clock()
+                index.rebuild(self._source())
+
+    def saved(self, place: PlaceRecord) -> None:
+        """Apply a created or updated place to the built indexes."""
+        for name, index in self._built_indexes():
+            with index.lock:
+                index.add(place)
+
+    def deleted(self, place_id: str) -> None:
+        """Apply a deleted place to the built indexes."""
+        for name, index in self._built_indexes():
+            with index.lock:
+                index.remove(place_id)
+
+    def _built_indexes(self):
+        # Unbuilt indexes will read the committed state when first used
+        with self._lock:
+            names = list(self._built)
+        return [(name, self._indexes[name]) for name in names]
@@ -0,0 +1,336 @@
+"""
+Amenity bitmap index over places.
+
+Every place gets a dense ordinal (freed ordinals are reused), and every
+amenity a bitmap of the ordinals of the places offering it. "Has all of
+these amenities" is then an AND of a few bitmaps, "any of them" an OR,
+and the facet count of an amenity within a result is one popcount of
+their intersection, all done by CPython's big-int operations instead
+of decoding each place's ``amenity_ids`` JSON.
+
+Bitmaps are roaring-style: ordinals are split into 2^16-bit chunks
+keyed by their high bits and empty chunks are not stored, so sparse
+amenities stay small and AND skips chunks missing on either side. Each
+chunk is a plain int used as a bitset.
+
+Range facets (price bands, rating bands, ...) get one bitmap per
+bucket, so their counts are popcounts too, and price and average rating
+are kept per ordinal as well: the bounds the places list accepts are an
+OR of the buckets they cover, with values only compared in the buckets
+straddling a bound.
+"""
+from __future__ import annotations
+import heapq
+from array import array
+from bisect import bisect_right
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+from .base import PlaceIndex, PlaceRecord
+
+CHUNK_BITS = 16
+_CHUNK_MASK = (1 << CHUNK_BITS) - 1
+# Set bit positions of every byte value
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256))
+
+# Range facets: name -> (place field, ascending bucket edges). Bucket i
+# holds edges[i] <= value < edges[i + 1]; the last one is open-ended
+DEFAULT_RANGE_FACETS: Dict[str, Tuple[str, Sequence[float]]] = {
+    "price": ("price", (0, 50, 100, 200, 500)),
+    "rating": ("rating", (1, 2, 3, 4, 4.5)),
+}
+
+
+class Bitmap:
+    """Set of non-negative ints stored as chunked bitsets."""
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, chunks: Optional[Dict[int, int]] = None):
+        self._chunks: Dict[int, int] = chunks if chunks is not None else {}
+
+    @classmethod
+    def of(cls, values: Iterable[int]) -> "Bitmap":
+        # Set the bits in a buffer per chunk: OR-ing them into an int one
+        # by one would copy the whole chunk for every value
+        lows: Dict[int, List[int]] = {}
+        for value in values:
+            lows.setdefault(value >> CHUNK_BITS, []).append(value & _CHUNK_MASK)
+        chunks = {}
+        for high, bits in lows.items():
+            buffer = bytearray(1 << (CHUNK_BITS - 3))
+            for low in bits:
+                buffer[low >> 3] |= 1 << (low & 7)
+            chunks[high] = int.from_bytes(buffer, "little")
+        return cls(chunks)
+
+    def add(self, value: int) -> None:
+        high = value >> CHUNK_BITS
+        self._chunks[high] = self._chunks.get(high, 0) | (1 << (value & _CHUNK_MASK))
+
+    def discard(self, value: int) -> None:
+        high = value >> CHUNK_BITS
+        bits = self._chunks.get(high, 0) & ~(1 << (value & _CHUNK_MASK))
+        if bits:
+            self._chunks[high] = bits
+        else:
+            self._chunks.pop(high, None)
+
+    def __contains__(self, value: int) -> bool:
+        return bool(self._chunks.get(value >> CHUNK_BITS, 0) >> (value & _CHUNK_MASK) & 1)
+
+    def __len__(self) -> int:
+        return sum(bits.bit_count() for bits in self._chunks.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._chunks)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Bitmap) and self._chunks == other._chunks
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        small, large = sorted((self._chunks, other._chunks), key=len)
+        chunks = {}
+        for high, bits in small.items():
+            both = bits & large.get(high, 0)
+            if both:
+                chunks[high] = both
+        return Bitmap(chunks)
+
+    def __or__(self, other: "Bitmap") -> "Bitmap":
+        chunks = dict(self._chunks)
+        for high, bits in other._chunks.items():
+            chunks[high] = chunks.get(high, 0) | bits
+        return Bitmap(chunks)
+
+    def __sub__(self, other: "Bitmap") -> "Bitmap":
+        chunks = {}
+        for high, bits in self._chunks.items():
+            rest = bits & ~other._chunks.get(high, 0)
+            if rest:
+                chunks[high] = rest
+        return Bitmap(chunks)
+
+    def intersection_count(self, other: "Bitmap") -> int:
+        """``len(self & other)`` without building the intersection."""
+        small, large = sorted((self._chunks, other._chunks), key=len)
+        return sum((bits & large.get(high, 0)).bit_count() for high, bits in small.items())
+
+    def __iter__(self) -> Iterator[int]:
+        """Members in ascending order."""
+        for high in sorted(self._chunks):
+            base = high << CHUNK_BITS
+            bits = self._chunks[high]
+            size = (bits.bit_length() + 7) >> 3
+            if bits.bit_count() * 8 >= size:
+                # Dense: look the set bits of each byte up
+                for i, byte in enumerate(bits.to_bytes(size, "little")):
+                    if byte:
+                        start = base + (i << 3)
+                        for bit in _BYTE_BITS[byte]:
+                            yield start + bit
+            else:
+                # Sparse: bin() is least significant bit last; reversed,
+                # find() skips the runs of zeros in C
+                digits = bin(bits)[:1:-1]
+                i = digits.find("1")
+                while i >= 0:
+                    yield base + i
+                    i = digits.find("1", i + 1)
+
+    def copy(self) -> "Bitmap":
+        return Bitmap(dict(self._chunks))
+
+
+class PlaceAmenityIndex(PlaceIndex):
+    """Per-amenity and per-bucket bitmaps of places, with field values per ordinal."""
+
+    name = "amenities"
+
+    def __init__(self, ranges: Mapping[str, Tuple[str, Sequence[float]]] | None = None):
+        """
+        Args:
+            ranges: Range facets, as in DEFAULT_RANGE_FACETS
+        """
+        super().__init__()
+        ranges = DEFAULT_RANGE_FACETS if ranges is None else ranges
+        for name, (field, edges) in ranges.items():
+            if not edges or list(edges) != sorted(set(edges)):
+                raise ValueError(f"range facet {name}: edges must be ascending and distinct")
+        self.ranges = {name: (field, tuple(edges)) for name, (field, edges) in ranges.items()}
+        self.fields = ("price", "rating") + tuple(
+            sorted({field for field, _ in self.ranges.values()} - {"price", "rating"}))
+        self.clear()
+
+    def clear(self) -> None:
+        with self.lock:
+            self._ordinals: Dict[str, int] = {}
+            self._ids: List[Optional[str]] = []
+            self._free: List[int] = []
+            self._live = Bitmap()
+            self._bitmaps: Dict[str, Bitmap] = {}
+            self._amenities: Dict[str, FrozenSet[str]] = {}
+            self._values: Dict[str, array] = {field: array("d") for field in self.fields}
+            # facet -> one bitmap per bucket, bucket 0 being below the first edge
+            self._buckets: Dict[str, List[Bitmap]] = {
+                name: [Bitmap() for _ in range(len(edges) + 1)]
+                for name, (_, edges) in self.ranges.items()}
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    # ----- Maintenance -----
+    def add(self, place: PlaceRecord) -> None:
+        place_id = place["id"]
+        amenities = frozenset(place.get("amenity_ids") or ())
+        with self.lock:
+            ordinal = self._ordinals.get(place_id)
+            if ordinal is None:
+                ordinal = self._assign(place_id)
+                old: FrozenSet[str] = frozenset()
+            else:
+                old = self._amenities[place_id]
+                self._unbucket(ordinal)
+            for field, values in self._values.items():
+                values[ordinal] = place.get(field) or 0.0
+            for name, (field, edges) in self.ranges.items():
+                bucket = bisect_right(edges, self._values[field][ordinal])
+                self._buckets[name][bucket].add(ordinal)
+            for amenity_id in old - amenities:
+                bitmap = self._bitmaps[amenity_id]
+                bitmap.discard(ordinal)
+                if not bitmap:
+                    del self._bitmaps[amenity_id]
+            for amenity_id in amenities - old:
+                self._bitmaps.setdefault(amenity_id, Bitmap()).add(ordinal)
+            self._amenities[place_id] = amenities
+
+    def remove(self, place_id: str) -> None:
+        with self.lock:
+            ordinal = self._ordinals.pop(place_id, None)
+            if ordinal is None:
+                return
+            for amenity_id in self._amenities.pop(place_id):
+                bitmap = self._bitmaps[amenity_id]
+                bitmap.discard(ordinal)
+                if not bitmap:
+                    del self._bitmaps[amenity_id]
+            self._unbucket(ordinal)
+            self._live.discard(ordinal)
+            self._ids[ordinal] = None
+            heapq.heappush(self._free, ordinal)
+
+    def _assign(self, place_id: str) -> int:
+        # Reuse the lowest freed ordinal so ordinals stay dense
+        if self._free:
+            ordinal = heapq.heappop(self._free)
+            self._ids[ordinal] = place_id
+        else:
+            ordinal = len(self._ids)
+            self._ids.append(place_id)
+            for values in self._values.values():
+                values.append(0.0)
+        self._ordinals[place_id] = ordinal
+        self._live.add(ordinal)
+        return ordinal
+
+    def _unbucket(self, ordinal: int) -> None:
+        for name, (field, edges) in self.ranges.items():
+            self._buckets[name][bisect_right(edges, self._values[field][ordinal])].discard(ordinal)
+
+    # ----- Queries -----
+    def select(self, amenity_ids: Optional[Iterable[str]] = None, match_all: bool = True,
+               min_price: Optional[float] = None, max_price: Optional[float] = None,
+               min_rating: Optional[float] = None) -> Bitmap:
+        """
+        Ordinals of the places matching the filters.
+
+        Args:
+            amenity_ids: Amenities to filter on (None: no amenity filter)
+            match_all: Require every amenity (AND) rather than any (OR)
+            min_price, max_price, min_rating: Inclusive bounds, as in list_places
+        """
+        with self.lock:
+            if amenity_ids is None:
+                result = self._live
+            else:
+                bitmaps = [self._bitmaps.get(a, Bitmap()) for a in set(amenity_ids)]
+                if not bitmaps:
+                    result = self._live if match_all else Bitmap()
+                elif match_all:
+                    bitmaps.sort(key=len)
+                    result = bitmaps[0]
+                    for bitmap in bitmaps[1:]:
+                        result = result & bitmap
+                else:
+                    result = Bitmap()
+                    for bitmap in bitmaps:
+                        result = result | bitmap
+            if min_price is None and max_price is None and min_rating is None:
+                return result.copy()
+            if min_price is not None or max_price is not None:
+                result = self._bounded(result, "price", min_price, max_price)
+            if min_rating is not None:
+                result = self._bounded(result, "rating", min_rating, None)
+            return result
+
+    def _bounded(self, result: Bitmap, field: str, low: Optional[float],
+                 high: Optional[float]) -> Bitmap:
+        """Members of ``result`` with ``low <= field <= high``."""
+        values = self._values[field]
+        low = float("-inf") if low is None else low
+        high = float("inf") if high is None else high
+        facet = next((name for name, (f, _) in self.ranges.items() if f == field), None)
+        if facet is None:
+            return Bitmap.of(o for o in result if low <= values[o] <= high)
+        edges = self.ranges[facet][1]
+        starts = (float("-inf"),) + edges
+        ends = edges + (float("inf"),)
+        bounded = Bitmap()
+        for start, end, bucket in zip(starts, ends, self._buckets[facet]):
+            if end <= low or start > high:
+                continue
+            part = result & bucket
+            if low <= start and end <= high:
+                bounded = bounded | part
+            elif part:
+                # The bucket straddles a bound: compare its members
+                bounded = bounded | Bitmap.of(o for o in part if low <= values[o] <= high)
+        return bounded
+
+    def facets(self, result: Bitmap) -> Dict[str, int]:
+        """Places of ``result`` offering each amenity (amenities with none left out)."""
+        with self.lock:
+            counts = {a: result.intersection_count(bitmap) for a, bitmap in self._bitmaps.items()}
+        return {a: count for a, count in counts.items() if count}
+
+    def range_facets(self, result: Bitmap, names: Iterable[str] | None = None
+                     ) -> Dict[str, List[Dict[str, object]]]:
+        """
+        Places of ``result`` in each bucket of the range facets.
+
+        Returns:
+            facet -> ``[{"key", "min", "max", "count"}, ...]`` for every
+            bucket, in edge order; ``max`` is None for the last one
+        """
+        names = self.ranges if names is None else names
+        facets = {}
+        with self.lock:
+            for name in names:
+                edges = self.ranges[name][1]
+                buckets = self._buckets[name]
+                facets[name] = [
+                    {"key": f"{low:g}-{high:g}" if high is not None else f"{low:g}+",
+                     "min": low, "max": high,
+                     "count": result.intersection_count(buckets[i + 1])}
+                    for i, (low, high) in enumerate(zip(edges, edges[1:] + (None,)))]
+        return facets
+
+    def contains(self, result: Bitmap, place_id: str) -> bool:
+        """Whether a place is in ``result``."""
+        ordinal = self._ordinals.get(place_id)
+        return ordinal is not None and ordinal in result
+
+    def ids(self, result: Bitmap) -> List[str]:
+        """Place ids of the ordinals in ``result``."""
+        with self.lock:
+            ids = self._ids
+            return [ids[o] for o in result if ids[o] is not None]
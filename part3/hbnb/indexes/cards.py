@@ -0,0 +1,87 @@
+"""
+Place "card" projection for listing pages.
+
+A card holds exactly what the index page renders: id, name, price,
+creation time and the rating aggregates. Cards are kept ready-made,
+in the default (created_at, id) order of the places list, so a page of
+cards is a slice: no place rows are loaded and no owner or amenity is
+expanded.
+"""
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .base import PlaceIndex, PlaceRecord
+
+# Place record fields copied onto a card
+CARD_FIELDS = ("id", "name", "price", "rating", "review_count", "created_at")
+
+
+class PlaceCards(PlaceIndex):
+    """Ready-made place cards in creation order."""
+
+    name = "cards"
+
+    def __init__(self):
+        super().__init__()
+        self.clear()
+
+    def clear(self) -> None:
+        with self.lock:
+            self._cards: Dict[str, Dict[str, Any]] = {}
+            # (created_at, id), ascending; ISO timestamps sort as strings
+            self._order: List[Tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    @staticmethod
+    def card(place: PlaceRecord) -> Dict[str, Any]:
+        return {field: place.get(field) for field in CARD_FIELDS}
+
+    # ----- Maintenance -----
+    def add(self, place: PlaceRecord) -> None:
+        card = self.card(place)
+        with self.lock:
+            old = self._cards.get(card["id"])
+            if old is not None and old["created_at"] != card["created_at"]:
+                self._delete(old)
+                old = None
+            if old is None:
+                insort(self._order, (card["created_at"] or "", card["id"]))
+            self._cards[card["id"]] = card
+
+    def remove(self, place_id: str) -> None:
+        with self.lock:
+            card = self._cards.pop(place_id, None)
+            if card is not None:
+                self._delete(card)
+
+    def rebuild(self, places: Iterable[PlaceRecord]) -> None:
+        with self.lock:
+            self.clear()
+            for place in places:
+                self._cards[place["id"]] = self.card(place)
+            self._order = sorted((card["created_at"] or "", place_id)
+                                 for place_id, card in self._cards.items())
+
+    def _delete(self, card: Dict[str, Any]) -> None:
+        key = (card["created_at"] or "", card["id"])
+        i = bisect_left(self._order, key)
+        if i < len(self._order) and self._order[i] == key:
+            del self._order[i]
+
+    # ----- Queries -----
+    def page(self, limit: Optional[int] = None,
+             after: Optional[Tuple[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Cards in (created_at, id) order.
+
+        Args:
+            limit: Maximum number of cards (None: all)
+            after: ``(created_at, id)`` of the last card already returned
+        """
+        with self.lock:
+            start = bisect_right(self._order, after) if after else 0
+            end = start + limit if limit is not None else None
+            cards = self._cards
+            return [dict(cards[place_id]) for _, place_id in self._order[start:end]]
@@ -0,0 +1,173 @@
+"""
+Columnar snapshot of places for scan-heavy analytics.
+
+Every place is one row (a dense ordinal; freed rows are reused) of typed
+arrays: price, latitude, longitude, owner ordinal, rating sum and review
+count, next to a live flag. Aggregates run over whole columns with
+C-level builtins (``itertools.compress`` under a row mask, ``sum``,
+``min``/``max``, ``sorted``, ``Counter``) instead of loading a ``Place``
+and calling ``to_dict()`` per row.
+
+Queries take a row mask, a ``bytearray`` holding 1 for every selected
+row, as built by ``mask()``; the live flag is the mask of every place.
+"""
+from __future__ import annotations
+import heapq
+import math
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+from hbnb.geo import BBox
+from .base import PlaceIndex, PlaceRecord
+
+# Numeric columns and their array typecodes
+COLUMNS = {
+    "price": "d",
+    "latitude": "d",
+    "longitude": "d",
+    "rating_sum": "q",
+    "review_count": "q",
+}
+
+
+def quantile(ordered: Sequence[float], fraction: float) -> Optional[float]:
+    """Linearly interpolated quantile of sorted values (None if empty)."""
+    if not ordered:
+        return None
+    position = fraction * (len(ordered) - 1)
+    low = math.floor(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+class PlaceColumns(PlaceIndex):
+    """Typed-array columns of place fields, one row per place."""
+
+    name = "columns"
+
+    def __init__(self):
+        super().__init__()
+        self.clear()
+
+    def clear(self) -> None:
+        with self.lock:
+            self._rows: Dict[str, int] = {}
+            self._free: List[int] = []
+            self._live = bytearray()
+            self._columns: Dict[str, array] = {name: array(code) for name, code in COLUMNS.items()}
+            self._owner = array("q")
+            self._owner_ordinals: Dict[str, int] = {}
+            self._owner_ids: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # ----- Maintenance -----
+    def add(self, place: PlaceRecord) -> None:
+        with self.lock:
+            row = self._rows.get(place["id"])
+            if row is None:
+                row = self._assign(place["id"])
+            for name, column in self._columns.items():
+                column[row] = place.get(name) or 0
+            owner_id = place.get("owner_id") or ""
+            owner = self._owner_ordinals.get(owner_id)
+            if owner is None:
+                owner = self._owner_ordinals[owner_id] = len(self._owner_ids)
+                self._owner_ids.append(owner_id)
+            self._owner[row] = owner
+
+    def remove(self, place_id: str) -> None:
+        with self.lock:
+            row = self._rows.pop(place_id, None)
+            if row is not None:
+                self._live[row] = 0
+                heapq.heappush(self._free, row)
+
+    def _assign(self, place_id: str) -> int:
+        # Reuse the lowest freed row so the columns stay dense
+        if self._free:
+            row = heapq.heappop(self._free)
+        else:
+            row = len(self._live)
+            self._live.append(0)
+            self._owner.append(0)
+            for column in self._columns.values():
+                column.append(0)
+        self._live[row] = 1
+        self._rows[place_id] = row
+        return row
+
+    # ----- Queries -----
+    def mask(self, bbox: BBox | None = None, owner_id: str | None = None) -> bytearray:
+        """Rows of the live places inside ``bbox`` and owned by ``owner_id``."""
+        with self.lock:
+            mask = bytearray(self._live)
+            if owner_id is not None:
+                owner = self._owner_ordinals.get(owner_id, -1)
+                mask = bytearray(m and o == owner for m, o in zip(mask, self._owner))
+            if bbox is not None:
+                south, west, north, east = bbox
+                lats, lngs = self._columns["latitude"], self._columns["longitude"]
+                if west <= east:
+                    mask = bytearray(m and south <= lat <= north and west <= lng <= east
+                                     for m, lat, lng in zip(mask, lats, lngs))
+                else:
+                    mask = bytearray(m and south <= lat <= north and (lng >= west or lng <= east)
+                                     for m, lat, lng in zip(mask, lats, lngs))
+            return mask
+
+    def column(self, name: str, mask: bytearray | None = None) -> List[float]:
+        """Values of a column for the rows of ``mask`` (default: every place)."""
+        with self.lock:
+            return list(compress(self._columns[name], self._live if mask is None else mask))
+
+    def summary(self, mask: bytearray | None = None) -> Dict[str, Any]:
+        """Place, owner and review counts with price and rating aggregates."""
+        with self.lock:
+            mask = self._live if mask is None else mask
+            prices = list(compress(self._columns["price"], mask))
+            reviews = sum(compress(self._columns["review_count"], mask))
+            ratings = sum(compress(self._columns["rating_sum"], mask))
+            owners = len(set(compress(self._owner, mask)))
+        return {
+            "places": len(prices),
+            "owners": owners,
+            "reviews": reviews,
+            "price_min": min(prices) if prices else None,
+            "price_max": max(prices) if prices else None,
+            "price_mean": sum(prices) / len(prices) if prices else None,
+            "rating_mean": ratings / reviews if reviews else None,
+        }
+
+    def quantiles(self, name: str, fractions: Iterable[float],
+                  mask: bytearray | None = None) -> List[Optional[float]]:
+        """Interpolated quantiles of a column (one sort for all fractions)."""
+        ordered = sorted(self.column(name, mask))
+        return [quantile(ordered, fraction) for fraction in fractions]
+
+    def cells(self, cell_deg: float) -> List[Tuple[int, int]]:
+        """Per row, the (lat, lng) index of its ``cell_deg`` grid cell."""
+        with self.lock:
+            floor = math.floor
+            return [(floor(lat / cell_deg), floor(lng / cell_deg))
+                    for lat, lng in zip(self._columns["latitude"], self._columns["longitude"])]
+
+    def group_sums(self, keys: Sequence[Hashable], name: str,
+                   mask: bytearray | None = None) -> Dict[Hashable, Tuple[int, float]]:
+        """Row count and column total per key, ``keys`` being aligned with the rows."""
+        with self.lock:
+            mask = self._live if mask is None else mask
+            groups: Dict[Hashable, List[float]] = {}
+            for key, value in zip(compress(keys, mask), compress(self._columns[name], mask)):
+                groups.setdefault(key, []).append(value)
+        return {key: (len(values), sum(values)) for key, values in groups.items()}
+
+    def owner_counts(self, mask: bytearray | None = None,
+                     limit: int | None = None) -> List[Tuple[str, int]]:
+        """``(owner_id, places)`` pairs, most places first."""
+        with self.lock:
+            mask = self._live if mask is None else mask
+            counts = Counter(compress(self._owner, mask)).most_common(limit)
+            return [(self._owner_ids[owner], count) for owner, count in counts]
@@ -0,0 +1,185 @@
+"""
+KD-tree over place coordinates for k-nearest-neighbour queries.
+
+Coordinates are mapped onto the unit sphere (x, y, z), where straight-line
+(chord) distance grows monotonically with great-circle distance; a plain
+3-d KD-tree then ranks exactly like haversine, with no special cases at
+the poles or the antimeridian.
+
+The tree is implicit: after the build, position ``i`` of the coordinate
+arrays holds the node splitting the segment it is the median of, so the
+tree is three ``array('d')`` columns plus an id list. Writes go to a
+small overlay (moved/new points are scanned linearly, removed ones are
+skipped) and the tree is rebuilt once the overlay outgrows
+``rebuild_ratio`` of it.
+"""
+from __future__ import annotations
+import heapq
+import math
+from array import array
+from typing import Dict, Iterable, List, Set, Tuple
+from hbnb.geo import EARTH_RADIUS_KM
+from .base import PlaceIndex, PlaceRecord
+
+Vector = Tuple[float, float, float]
+
+
+def to_unit_vector(lat: float, lng: float) -> Vector:
+    phi, lmb = math.radians(lat), math.radians(lng)
+    cos_phi = math.cos(phi)
+    return cos_phi * math.cos(lmb), cos_phi * math.sin(lmb), math.sin(phi)
+
+
+def chord_to_km(chord_sq: float) -> float:
+    """Great-circle distance for a squared chord length on the unit sphere."""
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(chord_sq) / 2))
+
+
+class PlaceKDTree(PlaceIndex):
+    """k-NN index of place coordinates."""
+
+    name = "kdtree"
+
+    def __init__(self, rebuild_ratio: float = 0.05, min_overlay: int = 256):
+        """
+        Args:
+            rebuild_ratio: Rebuild once the overlay holds this share of the tree
+            min_overlay: ...but never for fewer overlay entries than this
+        """
+        super().__init__()
+        self.rebuild_ratio = rebuild_ratio
+        self.min_overlay = min_overlay
+        self.clear()
+
+    def clear(self) -> None:
+        with self.lock:
+            self._axes = (array("d"), array("d"), array("d"))
+            self._ids: List[str] = []
+            self._tree_ids: Set[str] = set()
+            self._points: Dict[str, Vector] = {}
+            self._overlay: Dict[str, Vector] = {}
+            self._dead: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    # ----- Maintenance -----
+    def add(self, place: PlaceRecord) -> None:
+        lat, lng = place.get("latitude"), place.get("longitude")
+        if lat is None or lng is None:
+            self.remove(place["id"])
+            return
+        vector = to_unit_vector(lat, lng)
+        place_id = place["id"]
+        with self.lock:
+            if self._points.get(place_id) == vector:
+                return
+            self._points[place_id] = vector
+            if place_id in self._tree_ids:
+                self._dead.add(place_id)
+            self._overlay[place_id] = vector
+            self._maybe_rebuild()
+
+    def remove(self, place_id: str) -> None:
+        with self.lock:
+            if self._points.pop(place_id, None) is None:
+                return
+            self._overlay.pop(place_id, None)
+            if place_id in self._tree_ids:
+                self._dead.add(place_id)
+            self._maybe_rebuild()
+
+    def rebuild(self, places: Iterable[PlaceRecord]) -> None:
+        with self.lock:
+            self.clear()
+            for place in places:
+                lat, lng = place.get("latitude"), place.get("longitude")
+                if lat is not None and lng is not None:
+                    self._points[place["id"]] = to_unit_vector(lat, lng)
+            self._build()
+
+    def _maybe_rebuild(self) -> None:
+        pending = len(self._overlay) + len(self._dead)
+        if pending > max(self.min_overlay, self.rebuild_ratio * len(self._ids)):
+            self._build()
+
+    def _build(self) -> None:
+        """Build the implicit tree from every current point."""
+        ids = list(self._points)
+        vectors = [self._points[i] for i in ids]
+        order = list(range(len(ids)))
+        columns = [array("d", (v[axis] for v in vectors)) for axis in range(3)]
+
+        # Sort each segment on its split axis; the median becomes the node.
+        stack = [(0, len(order), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if hi - lo <= 1:
+                continue
+            column = columns[depth % 3]
+            order[lo:hi] = sorted(order[lo:hi], key=column.__getitem__)
+            mid = (lo + hi) // 2
+            stack.append((lo, mid, depth + 1))
+            stack.append((mid + 1, hi, depth + 1))
+
+        self._axes = tuple(array("d", (column[i] for i in order)) for column in columns)
+        self._ids = [ids[i] for i in order]
+        self._tree_ids = set(ids)
+        self._overlay = {}
+        self._dead = set()
+
+    # ----- Queries -----
+    def nearest(self, lat: float, lng: float, k: int,
+                exclude: Iterable[str] = ()) -> List[Tuple[float, str]]:
+        """
+        The ``k`` places nearest to a point.
+
+        Args:
+            lat, lng: Query point
+            k: Number of neighbours
+            exclude: Ids to leave out (e.g. the place itself)
+
+        Returns:
+            ``(distance_km, place_id)`` pairs, nearest first
+        """
+        if k <= 0:
+            return []
+        query = to_unit_vector(lat, lng)
+        excluded = set(exclude)
+        with self.lock:
+            # Max-heap of the best k so far, as (-chord^2, id); tree nodes
+            # of moved or removed places are stale and skipped
+            best: List[Tuple[float, str]] = []
+            self._search(query, k, excluded | self._dead, best, 0, len(self._ids), 0)
+            for place_id, vector in self._overlay.items():
+                if place_id not in excluded:
+                    self._offer(best, k, _chord_sq(query, vector), place_id)
+        return [(chord_to_km(-d), place_id) for d, place_id in sorted(best, reverse=True)]
+
+    def _search(self, query: Vector, k: int, skip: Set[str],
+                best: List[Tuple[float, str]], lo: int, hi: int, depth: int) -> None:
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        xs, ys, zs = self._axes
+        place_id = self._ids[mid]
+        if place_id not in skip:
+            d = (xs[mid] - query[0]) ** 2 + (ys[mid] - query[1]) ** 2 + (zs[mid] - query[2]) ** 2
+            self._offer(best, k, d, place_id)
+        axis = depth % 3
+        diff = query[axis] - self._axes[axis][mid]
+        near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+        self._search(query, k, skip, best, near[0], near[1], depth + 1)
+        if len(best) < k or diff * diff < -best[0][0]:
+            self._search(query, k, skip, best, far[0], far[1], depth + 1)
+
+    @staticmethod
+    def _offer(best: List[Tuple[float, str]], k: int, d: float, place_id: str) -> None:
+        if len(best) < k:
+            heapq.heappush(best, (-d, place_id))
+        elif d < -best[0][0]:
+            heapq.heapreplace(best, (-d, place_id))
+
+
+def _chord_sq(a: Vector, b: Vector) -> float:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
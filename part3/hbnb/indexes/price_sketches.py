@@ -0,0 +1,186 @@
+"""
+Price sketches per geographic cell, for price distribution queries.
+
+Places are counted in a QuantileSketch of their grid cell at each of a
+few nested cell sizes (30, 5 and 1 degrees by default). A bounding box
+is answered by merging the sketches of the largest cells it contains,
+descending into the cells its edges cross; places in the finest cells
+it crosses are tested one by one. Cost then depends on the box's
+outline, never on the number of places, and no price is ever sorted.
+
+Sketch buckets only approximate prices, so every cell also keeps the
+exact cheapest and dearest price of its places, merged the same way.
+"""
+from __future__ import annotations
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from hbnb.geo import BBox, lng_ranges
+from hbnb.sketch import QuantileSketch
+from .base import PlaceIndex, PlaceRecord
+
+Cell = Tuple[int, int]
+# Exact (min, max) price of a set of places
+PriceRange = Tuple[float, float]
+
+
+class PlacePriceSketches(PlaceIndex):
+    """Quantile sketches of place prices per grid cell, at nested cell sizes."""
+
+    name = "price_sketches"
+
+    def __init__(self, cell_sizes: Sequence[float] = (30.0, 5.0, 1.0), alpha: float = 0.01):
+        """
+        Args:
+            cell_sizes: Cell sizes in degrees, largest first, each a
+                multiple of the next
+            alpha: Relative accuracy of the sketches
+        """
+        super().__init__()
+        for size, finer in zip(cell_sizes, cell_sizes[1:]):
+            ratio = size / finer
+            if ratio < 1 or abs(ratio - round(ratio)) > 1e-9:
+                raise ValueError("each cell size must be a multiple of the next")
+        self.cell_sizes = tuple(cell_sizes)
+        self._ratios = [round(size / finer) for size, finer in zip(cell_sizes, cell_sizes[1:])]
+        self.alpha = alpha
+        self.clear()
+
+    def clear(self) -> None:
+        with self.lock:
+            self._levels: List[Dict[Cell, QuantileSketch]] = [{} for _ in self.cell_sizes]
+            self._ranges: List[Dict[Cell, PriceRange]] = [{} for _ in self.cell_sizes]
+            # finest cell -> place id -> (lat, lng, price)
+            self._places: Dict[Cell, Dict[str, Tuple[float, float, float]]] = {}
+            self._cells: Dict[str, Cell] = {}
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def _cell(self, level: int, lat: float, lng: float) -> Cell:
+        size = self.cell_sizes[level]
+        return math.floor(lat / size), math.floor(lng / size)
+
+    # ----- Maintenance -----
+    def add(self, place: PlaceRecord) -> None:
+        lat, lng = place.get("latitude"), place.get("longitude")
+        with self.lock:
+            self.remove(place["id"])
+            if lat is None or lng is None:
+                return
+            price = place.get("price") or 0.0
+            self._count(lat, lng, price, 1)
+            cell = self._cell(len(self.cell_sizes) - 1, lat, lng)
+            self._places.setdefault(cell, {})[place["id"]] = (lat, lng, price)
+            self._cells[place["id"]] = cell
+            for level, ranges in enumerate(self._ranges):
+                cell = self._cell(level, lat, lng)
+                ranges[cell] = _widen(ranges.get(cell), (price, price))
+
+    def remove(self, place_id: str) -> None:
+        with self.lock:
+            cell = self._cells.pop(place_id, None)
+            if cell is None:
+                return
+            places = self._places[cell]
+            lat, lng, price = places.pop(place_id)
+            if not places:
+                del self._places[cell]
+            self._count(lat, lng, price, -1)
+            if price in self._ranges[-1][cell]:
+                self._shrink(lat, lng)
+
+    def _shrink(self, lat: float, lng: float) -> None:
+        """Recompute the price ranges of the cells holding (lat, lng)."""
+        finest = len(self.cell_sizes) - 1
+        for level in range(finest, -1, -1):
+            cell, found = self._cell(level, lat, lng), None
+            if level == finest:
+                for _, _, price in self._places.get(cell, {}).values():
+                    found = _widen(found, (price, price))
+            else:
+                ratio, children = self._ratios[level], self._ranges[level + 1]
+                for i in range(ratio):
+                    for j in range(ratio):
+                        found = _widen(found, children.get((cell[0] * ratio + i,
+                                                            cell[1] * ratio + j)))
+            ranges = self._ranges[level]
+            if ranges.get(cell) == found:
+                return
+            if found is None:
+                del ranges[cell]
+            else:
+                ranges[cell] = found
+
+    def _count(self, lat: float, lng: float, price: float, weight: int) -> None:
+        for level, sketches in enumerate(self._levels):
+            cell = self._cell(level, lat, lng)
+            sketch = sketches.get(cell)
+            if sketch is None:
+                sketch = sketches[cell] = QuantileSketch(self.alpha)
+            sketch.add(price, weight)
+            if not sketch.count:
+                del sketches[cell]
+
+    # ----- Queries -----
+    def sketch(self, bbox: BBox | None = None) -> QuantileSketch:
+        """Merged sketch of the prices of the places inside ``bbox`` (default: all)."""
+        return self.summary(bbox)[0]
+
+    def summary(self, bbox: BBox | None = None
+                ) -> Tuple[QuantileSketch, Optional[PriceRange]]:
+        """
+        Merged sketch and exact price range of the places inside ``bbox``.
+
+        Returns:
+            ``(sketch, (min, max))``; the range is None without places
+        """
+        merged = QuantileSketch(self.alpha)
+        found: List[Optional[PriceRange]] = [None]
+        with self.lock:
+            if bbox is None:
+                for cell, sketch in self._levels[0].items():
+                    merged.merge(sketch)
+                    found[0] = _widen(found[0], self._ranges[0][cell])
+                return merged, found[0]
+            south, _, north, _ = bbox
+            for west, east in lng_ranges(bbox):
+                self._collect(0, self._levels[0], (south, west, north, east), merged, found)
+        return merged, found[0]
+
+    def _collect(self, level: int, cells: Iterable[Cell], box: BBox,
+                 merged: QuantileSketch, found: List[Optional[PriceRange]]) -> None:
+        south, west, north, east = box
+        size = self.cell_sizes[level]
+        sketches = self._levels[level]
+        finest = level == len(self.cell_sizes) - 1
+        for cell in cells:
+            sketch = sketches.get(cell)
+            if sketch is None:
+                continue
+            cell_south, cell_west = cell[0] * size, cell[1] * size
+            cell_north, cell_east = cell_south + size, cell_west + size
+            if cell_south > north or cell_north < south or cell_west > east or cell_east < west:
+                continue
+            if south <= cell_south and cell_north <= north and west <= cell_west and cell_east <= east:
+                merged.merge(sketch)
+                found[0] = _widen(found[0], self._ranges[level][cell])
+            elif finest:
+                # The box's edge crosses the cell: test its places
+                for lat, lng, price in self._places.get(cell, {}).values():
+                    if south <= lat <= north and west <= lng <= east:
+                        merged.add(price)
+                        found[0] = _widen(found[0], (price, price))
+            else:
+                ratio = self._ratios[level]
+                children = [(cell[0] * ratio + i, cell[1] * ratio + j)
+                            for i in range(ratio) for j in range(ratio)]
+                self._collect(level + 1, children, box, merged, found)
+
+
+def _widen(found: Optional[PriceRange], other: Optional[PriceRange]) -> Optional[PriceRange]:
+    """Smallest range covering both (either may be None)."""
+    if other is None:
+        return found
+    if found is None:
+        return other
+    return min(found[0], other[0]), max(found[1], other[1])
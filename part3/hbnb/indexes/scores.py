@@ -0,0 +1,134 @@
+"""
+Ranking of places for the "top places" feed.
+
+A place's score is the Bayesian average of its review ratings (its
+ratings plus ``prior_weight`` virtual reviews of ``prior_mean``, so a
+single 5-star review does not beat a hundred 4.8s) plus a recency bonus.
+The bonus is a logistic curve of the creation time: about
+``recency_weight`` points per year around ``RECENCY_MIDPOINT``, never more
+than ``recency_max`` in total, so new listings cannot outrank well-reviewed
+ones on age alone. It depends on the creation time rather than the age,
+so the order of two places never changes as time passes and scores only
+move when reviews do.
+
+Scores are kept in a bisect-sorted list of ``(-score, id)``: a review
+re-positions one place, and the first ``k`` places (or the ``k`` after a
+cursor) are a slice.
+"""
+from __future__ import annotations
+import math
+from bisect import bisect_right, insort
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from hbnb.bl.base import ISO
+from .base import PlaceIndex, PlaceRecord
+
+# Creation time earning half of the largest recency bonus
+RECENCY_MIDPOINT = datetime(2026, 1, 1)
+_SECONDS_PER_YEAR = 365.25 * 86400
+
+
+class PlaceScores(PlaceIndex):
+    """Places ordered by Bayesian-average rating blended with recency."""
+
+    name = "top"
+
+    def __init__(self, prior_mean: float = 3.5, prior_weight: float = 5.0,
+                 recency_weight: float = 0.1, recency_max: float = 0.5,
+                 recency_midpoint: datetime = RECENCY_MIDPOINT):
+        """
+        Args:
+            prior_mean: Rating assumed for a place before its reviews
+            prior_weight: Number of reviews that prior is worth
+            recency_weight: Score points per year of newer listing,
+                around recency_midpoint
+            recency_max: Upper bound of the recency bonus
+            recency_midpoint: Creation time earning half of recency_max
+        """
+        super().__init__()
+        self.prior_mean = prior_mean
+        self.prior_weight = prior_weight
+        self.recency_weight = recency_weight
+        self.recency_max = recency_max
+        self.recency_midpoint = recency_midpoint
+        self.clear()
+
+    def clear(self) -> None:
+        with self.lock:
+            self._order: List[Tuple[float, str]] = []
+            self._scores: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def score(self, place: PlaceRecord) -> float:
+        """Score of a place record."""
+        reviews = place.get("review_count") or 0
+        total = place.get("rating_sum") or 0
+        rating = (self.prior_mean * self.prior_weight + total) / (self.prior_weight + reviews)
+        created_at = place.get("created_at")
+        if not created_at or not self.recency_max:
+            return rating
+        if isinstance(created_at, str):
+            created_at = datetime.strptime(created_at, ISO)
+        years = (created_at - self.recency_midpoint).total_seconds() / _SECONDS_PER_YEAR
+        # Logistic curve from 0 to recency_max (tanh form: no overflow),
+        # rising recency_weight points per year at the midpoint
+        steepness = 2 * self.recency_weight / self.recency_max
+        return rating + self.recency_max * (1 + math.tanh(steepness * years)) / 2
+
+    # ----- Maintenance -----
+    def add(self, place: PlaceRecord) -> None:
+        score = self.score(place)
+        with self.lock:
+            old = self._scores.get(place["id"])
+            if old == score:
+                return
+            if old is not None:
+                self._delete(old, place["id"])
+            self._scores[place["id"]] = score
+            insort(self._order, (-score, place["id"]))
+
+    def remove(self, place_id: str) -> None:
+        with self.lock:
+            score = self._scores.pop(place_id, None)
+            if score is not None:
+                self._delete(score, place_id)
+
+    def rebuild(self, places: Iterable[PlaceRecord]) -> None:
+        with self.lock:
+            self.clear()
+            for place in places:
+                self._scores[place["id"]] = self.score(place)
+            self._order = sorted((-score, place_id) for place_id, score in self._scores.items())
+
+    def _delete(self, score: float, place_id: str) -> None:
+        i = bisect_right(self._order, (-score, place_id)) - 1
+        if i >= 0 and self._order[i] == (-score, place_id):
+            del self._order[i]
+
+    # ----- Queries -----
+    def top(self, limit: int, after: Optional[Tuple[float, str]] = None) -> List[Tuple[str, float]]:
+        """
+        The best ``limit`` places, or the ``limit`` following ``after``.
+
+        Args:
+            after: ``(score, id)`` of the last place already returned
+
+        Returns:
+            ``(id, score)`` pairs, best first
+        """
+        with self.lock:
+            start = bisect_right(self._order, (-after[0], after[1])) if after else 0
+            return [(place_id, -negative) for negative, place_id in self._order[start:start + limit]]
+
+    def iter_top(self, after: Optional[Tuple[float, str]] = None,
+                 chunk: int = 256) -> Iterator[Tuple[str, float]]:
+        """Every place after ``after``, best first, read ``chunk`` at a time."""
+        while True:
+            page = self.top(chunk, after)
+            yield from page
+            if len(page) < chunk:
+                return
+            place_id, score = page[-1]
+            after = (score, place_id)
@@ -0,0 +1,233 @@
+"""
+Feature vectors of places for "similar places" recommendations.
+
+Each place becomes a unit-length vector of three weighted blocks:
+
+- amenities: one-hot over ``amenity_ids``, scaled to the block weight;
+- price: the z-score of ``log1p(price)`` (clipped to +-3), with the
+  mean and deviation of the last rebuild;
+- location: the point on the unit sphere, so nearby places align.
+
+Similarity is the cosine of two vectors. The dense features (price z,
+x, y, z and the norm) are rows of one contiguous ``array('d')`` matrix,
+used to score candidates exactly.
+
+Candidates come from a batched pass over the whole catalogue without a
+per-place Python loop: every feature is also a column of 32-bit
+fixed-point lanes in a ``bytearray`` (one lane per row, updated in
+place), and a query multiplies each column, read as one big integer,
+by its own quantized component and sums them. Big-int arithmetic then
+computes every place's dot product at once, lane by lane: terms are
+non-negative (negative components live in a separate column), the
+negative products are subtracted from the positive ones plus an offset
+in every lane, and the vectors being unit length bounds each lane, so
+lanes never carry or borrow into each other. The best ``rerank`` times
+``k`` lanes are then re-scored exactly from the float matrix.
+"""
+from __future__ import annotations
+import heapq
+import math
+import sys
+from array import array
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from hbnb.indexes.kdtree import to_unit_vector
+from .base import PlaceIndex, PlaceRecord
+
+# Fixed-point scale of the vector components in the lanes: a product of
+# two components is at most SCALE^2 and a lane sums to about that
+SCALE = 1 << 12
+_LANE = 4
+# Added to every lane so that subtracting the negative products never borrows
+_OFFSET = SCALE * SCALE * 2
+# Dense row: price z-score, x, y, z, vector norm
+_DENSE = 5
+_LANE_CODE = next(code for code in "IL" if array(code).itemsize == _LANE)
+
+
+class PlaceSimilarity(PlaceIndex):
+    """Cosine similarity index over amenity, price and location features."""
+
+    name = "similar"
+
+    def __init__(self, amenity_weight: float = 1.0, price_weight: float = 0.6,
+                 geo_weight: float = 0.6, rerank: int = 4):
+        """
+        Args:
+            amenity_weight, price_weight, geo_weight: Block weights (the
+                norm of each block before the vector is normalized)
+            rerank: Candidates scored exactly, per result
+        """
+        super().__init__()
+        self.weights = (amenity_weight, price_weight, geo_weight)
+        self.rerank = rerank
+        self._price_mean, self._price_std = 0.0, 1.0
+        self.clear()
+
+    def clear(self) -> None:
+        with self.lock:
+            self._rows: Dict[str, int] = {}
+            self._ids: List[Optional[str]] = []
+            self._free: List[int] = []
+            self._amenities: List[FrozenSet[str]] = []
+            self._matrix = array("d")
+            # column key -> lanes; keys are amenity ids, and (dense index,
+            # sign) pairs for the positive and negative parts of the price
+            # and coordinate features
+            self._columns: Dict[object, bytearray] = {}
+            # column key -> its lanes as one int, until the column changes
+            self._ints: Dict[object, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # ----- Features -----
+    def _dense(self, place: PlaceRecord) -> Tuple[float, float, float, float]:
+        z = (math.log1p(max(place.get("price") or 0.0, 0.0)) - self._price_mean) / self._price_std
+        x, y, w = to_unit_vector(place.get("latitude") or 0.0, place.get("longitude") or 0.0)
+        return max(-3.0, min(3.0, z)), x, y, w
+
+    def _norm(self, amenities: FrozenSet[str], dense: Tuple[float, ...]) -> float:
+        amenity_weight, price_weight, geo_weight = self.weights
+        squared = (amenity_weight ** 2 if amenities else 0.0) + (price_weight * dense[0]) ** 2 \
+            + geo_weight ** 2
+        return math.sqrt(squared) or 1.0
+
+    def _vector(self, amenities: FrozenSet[str], dense: Tuple[float, ...],
+                norm: float) -> Dict[object, float]:
+        """Normalized vector as column key -> non-negative component."""
+        amenity_weight, price_weight, geo_weight = self.weights
+        vector: Dict[object, float] = {}
+        if amenities:
+            share = amenity_weight / math.sqrt(len(amenities)) / norm
+            for amenity_id in amenities:
+                vector[amenity_id] = share
+        for i, (value, weight) in enumerate(zip(dense, (price_weight, geo_weight, geo_weight,
+                                                         geo_weight))):
+            value *= weight / norm
+            if value:
+                vector[(i, value > 0)] = abs(value)
+        return vector
+
+    def _row_vector(self, row: int) -> Dict[object, float]:
+        dense = tuple(self._matrix[row * _DENSE:row * _DENSE + 4])
+        return self._vector(self._amenities[row], dense, self._matrix[row * _DENSE + 4])
+
+    # ----- Maintenance -----
+    def add(self, place: PlaceRecord) -> None:
+        amenities = frozenset(place.get("amenity_ids") or ())
+        dense = self._dense(place)
+        norm = self._norm(amenities, dense)
+        with self.lock:
+            row = self._rows.get(place["id"])
+            if row is None:
+                row = self._assign(place["id"])
+            else:
+                self._write_lanes(row, self._row_vector(row), clear=True)
+            self._amenities[row] = amenities
+            self._matrix[row * _DENSE:(row + 1) * _DENSE] = array("d", dense + (norm,))
+            self._write_lanes(row, self._vector(amenities, dense, norm))
+
+    def remove(self, place_id: str) -> None:
+        with self.lock:
+            row = self._rows.pop(place_id, None)
+            if row is None:
+                return
+            self._write_lanes(row, self._row_vector(row), clear=True)
+            self._ids[row] = None
+            self._amenities[row] = frozenset()
+            heapq.heappush(self._free, row)
+
+    def rebuild(self, places: Iterable[PlaceRecord]) -> None:
+        places = list(places)
+        logs = [math.log1p(max(p.get("price") or 0.0, 0.0)) for p in places]
+        with self.lock:
+            self.clear()
+            if logs:
+                self._price_mean = sum(logs) / len(logs)
+                variance = sum((v - self._price_mean) ** 2 for v in logs) / len(logs)
+                self._price_std = math.sqrt(variance) or 1.0
+            for place in places:
+                self.add(place)
+
+    def _assign(self, place_id: str) -> int:
+        # Reuse the lowest freed row so the matrix stays dense
+        if self._free:
+            row = heapq.heappop(self._free)
+            self._ids[row] = place_id
+        else:
+            row = len(self._ids)
+            self._ids.append(place_id)
+            self._amenities.append(frozenset())
+            self._matrix.extend([0.0] * _DENSE)
+            for lanes in self._columns.values():
+                lanes.extend(bytes(_LANE))
+            self._ints.clear()
+        self._rows[place_id] = row
+        return row
+
+    def _write_lanes(self, row: int, vector: Dict[object, float], clear: bool = False) -> None:
+        start = row * _LANE
+        for key, value in vector.items():
+            lanes = self._columns.get(key)
+            if lanes is None:
+                lanes = self._columns[key] = bytearray(len(self._ids) * _LANE)
+            lanes[start:start + _LANE] = (0 if clear else round(value * SCALE)).to_bytes(_LANE, "little")
+            self._ints.pop(key, None)
+
+    def _int(self, key: object) -> int:
+        value = self._ints.get(key)
+        if value is None:
+            lanes = self._columns.get(key)
+            value = self._ints[key] = int.from_bytes(lanes, "little") if lanes is not None else 0
+        return value
+
+    # ----- Queries -----
+    def similar(self, place_id: str, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        The ``k`` places most similar to a place, with their cosine.
+
+        Returns:
+            ``(id, similarity)`` pairs, most similar first; [] for an
+            unknown place
+        """
+        with self.lock:
+            row = self._rows.get(place_id)
+            if row is None or k <= 0:
+                return []
+            scores = self._approximate(self._row_vector(row))
+            candidates = heapq.nlargest(k * self.rerank + 1, range(len(scores)),
+                                        key=scores.__getitem__)
+            exact = [(self._cosine(row, other), self._ids[other]) for other in candidates
+                     if other != row and self._ids[other] is not None]
+        exact.sort(key=lambda pair: (-pair[0], pair[1]))
+        return [(other_id, similarity) for similarity, other_id in exact[:k]]
+
+    def _approximate(self, vector: Dict[object, float]) -> array:
+        """Fixed-point dot product (plus _OFFSET) of ``vector`` with every row."""
+        rows = len(self._ids)
+        positive = int.from_bytes(_OFFSET.to_bytes(_LANE, "little") * rows, "little")
+        negative = 0
+        for key, value in vector.items():
+            weight = round(value * SCALE)
+            if isinstance(key, tuple):
+                # Same-sign parts add up, opposite-sign parts subtract
+                index, sign = key
+                positive += weight * self._int(key)
+                negative += weight * self._int((index, not sign))
+            else:
+                positive += weight * self._int(key)
+        lanes = array(_LANE_CODE, (positive - negative).to_bytes(rows * _LANE, "little"))
+        if sys.byteorder == "big":
+            lanes.byteswap()
+        return lanes
+
+    def _cosine(self, row: int, other: int) -> float:
+        amenity_weight, price_weight, geo_weight = self.weights
+        matrix = self._matrix
+        a, b = row * _DENSE, other * _DENSE
+        dot = price_weight ** 2 * matrix[a] * matrix[b] + geo_weight ** 2 * (
+            matrix[a + 1] * matrix[b + 1] + matrix[a + 2] * matrix[b + 2] + matrix[a + 3] * matrix[b + 3])
+        mine, theirs = self._amenities[row], self._amenities[other]
+        if mine and theirs:
+            dot += amenity_weight ** 2 * len(mine & theirs) / math.sqrt(len(mine) * len(theirs))
+        return dot / (matrix[a + 4] * matrix[b + 4])
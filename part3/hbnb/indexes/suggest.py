@@ -0,0 +1,187 @@
+"""
+Prefix index over place names for as-you-type suggestions.
+
+Names are folded with the full-text tokenizer and indexed once per word
+start ("cosy mountain cabin", "mountain cabin", "cabin"), so a prefix
+matches the beginning of any word and may span several words. The keys
+live in one bisect-sorted list of ``(key, id)`` pairs: a prefix is the
+contiguous range between ``prefix`` and ``prefix + U+10FFFF``.
+
+Matches are ranked by review count. Short prefixes match many places,
+so the best ``max_limit`` ids of the short prefixes (ranked in one pass
+on rebuild) and of any range wider than ``cache_threshold`` are kept
+and updated by writes; only a write pushing a place out of a full list
+makes that prefix be ranked again.
+"""
+from __future__ import annotations
+import heapq
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Set, Tuple
+from hbnb.text import tokenize
+from .base import PlaceIndex, PlaceRecord
+
+_END = "\U0010ffff"
+
+
+def name_keys(name: str | None) -> Tuple[str, ...]:
+    """The folded name from each word start on."""
+    tokens = tokenize(name)
+    return tuple(" ".join(tokens[i:]) for i in range(len(tokens)))
+
+
+class PlaceSuggester(PlaceIndex):
+    """Autocomplete index of place names, ranked by review count."""
+
+    name = "suggest"
+
+    def __init__(self, max_limit: int = 25, cache_threshold: int = 256, warm_length: int = 3):
+        """
+        Args:
+            max_limit: Largest number of suggestions served
+            cache_threshold: Memoize prefixes matching more keys than this
+            warm_length: Prefixes up to this length are ranked during rebuilds
+        """
+        super().__init__()
+        self.max_limit = max_limit
+        self.cache_threshold = cache_threshold
+        self.warm_length = warm_length
+        self.clear()
+
+    def clear(self) -> None:
+        with self.lock:
+            self._keys: List[Tuple[str, str]] = []
+            # id -> (keys, name, review_count)
+            self._entries: Dict[str, Tuple[Tuple[str, ...], str, int]] = {}
+            # id -> sort key, best first
+            self._ranks: Dict[str, Tuple[int, str, str]] = {}
+            # prefix -> best ids, best first; a list shorter than max_limit
+            # holds every match, a full one beats every match left out
+            self._top: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ----- Maintenance -----
+    def add(self, place: PlaceRecord) -> None:
+        place_id = place["id"]
+        name = place.get("name") or ""
+        entry = (name_keys(name), name, place.get("review_count") or 0)
+        with self.lock:
+            old = self._entries.get(place_id)
+            if old == entry:
+                return
+            if not entry[0]:
+                self.remove(place_id)
+                return
+            old_keys = old[0] if old else ()
+            if old_keys != entry[0]:
+                for key in old_keys:
+                    self._delete_key(key, place_id)
+                for key in entry[0]:
+                    insort(self._keys, (key, place_id))
+            self._entries[place_id] = entry
+            self._ranks[place_id] = (-entry[2], entry[1].lower(), place_id)
+            old_prefixes = _prefixes(old_keys)
+            for prefix in old_prefixes - _prefixes(entry[0]):
+                self._top_removed(prefix, place_id)
+            for prefix in _prefixes(entry[0]):
+                self._top_changed(prefix, place_id, prefix in old_prefixes)
+
+    def remove(self, place_id: str) -> None:
+        with self.lock:
+            entry = self._entries.pop(place_id, None)
+            if entry is None:
+                return
+            del self._ranks[place_id]
+            for key in entry[0]:
+                self._delete_key(key, place_id)
+            for prefix in _prefixes(entry[0]):
+                self._top_removed(prefix, place_id)
+
+    def rebuild(self, places) -> None:
+        with self.lock:
+            self.clear()
+            for place in places:
+                name = place.get("name") or ""
+                keys = name_keys(name)
+                if keys:
+                    review_count = place.get("review_count") or 0
+                    self._entries[place["id"]] = (keys, name, review_count)
+                    self._ranks[place["id"]] = (-review_count, name.lower(), place["id"])
+            self._keys = sorted((key, place_id) for place_id, (keys, _, _) in self._entries.items()
+                                for key in keys)
+            # Rank the short prefixes (the widest ranges) in one pass
+            for place_id in sorted(self._entries, key=self._ranks.__getitem__):
+                for prefix in _prefixes(self._entries[place_id][0], self.warm_length):
+                    top = self._top.setdefault(prefix, [])
+                    if len(top) < self.max_limit:
+                        top.append(place_id)
+
+    def _delete_key(self, key: str, place_id: str) -> None:
+        i = bisect_left(self._keys, (key, place_id))
+        if i < len(self._keys) and self._keys[i] == (key, place_id):
+            del self._keys[i]
+
+    def _top_removed(self, prefix: str, place_id: str) -> None:
+        top = self._top.get(prefix)
+        if top is None or place_id not in top:
+            return
+        if len(top) < self.max_limit:
+            top.remove(place_id)
+        else:
+            # Its successor is unknown: rank the prefix again when asked
+            del self._top[prefix]
+
+    def _top_changed(self, prefix: str, place_id: str, matched_before: bool) -> None:
+        top = self._top.get(prefix)
+        if top is None:
+            return
+        complete = len(top) < self.max_limit
+        if matched_before and place_id in top:
+            top.remove(place_id)
+        ranks = self._ranks
+        if complete or (top and ranks[place_id] < ranks[top[-1]]):
+            top.append(place_id)
+            top.sort(key=ranks.__getitem__)
+            del top[self.max_limit:]
+        elif matched_before and len(top) == self.max_limit - 1:
+            # It dropped out of a full list: a left-out match may now beat it
+            del self._top[prefix]
+
+    # ----- Queries -----
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Places with a name word starting with ``prefix``.
+
+        Returns:
+            Up to ``limit`` (capped at ``max_limit``) ``{id, name,
+            review_count}`` dicts, most reviewed first
+        """
+        key = " ".join(tokenize(prefix))
+        if not key or limit <= 0:
+            return []
+        with self.lock:
+            top = self._top.get(key)
+            if top is None:
+                top = self._rank(key)
+            entries = self._entries
+            return [{"id": place_id, "name": entries[place_id][1],
+                     "review_count": entries[place_id][2]}
+                    for place_id in top[:min(limit, self.max_limit)]]
+
+    def _rank(self, key: str) -> List[str]:
+        keys = self._keys
+        lo = bisect_left(keys, (key,))
+        hi = bisect_left(keys, (key + _END,), lo)
+        ranks = self._ranks
+        top = heapq.nsmallest(self.max_limit, {ranks[place_id] for _, place_id in keys[lo:hi]})
+        top = [rank[2] for rank in top]
+        if hi - lo > self.cache_threshold:
+            self._top[key] = top
+        return top
+
+
+def _prefixes(keys: Tuple[str, ...], max_length: int | None = None) -> Set[str]:
+    """Every non-empty prefix of ``keys`` (up to ``max_length`` characters)."""
+    return {key[:end] for key in keys
+            for end in range(1, min(len(key), max_length or len(key)) + 1)}
@@ -3,8 +3,9 @@ Persistence layer package
 """
 from hbnb.persistence.memory_repo import MemoryRepository
 from hbnb.persistence.sqlalchemy_repo import SQLAlchemyRepository
+from hbnb.persistence.query import QuerySpec
 
 # Create singleton instance
 repository = MemoryRepository()
 
-__all__ = ['MemoryRepository', 'SQLAlchemyRepository', 'repository']
+__all__ = ['MemoryRepository', 'SQLAlchemyRepository', 'QuerySpec', 'repository']
@@ -0,0 +1,522 @@
+"""
+Read-through entity cache in front of a repository.
+
+CachedRepository wraps any repository and serves ``get`` / ``get_many`` /
+``exists_many`` for hot classes (users, amenities, places) from a cache
+backend. Two backends share one small interface:
+
+- LRUCache: in-process, bounded by entry count and TTL
+- SharedCache: adapter over a Redis-style client so several workers see
+  the same entries; LocalSharedClient is an in-process stand-in for it
+
+Users are never cached in the shared backend: pickled entities carry
+every column, password hashes included, and a shared server is readable
+by every process (and anyone) with access to it.
+
+Entities are stored pickled, so every hit is a detached copy: callers may
+mutate it freely (the facade does, before ``update``) without touching
+the cached value. Writes invalidate the affected keys. Inside a unit of
+work, keys written so far bypass the cache until the unit ends, so
+uncommitted rows are never cached; they are invalidated once more after
+the commit to drop anything another worker cached in between.
+"""
+from __future__ import annotations
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, TypeVar
+from .query import QuerySpec
+
+T = TypeVar("T")
+
+# Classes cached by default (read far more often than written)
+DEFAULT_CACHED = ("User", "Amenity", "Place")
+
+# Classes holding secrets (password hashes), kept out of shared backends
+PRIVATE_CLASSES = frozenset({"User"})
+
+# Deleting a row of the key class also deletes rows of these classes
+# (ORM cascades), found through the given foreign key.
+CASCADES: Dict[str, List[Tuple[str, str]]] = {
+    "User": [("Place", "owner_id")],
+}
+
+
+class LRUCache:
+    """
+    In-process LRU cache with a size bound and a per-entry TTL.
+
+    Thread safe; expired entries are dropped lazily when read and count
+    as evictions, like entries pushed out by the size bound.
+    """
+
+    # Entries live in this process only
+    shared = False
+
+    def __init__(self, max_entries: int = 10000, ttl: Optional[float] = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_entries: Maximum number of entries kept
+            ttl: Seconds an entry stays valid (None for no expiry)
+            clock: Time source, injectable for tests
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value or None."""
+        with self._lock:
+            return self._get(key, self._clock())
+
+    def _get(self, key: str, now: float) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires, value = entry
+        if expires is not None and expires <= now:
+            del self._entries[key]
+            self.evictions += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return the cached values of ``keys`` that are present."""
+        found = {}
+        with self._lock:
+            now = self._clock()
+            for key in keys:
+                value = self._get(key, now)
+                if value is not None:
+                    found[key] = value
+        return found
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Store values, evicting the least recently used past the bound."""
+        with self._lock:
+            expires = None if self.ttl is None else self._clock() + self.ttl
+            for key, value in items.items():
+                self._entries[key] = (expires, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def set(self, key: str, value: Any) -> None:
+        self.set_many({key: value})
+
+    def delete(self, keys: Iterable[str]) -> None:
+        """Drop ``keys`` if present."""
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction/invalidation counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
+
+
+class LocalSharedClient:
+    """
+    In-process stand-in for a Redis client (get/mget/set/delete/scan_iter).
+
+    Lets SharedCache run in development and tests without a server; with
+    several workers, point CACHE_URL at a real shared instance instead.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._data: Dict[str, Tuple[Optional[float], bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(name)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires <= self._clock():
+                del self._data[name]
+                return None
+            return value
+
+    def mget(self, names: List[str]) -> List[Optional[bytes]]:
+        return [self.get(name) for name in names]
+
+    def set(self, name: str, value: bytes, ex: Optional[float] = None) -> bool:
+        with self._lock:
+            self._data[name] = (None if ex is None else self._clock() + ex, value)
+        return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(name, None) is not None for name in names)
+
+    def scan_iter(self, match: str) -> Iterator[str]:
+        prefix = match.rstrip("*")
+        with self._lock:
+            names = [name for name in self._data if name.startswith(prefix)]
+        return iter(names)
+
+
+class SharedCache:
+    """
+    Cache backend over a shared Redis-style client.
+
+    Entries expire server side after ``ttl`` seconds and are evicted by
+    the server's own policy, so ``evictions`` is not observable here and
+    stays 0; hits, misses and invalidations are counted per process.
+    """
+
+    # Entries are readable by every process using the server
+    shared = True
+
+    def __init__(self, client, namespace: str = "hbnb", ttl: Optional[int] = 300):
+        """
+        Args:
+            client: Object with get/mget/set(ex=)/delete(*names)/scan_iter
+            namespace: Key prefix separating this app from other users
+            ttl: Seconds an entry stays valid (None for no expiry)
+        """
+        self._client = client
+        self._prefix = f"{namespace}:"
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.invalidations = 0
+
+    def _count(self, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        values = self._client.mget([self._prefix + key for key in keys])
+        found = {key: value for key, value in zip(keys, values) if value is not None}
+        self._count(len(found), len(keys) - len(found))
+        return found
+
+    def set_many(self, items: Dict[str, bytes]) -> None:
+        for key, value in items.items():
+            self._client.set(self._prefix + key, value, ex=self.ttl)
+
+    def set(self, key: str, value: bytes) -> None:
+        self.set_many({key: value})
+
+    def delete(self, keys: Iterable[str]) -> None:
+        names = [self._prefix + key for key in keys]
+        if names:
+            removed = self._client.delete(*names)
+            with self._lock:
+                self.invalidations += removed
+
+    def clear(self) -> None:
+        names = list(self._client.scan_iter(match=self._prefix + "*"))
+        if names:
+            self._client.delete(*names)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": 0,
+                "invalidations": self.invalidations,
+            }
+
+
+def make_cache(backend: Optional[str], max_entries: int = 10000,
+               ttl: Optional[float] = 300.0, url: Optional[str] = None,
+               local: bool = True):
+    """
+    Build a cache backend from configuration.
+
+    Args:
+        backend: "lru", "shared" or None/"none" to disable caching
+        max_entries: Size bound of the LRU backend
+        ttl: Entry lifetime in seconds
+        url: Redis URL for the shared backend; without one the
+            in-process LocalSharedClient is used
+        local: Whether the shared backend may use LocalSharedClient.
+            Its entries are private to the process, so other workers
+            would keep serving entities invalidated here.
+
+    Returns:
+        The backend, or None when caching is disabled
+
+    Raises:
+        RuntimeError: If a shared backend has no url and local is False
+    """
+    if not backend or backend == "none":
+        return None
+    if backend == "lru":
+        return LRUCache(max_entries=max_entries, ttl=ttl)
+    if backend == "shared":
+        if url:
+            try:
+                import redis
+            except ImportError as exc:
+                raise RuntimeError("CACHE_URL requires the 'redis' package") from exc
+            client = redis.Redis.from_url(url)
+        elif local:
+            client = LocalSharedClient()
+        else:
+            raise RuntimeError("the shared cache backend requires CACHE_URL")
+        return SharedCache(client, ttl=None if ttl is None else int(ttl))
+    raise ValueError(f"unknown cache backend {backend!r}")
+
+
+class CachedRepository:
+    """
+    Repository wrapper adding a read-through cache for selected classes.
+
+    Every method not defined here (list, stream, add_many, get_by_email,
+    ...) is delegated to the wrapped repository unchanged.
+    """
+
+    def __init__(self, repo, cache, classes: Optional[Iterable[str]] = None):
+        """
+        Args:
+            repo: The repository to wrap
+            cache: LRUCache, SharedCache or any object with the same interface
+            classes: Names of the model classes to cache; defaults to
+                DEFAULT_CACHED, less PRIVATE_CLASSES on a shared backend
+
+        Raises:
+            ValueError: If a private class is to be cached in a shared backend
+        """
+        shared = getattr(cache, "shared", False)
+        if classes is None:
+            classes = [name for name in DEFAULT_CACHED
+                       if not (shared and name in PRIVATE_CLASSES)]
+        classes = frozenset(classes)
+        if shared and classes & PRIVATE_CLASSES:
+            raise ValueError(f"{', '.join(sorted(classes & PRIVATE_CLASSES))} "
+                             f"cannot be cached in a shared backend")
+        self.repo = repo
+        self.cache = cache
+        self.classes = classes
+        # Keys written inside the current unit of work, per thread
+        self._dirty = threading.local()
+
+    def __getattr__(self, name: str):
+        return getattr(self.repo, name)
+
+    # ===== Keys and state =====
+    @staticmethod
+    def _key(cls_name: str, obj_id: str) -> str:
+        return f"{cls_name}:{obj_id}"
+
+    def _cached(self, cls: Type) -> bool:
+        return cls.__name__ in self.classes
+
+    def _dirty_keys(self) -> Set[str]:
+        keys = getattr(self._dirty, "keys", None)
+        if keys is None:
+            keys = self._dirty.keys = set()
+        return keys
+
+    def _in_unit(self) -> bool:
+        in_unit = getattr(self.repo, "in_unit_of_work", None)
+        return bool(in_unit and in_unit())
+
+    def _invalidate(self, cls_name: str, obj_ids: Iterable[str]) -> None:
+        """Drop keys now and remember them until the write is committed."""
+        keys = [self._key(cls_name, obj_id) for obj_id in obj_ids]
+        self.cache.delete(keys)
+        self._dirty_keys().update(keys)
+
+    def _store(self, cls_name: str, objs: Iterable[Any]) -> None:
+        dirty = self._dirty_keys() if self._in_unit() else ()
+        items = {}
+        for obj in objs:
+            key = self._key(cls_name, obj.id)
+            if key not in dirty:
+                items[key] = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+        if items:
+            self.cache.set_many(items)
+
+    def _flush_dirty(self) -> None:
+        """Once nothing is left uncommitted, drop the written keys again."""
+        if self._in_unit():
+            return
+        keys = self._dirty_keys()
+        if keys:
+            self.cache.delete(list(keys))
+            keys.clear()
+
+    # ===== Unit of work =====
+    def begin(self) -> None:
+        self.repo.begin()
+
+    def end(self, error: bool = False) -> None:
+        try:
+            self.repo.end(error=error)
+        finally:
+            self._flush_dirty()
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator["CachedRepository"]:
+        try:
+            with self.repo.unit_of_work():
+                yield self
+        finally:
+            self._flush_dirty()
+
+    # ===== Reads =====
+    def get(self, cls: Type[T], obj_id: str) -> Optional[T]:
+        return self.get_many(cls, [obj_id]).get(obj_id)
+
+    def get_many(self, cls: Type[T], obj_ids: Iterable[str]) -> Dict[str, T]:
+        """Serve cached ids from the cache and load the rest in one batch."""
+        if not self._cached(cls):
+            return self.repo.get_many(cls, obj_ids)
+        name = cls.__name__
+        wanted = {obj_id for obj_id in obj_ids if obj_id is not None}
+        dirty = self._dirty_keys() if self._in_unit() else ()
+        keys = {self._key(name, obj_id): obj_id for obj_id in wanted}
+        hits = self.cache.get_many(key for key in keys if key not in dirty)
+        found = {keys[key]: pickle.loads(value) for key, value in hits.items()}
+        missing = wanted - found.keys()
+        if missing:
+            loaded = self.repo.get_many(cls, missing)
+            self._store(name, loaded.values())
+            found.update(loaded)
+        return found
+
+    def exists_many(self, cls: Type[T], obj_ids: Iterable[str]) -> Set[str]:
+        """Ids present in the cache exist; only the others are checked."""
+        if not self._cached(cls):
+            return self.repo.exists_many(cls, obj_ids)
+        name = cls.__name__
+        wanted = set(obj_ids)
+        dirty = self._dirty_keys() if self._in_unit() else ()
+        keys = {self._key(name, obj_id): obj_id for obj_id in wanted if obj_id is not None}
+        found = {keys[key] for key in self.cache.get_many(k for k in keys if k not in dirty)}
+        missing = wanted - found
+        if missing:
+            found |= self.repo.exists_many(cls, missing)
+        return found
+
+    # ===== Writes =====
+    def add(self, obj: T) -> T:
+        self.repo.add(obj)
+        if self._cached(type(obj)):
+            self._invalidate(type(obj).__name__, [obj.id])
+        self._flush_dirty()
+        return obj
+
+    def update(self, obj: T) -> T:
+        if self._cached(type(obj)):
+            self._invalidate(type(obj).__name__, [obj.id])
+        try:
+            return self.repo.update(obj)
+        finally:
+            self._flush_dirty()
+
+    def increment(self, cls: Type[T], obj_id: str, deltas: Dict[str, float],
+                  averages: Optional[Dict[str, tuple]] = None) -> bool:
+        if self._cached(cls):
+            self._invalidate(cls.__name__, [obj_id])
+        try:
+            return self.repo.increment(cls, obj_id, deltas, averages)
+        finally:
+            self._flush_dirty()
+
+    def delete(self, cls: Type[T], obj_id: str) -> None:
+        self._invalidate_cascades(cls, [obj_id])
+        if self._cached(cls):
+            self._invalidate(cls.__name__, [obj_id])
+        try:
+            self.repo.delete(cls, obj_id)
+        finally:
+            self._flush_dirty()
+
+    def add_many(self, objs: Iterable[T]) -> int:
+        objs = list(objs)
+        try:
+            count = self.repo.add_many(objs)
+            self._invalidate_objects(objs)
+        finally:
+            self._flush_dirty()
+        return count
+
+    def update_many(self, objs: Iterable[T]) -> int:
+        objs = list(objs)
+        self._invalidate_objects(objs)
+        try:
+            return self.repo.update_many(objs)
+        finally:
+            self._flush_dirty()
+
+    def delete_many(self, cls: Type[T], obj_ids: Iterable[str]) -> int:
+        obj_ids = list(obj_ids)
+        self._invalidate_cascades(cls, obj_ids)
+        if self._cached(cls):
+            self._invalidate(cls.__name__, obj_ids)
+        try:
+            return self.repo.delete_many(cls, obj_ids)
+        finally:
+            self._flush_dirty()
+
+    def _invalidate_objects(self, objs: List[Any]) -> None:
+        by_class: Dict[str, List[str]] = {}
+        for obj in objs:
+            if self._cached(type(obj)) and obj.id is not None:
+                by_class.setdefault(type(obj).__name__, []).append(obj.id)
+        for name, ids in by_class.items():
+            self._invalidate(name, ids)
+
+    def _invalidate_cascades(self, cls: Type, obj_ids: List[str]) -> None:
+        """Drop cached children that the database deletes along with ``cls``."""
+        for child_name, foreign_key in CASCADES.get(cls.__name__, ()):
+            if child_name not in self.classes:
+                continue
+            child = self._model(cls, child_name)
+            if child is None:
+                continue
+            children = self.repo.list(child, query=QuerySpec().where_in(foreign_key, obj_ids))
+            self._invalidate(child_name, [c.id for c in children])
+
+    @staticmethod
+    def _model(cls: Type, name: str) -> Optional[Type]:
+        registry = getattr(cls, "registry", None)
+        if registry is None:
+            return None
+        for mapper in registry.mappers:
+            if mapper.class_.__name__ == name:
+                return mapper.class_
+        return None
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Counters of the underlying cache backend."""
+        return self.cache.stats()
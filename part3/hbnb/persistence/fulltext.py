@@ -0,0 +1,92 @@
+"""
+SQLite FTS5 full-text index for text columns.
+
+For every table in TEXT_TABLES, a ``<table>_fts`` external-content FTS5
+table indexes the listed columns, keyed by the row's rowid and kept in
+sync by triggers (like the R*Trees in ``spatial``). The table stores
+only the index; matched rows are read back from the base table.
+SQLAlchemyRepository.search() ranks matches with ``bm25()``; other
+databases fall back to LIKE predicates without ranking.
+
+Rows written before the index existed are indexed when it is created;
+run ``install_fulltext_indexes(connection, rebuild=True)`` (or ``flask
+index rebuild``) after a VACUUM or bulk loads that bypassed the triggers.
+"""
+from __future__ import annotations
+from typing import Dict
+from sqlalchemy import Column, Integer, MetaData, Table, Text, event, text
+from sqlalchemy.exc import OperationalError
+from hbnb.bl.base import Base
+
+# Table name -> {column: BM25 weight}
+TEXT_TABLES: Dict[str, Dict[str, float]] = {
+    "places": {"name": 2.0, "description": 1.0},
+}
+
+# Kept out of Base.metadata: create_all() must not try to create these
+_fts_metadata = MetaData()
+
+
+def fts_name(table: str) -> str:
+    return f"{table}_fts"
+
+
+def fts_table(table: str) -> Table:
+    """Core Table describing the FTS5 index of ``table`` (for queries)."""
+    name = fts_name(table)
+    if name not in _fts_metadata.tables:
+        Table(name, _fts_metadata, Column("rowid", Integer, primary_key=True),
+              *(Column(column, Text) for column in TEXT_TABLES[table]))
+    return _fts_metadata.tables[name]
+
+
+def _statements(table: str, columns):
+    fts = fts_name(table)
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    insert = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.rowid, {new});"
+    delete = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.rowid, {old});"
+    yield (f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({names}, "
+           f"content='{table}', content_rowid='rowid', "
+           f"tokenize='unicode61 remove_diacritics 2')")
+    yield f"CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} BEGIN {insert} END"
+    yield f"CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} BEGIN {delete} END"
+    yield (f"CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {names} ON {table} "
+           f"BEGIN {delete} {insert} END")
+
+
+def install_fulltext_indexes(connection, rebuild: bool = False) -> bool:
+    """
+    Create the FTS5 tables and triggers, indexing existing rows on creation.
+
+    Idempotent; a no-op outside SQLite or without the fts5 module.
+
+    Args:
+        connection: SQLAlchemy Connection
+        rebuild: Re-index every row even if the index already existed
+
+    Returns:
+        True if the full-text indexes are in place
+    """
+    if connection.dialect.name != "sqlite":
+        return False
+    for table, weights in TEXT_TABLES.items():
+        if not connection.dialect.has_table(connection, table):
+            continue
+        fts = fts_name(table)
+        existed = connection.dialect.has_table(connection, fts)
+        try:
+            for statement in _statements(table, list(weights)):
+                connection.execute(text(statement))
+        except OperationalError:
+            # SQLite built without FTS5: use LIKE predicates
+            return False
+        if rebuild or not existed:
+            connection.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+    return True
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_after_create(target, connection, **kw):
+    install_fulltext_indexes(connection)
@@ -0,0 +1,349 @@
+"""
+Secondary indexes for MemoryRepository.
+
+HashIndex maps an attribute value to the ids of the objects holding it;
+SortedIndex keeps ids ordered by an attribute for ranges and top-k;
+GridIndex buckets points into fixed-size lat/lng cells for box searches;
+TextIndex is an inverted index over text fields with BM25 ranking.
+The value seen at indexing time is remembered per id, because the facade
+mutates objects in place before calling ``update``; the old entry can
+then still be found and moved.
+"""
+from __future__ import annotations
+import heapq
+import math
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from hbnb.geo import BBox, in_bbox, lng_ranges
+from hbnb.text import bm25_idf, bm25_term, tokenize
+
+
+class HashIndex:
+    """Equality index on one attribute, optionally unique."""
+
+    def __init__(self, field: str, unique: bool = False):
+        self.field = field
+        self.unique = unique
+        self._entries: Dict[Any, Set[str]] = {}
+        self._values: Dict[str, Any] = {}
+
+    def check(self, obj) -> None:
+        """Raise ValueError if indexing ``obj`` would break uniqueness."""
+        if not self.unique:
+            return
+        value = getattr(obj, self.field, None)
+        holders = self._entries.get(value, ())
+        if any(holder != obj.id for holder in holders):
+            raise ValueError(f"{type(obj).__name__} with {self.field}={value!r} already exists")
+
+    def insert(self, obj) -> None:
+        """Index ``obj`` (or move it if its value changed)."""
+        value = getattr(obj, self.field, None)
+        if obj.id in self._values:
+            if self._values[obj.id] == value:
+                return
+            self.remove(obj.id)
+        self._entries.setdefault(value, set()).add(obj.id)
+        self._values[obj.id] = value
+
+    def remove(self, obj_id: str) -> None:
+        """Drop ``obj_id`` from the index if present."""
+        if obj_id not in self._values:
+            return
+        value = self._values.pop(obj_id)
+        ids = self._entries.get(value)
+        if ids is not None:
+            ids.discard(obj_id)
+            if not ids:
+                del self._entries[value]
+
+    def lookup(self, value: Any) -> Set[str]:
+        """Ids whose indexed value equals ``value``."""
+        return self._entries.get(value, set())
+
+    def lookup_many(self, values: Iterable[Any]) -> Set[str]:
+        """Ids whose indexed value is any of ``values``."""
+        found: Set[str] = set()
+        for value in values:
+            found |= self._entries.get(value, set())
+        return found
+
+
+class _Top:
+    """Sentinel that sorts after every id, for exclusive bisect bounds."""
+
+    def __lt__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return True
+
+
+_TOP = _Top()
+
+
+class SortedIndex:
+    """
+    Ordered index on one attribute, kept as a bisect-sorted list.
+
+    Entries are ``(value, id)`` pairs so equal values stay distinct and in
+    a stable order. None values are kept apart; like SQL NULLs they never
+    match a range and sort before every value.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+        self._keys: List[Tuple[Any, str]] = []
+        self._values: Dict[str, Any] = {}
+        self._nulls: Dict[str, None] = {}
+
+    def check(self, obj) -> None:
+        """Sorted indexes carry no constraints."""
+
+    def insert(self, obj) -> None:
+        """Index ``obj`` (or move it if its value changed)."""
+        value = getattr(obj, self.field, None)
+        if obj.id in self._values:
+            if self._values[obj.id] == value:
+                return
+            self.remove(obj.id)
+        elif obj.id in self._nulls:
+            if value is None:
+                return
+            self.remove(obj.id)
+        if value is None:
+            self._nulls[obj.id] = None
+            return
+        insort(self._keys, (value, obj.id))
+        self._values[obj.id] = value
+
+    def remove(self, obj_id: str) -> None:
+        """Drop ``obj_id`` from the index if present."""
+        if self._nulls.pop(obj_id, 0) is None:
+            return
+        if obj_id not in self._values:
+            return
+        key = (self._values.pop(obj_id), obj_id)
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+
+    def _span(self, low: Any = None, high: Any = None,
+              low_inclusive: bool = True, high_inclusive: bool = True) -> Tuple[int, int]:
+        keys = self._keys
+        if low is None:
+            start = 0
+        elif low_inclusive:
+            start = bisect_left(keys, (low,))
+        else:
+            start = bisect_right(keys, (low, _TOP))
+        if high is None:
+            end = len(keys)
+        elif high_inclusive:
+            end = bisect_right(keys, (high, _TOP))
+        else:
+            end = bisect_left(keys, (high,))
+        return start, max(start, end)
+
+    def count(self, low: Any = None, high: Any = None,
+              low_inclusive: bool = True, high_inclusive: bool = True) -> int:
+        """Number of entries in the range, in O(log n)."""
+        start, end = self._span(low, high, low_inclusive, high_inclusive)
+        return end - start
+
+    def ids(self, low: Any = None, high: Any = None,
+            low_inclusive: bool = True, high_inclusive: bool = True,
+            descending: bool = False, with_nulls: bool = False,
+            after: Optional[Tuple[Any, ...]] = None) -> Iterator[str]:
+        """
+        Lazily yield ids in value order, optionally restricted to a range.
+
+        Args:
+            low, high: Range bounds (None for unbounded)
+            low_inclusive, high_inclusive: Whether bounds are inclusive
+            descending: Walk from the largest value down
+            with_nulls: Also yield ids whose value is None (first ascending,
+                last descending)
+            after: Keyset position, ``(value,)`` or ``(value, id)``; only
+                entries strictly past it in walk order are yielded
+        """
+        start, end = self._span(low, high, low_inclusive, high_inclusive)
+        keys = self._keys
+        if after is not None and after[0] is not None:
+            if descending:
+                key = tuple(after) if len(after) > 1 else (after[0],)
+                end = max(start, min(end, bisect_left(keys, key)))
+            else:
+                key = tuple(after) if len(after) > 1 else (after[0], _TOP)
+                start = min(end, max(start, bisect_right(keys, key)))
+                with_nulls = False
+        if descending:
+            for i in range(end - 1, start - 1, -1):
+                yield keys[i][1]
+            if with_nulls:
+                yield from list(self._nulls)
+        else:
+            if with_nulls:
+                yield from list(self._nulls)
+            for i in range(start, end):
+                yield keys[i][1]
+
+
+class GridIndex:
+    """
+    Spatial index bucketing points into ``cell_deg`` x ``cell_deg`` cells.
+
+    A box query visits only the cells it overlaps and checks the points
+    in them exactly; when a box covers more cells than there are points
+    (continent-sized boxes), the points are scanned instead.
+    """
+
+    def __init__(self, lat_field: str = "latitude", lng_field: str = "longitude",
+                 cell_deg: float = 0.1):
+        self.lat_field = lat_field
+        self.lng_field = lng_field
+        self.cell_deg = cell_deg
+        self._cells: Dict[Tuple[int, int], Set[str]] = {}
+        self._points: Dict[str, Tuple[float, float]] = {}
+
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_deg), math.floor(lng / self.cell_deg)
+
+    def check(self, obj) -> None:
+        """Grid indexes carry no constraints."""
+
+    def insert(self, obj) -> None:
+        """Index ``obj`` (or move it if its coordinates changed)."""
+        lat = getattr(obj, self.lat_field, None)
+        lng = getattr(obj, self.lng_field, None)
+        point = None if lat is None or lng is None else (lat, lng)
+        if self._points.get(obj.id) == point:
+            return
+        self.remove(obj.id)
+        if point is None:
+            return
+        self._points[obj.id] = point
+        self._cells.setdefault(self._cell(*point), set()).add(obj.id)
+
+    def remove(self, obj_id: str) -> None:
+        """Drop ``obj_id`` from the index if present."""
+        point = self._points.pop(obj_id, None)
+        if point is None:
+            return
+        cell = self._cell(*point)
+        ids = self._cells.get(cell)
+        if ids is not None:
+            ids.discard(obj_id)
+            if not ids:
+                del self._cells[cell]
+
+    def point(self, obj_id: str) -> Optional[Tuple[float, float]]:
+        """Indexed ``(lat, lng)`` of an id."""
+        return self._points.get(obj_id)
+
+    def within(self, bbox: BBox) -> List[str]:
+        """Ids of the points inside ``bbox``."""
+        south, _, north, _ = bbox
+        row_low, row_high = math.floor(south / self.cell_deg), math.floor(north / self.cell_deg)
+        spans = [(math.floor(west / self.cell_deg), math.floor(east / self.cell_deg))
+                 for west, east in lng_ranges(bbox)]
+        cells = (row_high - row_low + 1) * sum(high - low + 1 for low, high in spans)
+        if cells > len(self._points):
+            return [i for i, (lat, lng) in self._points.items() if in_bbox(lat, lng, bbox)]
+        found = []
+        points = self._points
+        for row in range(row_low, row_high + 1):
+            for low, high in spans:
+                for col in range(low, high + 1):
+                    for obj_id in self._cells.get((row, col), ()):
+                        if in_bbox(*points[obj_id], bbox):
+                            found.append(obj_id)
+        return found
+
+
+class TextIndex:
+    """
+    Inverted index over text fields, ranked like FTS5's ``bm25()``.
+
+    Postings map a token to ``{id: column-weighted count}``; a search
+    intersects the postings of its tokens (rarest first) and scores only
+    those ids, so its cost follows the matches, not the row count.
+    """
+
+    def __init__(self, weights: Dict[str, float]):
+        """
+        Args:
+            weights: Field -> BM25 column weight
+        """
+        self.weights = weights
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._tokens: Dict[str, Dict[str, float]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def check(self, obj) -> None:
+        """Text indexes carry no constraints."""
+
+    def insert(self, obj) -> None:
+        """Index ``obj`` (or re-index it if its text changed)."""
+        frequencies: Dict[str, float] = {}
+        length = 0
+        for field, weight in self.weights.items():
+            tokens = tokenize(getattr(obj, field, None))
+            length += len(tokens)
+            for token in tokens:
+                frequencies[token] = frequencies.get(token, 0.0) + weight
+        if self._tokens.get(obj.id) == frequencies and self._lengths.get(obj.id) == length:
+            return
+        self.remove(obj.id)
+        for token, frequency in frequencies.items():
+            self._postings.setdefault(token, {})[obj.id] = frequency
+        self._tokens[obj.id] = frequencies
+        self._lengths[obj.id] = length
+        self._total_length += length
+
+    def remove(self, obj_id: str) -> None:
+        """Drop ``obj_id`` from the index if present."""
+        frequencies = self._tokens.pop(obj_id, None)
+        if frequencies is None:
+            return
+        self._total_length -= self._lengths.pop(obj_id)
+        for token in frequencies:
+            postings = self._postings[token]
+            del postings[obj_id]
+            if not postings:
+                del self._postings[token]
+
+    def matching(self, tokens: List[str]) -> Set[str]:
+        """Ids containing every token."""
+        postings = [self._postings.get(token) for token in set(tokens)]
+        if not postings or not all(postings):
+            return set()
+        postings.sort(key=len)
+        ids = set(postings[0])
+        for other in postings[1:]:
+            ids.intersection_update(other)
+            if not ids:
+                break
+        return ids
+
+    def rank(self, tokens: List[str], ids: Iterable[str],
+             limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        ``(id, score)`` for ``ids`` (matches of ``tokens``), best first.
+
+        Scores are BM25 with higher meaning more relevant; ties go by id.
+        """
+        documents = len(self._lengths)
+        average = self._total_length / documents if documents else 0.0
+        idf = {token: bm25_idf(documents, len(self._postings.get(token, ())))
+               for token in set(tokens)}
+        ranked = []
+        for obj_id in ids:
+            length = self._lengths[obj_id]
+            frequencies = self._tokens[obj_id]
+            score = sum(bm25_term(frequencies[token], length, average, idf[token])
+                        for token in tokens)
+            ranked.append((-score, obj_id))
+        ranked = heapq.nsmallest(limit, ranked) if limit is not None else sorted(ranked)
+        return [(obj_id, -score) for score, obj_id in ranked]
@@ -1,19 +1,137 @@
 from __future__ import annotations
-from typing import Dict, Type, TypeVar, List, Optional, Callable
-from dataclasses import asdict
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Type, TypeVar, List, Optional, Callable, Iterator, Iterable, Set, Tuple
+from .query import QuerySpec, EQ, IN, GE, GT, LE, LT
+from .memory_index import HashIndex, SortedIndex, GridIndex, TextIndex
+from hbnb.text import tokenize
 
 T = TypeVar("T")
 
+# Secondary indexes per model class name: field -> unique?
+DEFAULT_INDEXES: Dict[str, Dict[str, bool]] = {
+    "User": {"email": True},
+    "Place": {"owner_id": False},
+    "Review": {"place_id": False, "user_id": False},
+}
+
+# Ordered (range / top-k) indexes per model class name
+DEFAULT_SORTED_INDEXES: Dict[str, List[str]] = {
+    "User": ["created_at"],
+    "Amenity": ["created_at"],
+    "Place": ["price", "created_at", "rating"],
+    "Review": ["rating", "created_at"],
+}
+
+# Spatial (bounding box) indexes per model class name: (lat field, lng field)
+DEFAULT_GEO_INDEXES: Dict[str, Tuple[str, str]] = {
+    "Place": ("latitude", "longitude"),
+}
+
+# Full-text indexes per model class name: field -> BM25 column weight
+DEFAULT_TEXT_INDEXES: Dict[str, Dict[str, float]] = {
+    "Place": {"name": 2.0, "description": 1.0},
+}
+
 class MemoryRepository:
     """Simple in-memory repo keyed by model class name then id."""
 
-    def __init__(self):
+    def __init__(self, indexes: Optional[Dict[str, Dict[str, bool]]] = None,
+                 sorted_indexes: Optional[Dict[str, List[str]]] = None,
+                 geo_indexes: Optional[Dict[str, Tuple[str, str]]] = None,
+                 text_indexes: Optional[Dict[str, Dict[str, float]]] = None):
         self._db: Dict[str, Dict[str, object]] = {}
+        self._indexes: Dict[str, Dict[str, HashIndex]] = {}
+        self._sorted: Dict[str, Dict[str, SortedIndex]] = {}
+        declared_geo = DEFAULT_GEO_INDEXES if geo_indexes is None else geo_indexes
+        self._geo: Dict[str, GridIndex] = {
+            cls_name: GridIndex(lat_field, lng_field)
+            for cls_name, (lat_field, lng_field) in declared_geo.items()
+        }
+        declared_text = DEFAULT_TEXT_INDEXES if text_indexes is None else text_indexes
+        self._text: Dict[str, TextIndex] = {
+            cls_name: TextIndex(weights) for cls_name, weights in declared_text.items()
+        }
+        declared = DEFAULT_INDEXES if indexes is None else indexes
+        for cls_name, fields in declared.items():
+            for field, unique in fields.items():
+                self._indexes.setdefault(cls_name, {})[field] = HashIndex(field, unique)
+        declared_sorted = DEFAULT_SORTED_INDEXES if sorted_indexes is None else sorted_indexes
+        for cls_name, fields in declared_sorted.items():
+            for field in fields:
+                self._sorted.setdefault(cls_name, {})[field] = SortedIndex(field)
 
     def _bucket(self, cls: Type[T]) -> Dict[str, T]:
         return self._db.setdefault(cls.__name__, {})  # type: ignore
 
+    def declare_index(self, cls: Type[T], field: str, unique: bool = False,
+                      ordered: bool = False) -> None:
+        """Add a secondary index on ``cls.field`` and build it from existing rows."""
+        index = SortedIndex(field) if ordered else HashIndex(field, unique)
+        for obj in self._bucket(cls).values():
+            index.check(obj)
+            index.insert(obj)
+        target = self._sorted if ordered else self._indexes
+        target.setdefault(cls.__name__, {})[field] = index
+
+    def _index_for(self, cls: Type[T]) -> Dict[str, HashIndex]:
+        return self._indexes.get(cls.__name__, {})
+
+    def _sorted_for(self, cls: Type[T]) -> Dict[str, SortedIndex]:
+        return self._sorted.get(cls.__name__, {})
+
+    def _reindex(self, obj) -> None:
+        indexes = self._index_for(type(obj)).values()
+        for index in indexes:
+            index.check(obj)
+        for index in indexes:
+            index.insert(obj)
+        for index in self._sorted_for(type(obj)).values():
+            index.insert(obj)
+        grid = self._geo.get(type(obj).__name__)
+        if grid is not None:
+            grid.insert(obj)
+        text = self._text.get(type(obj).__name__)
+        if text is not None:
+            text.insert(obj)
+
+    def _unindex(self, cls: Type[T], obj_id: str) -> None:
+        for index in self._index_for(cls).values():
+            index.remove(obj_id)
+        for index in self._sorted_for(cls).values():
+            index.remove(obj_id)
+        grid = self._geo.get(cls.__name__)
+        if grid is not None:
+            grid.remove(obj_id)
+        text = self._text.get(cls.__name__)
+        if text is not None:
+            text.remove(obj_id)
+
+    @staticmethod
+    def _apply_defaults(obj) -> None:
+        # Column defaults only fire on a database flush; mirror them here.
+        if getattr(obj, "id", None) is None:
+            obj.id = str(uuid.uuid4())
+        now = datetime.utcnow()
+        if hasattr(obj, "created_at") and obj.created_at is None:
+            obj.created_at = now
+        if hasattr(obj, "updated_at") and obj.updated_at is None:
+            obj.updated_at = now
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator["MemoryRepository"]:
+        # Writes are applied immediately; kept for interface parity.
+        yield self
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        # Writes are already visible, so there is nothing to wait for.
+        callback()
+
     def add(self, obj: T) -> T:
+        self._apply_defaults(obj)
+        self._reindex(obj)
         bucket = self._bucket(type(obj))
         bucket[obj.id] = obj
         return obj
@@ -21,18 +139,222 @@ class MemoryRepository:
     def get(self, cls: Type[T], obj_id: str) -> Optional[T]:
         return self._bucket(cls).get(obj_id)  # type: ignore
 
-    def list(self, cls: Type[T], predicate: Optional[Callable[[T], bool]] = None) -> List[T]:
-        values = list(self._bucket(cls).values())  # type: ignore
-        return [v for v in values if predicate(v)] if predicate else values
+    def get_many(self, cls: Type[T], obj_ids: Iterable[str]) -> Dict[str, T]:
+        bucket = self._bucket(cls)
+        return {i: bucket[i] for i in obj_ids if i in bucket}
+
+    def exists_many(self, cls: Type[T], obj_ids: Iterable[str]) -> Set[str]:
+        bucket = self._bucket(cls)
+        return {i for i in obj_ids if i in bucket}
+
+    def list(self, cls: Type[T], predicate: Optional[Callable[[T], bool]] = None,
+             query: Optional[QuerySpec] = None) -> List[T]:
+        return list(self._select(cls, query, predicate))
+
+    def stream(self, cls: Type[T], query: Optional[QuerySpec] = None,
+               batch_size: int = 0) -> Iterator[T]:
+        # batch_size is accepted for parity with SQLAlchemyRepository
+        return self._select(cls, query)
+
+    def rows(self, cls: Type[T], columns: Iterable[str],
+             query: Optional[QuerySpec] = None) -> Iterator[Dict[str, Any]]:
+        """Stored values of ``columns`` (keyed by column name) for the rows matching ``query``."""
+        attributes = [(name, cls.column_attribute(name)) for name in columns]
+        return ({name: getattr(obj, attribute) for name, attribute in attributes}
+                for obj in self._select(cls, query))
+
+    def locate(self, cls: Type[T], query: Optional[QuerySpec] = None,
+               lat_field: str = "latitude", lng_field: str = "longitude") -> List[Tuple[str, float, float]]:
+        """``(id, lat, lng)`` of every row matching ``query``."""
+        if query is not None and query.geo is not None:
+            lat_field, lng_field, _ = query.geo
+        return [(obj.id, getattr(obj, lat_field), getattr(obj, lng_field))
+                for obj in self._select(cls, query)]
+
+    def search(self, cls: Type[T], text: str, query: Optional[QuerySpec] = None,
+               limit: Optional[int] = None) -> List[Tuple[T, float]]:
+        """``(obj, score)`` of the rows containing every token of ``text``
+        and matching ``query``, most relevant first."""
+        index = self._text.get(cls.__name__)
+        if index is None:
+            raise ValueError(f"{cls.__name__} has no text index")
+        tokens = tokenize(text)
+        bucket = self._bucket(cls)
+        ids = index.matching(tokens)
+        if query is not None:
+            ids = [i for i in ids if query.matches(bucket[i])]
+        return [(bucket[i], score) for i, score in index.rank(tokens, ids, limit)]
+
+    def rebuild_text_index(self, cls: Type[T]) -> int:
+        """Re-index every row of ``cls``; returns the number of rows."""
+        index = self._text.get(cls.__name__)
+        if index is None:
+            return 0
+        bucket = self._bucket(cls)
+        self._text[cls.__name__] = index = TextIndex(index.weights)
+        for obj in bucket.values():
+            index.insert(obj)
+        return len(bucket)
+
+    def _select(self, cls: Type[T], query: Optional[QuerySpec],
+                predicate: Optional[Callable[[T], bool]] = None) -> Iterator[T]:
+        values, ordered = self._candidates(cls, query)
+        if predicate:
+            values = (v for v in values if predicate(v))
+        if query is None:
+            return iter(values)
+        if query.ordering and not ordered:
+            return iter(query.apply(values))
+        # Candidates need no sorting: filter lazily and stop at the limit
+        matches = (v for v in values if query.matches(v))
+        return islice(matches, query.max_rows) if query.max_rows is not None else matches
+
+    def _candidates(self, cls: Type[T], query: Optional[QuerySpec]) -> Tuple[Iterable[T], bool]:
+        # Pick the cheapest access path for a spec:
+        #   1. equality/IN on the id or a hash index (smallest match wins),
+        #   2. a range on a sorted index, sized in O(log n) by bisect,
+        #   3. a walk of the sorted index matching a single-field ORDER BY,
+        #      which lets a LIMIT stop after k matches,
+        #   4. the cells of a grid index overlapping a bounding box,
+        #   5. a full scan.
+        # The spec is still applied to the candidates afterwards; the bool
+        # tells the caller whether they are already in spec order.
+        bucket = self._bucket(cls)
+        if query is None:
+            return list(bucket.values()), False  # type: ignore
+
+        indexes = self._index_for(cls)
+        best: Optional[Iterable[str]] = None
+        best_size = len(bucket)
+        for field, op, value in query.conditions:
+            if op not in (EQ, IN):
+                continue
+            values = value if op == IN else [value]
+            if field == "id":
+                ids = dict.fromkeys(values)
+            elif field in indexes:
+                ids = indexes[field].lookup_many(values)
+            else:
+                continue
+            if best is None or len(ids) < best_size:
+                best, best_size = ids, len(ids)
+
+        sorted_indexes = self._sorted_for(cls)
+        ranges = {field: _range_bounds(query, field)
+                  for field, op, _ in query.conditions
+                  if op in (GE, GT, LE, LT) and field in sorted_indexes}
+
+        walk_field = _walkable_ordering(query.ordering, sorted_indexes)
+        if walk_field is not None:
+            field, descending = query.ordering[0]
+            index = sorted_indexes[field]
+            bounds = ranges.get(field)
+            walk_size = index.count(*bounds) if bounds else len(bucket)
+            if best is None or (query.max_rows is not None and walk_size <= best_size) \
+                    or walk_size < best_size:
+                if bounds:
+                    ids = index.ids(*bounds, descending=descending, after=query.after)
+                else:
+                    ids = index.ids(descending=descending, with_nulls=True, after=query.after)
+                return (bucket[i] for i in ids), True  # type: ignore
+
+        for field, bounds in ranges.items():
+            size = sorted_indexes[field].count(*bounds)
+            if size < best_size:
+                best, best_size = sorted_indexes[field].ids(*bounds), size
+
+        grid = self._geo.get(cls.__name__)
+        if query.geo is not None and grid is not None \
+                and query.geo[:2] == (grid.lat_field, grid.lng_field):
+            ids = grid.within(query.geo[2])
+            if len(ids) < best_size:
+                best, best_size = ids, len(ids)
+
+        if best is None:
+            return list(bucket.values()), False  # type: ignore
+        return [bucket[i] for i in best if i in bucket], False  # type: ignore
 
     def update(self, obj: T) -> T:
         bucket = self._bucket(type(obj))
         if obj.id not in bucket:
             raise KeyError(f"{type(obj).__name__}({obj.id}) not found")
+        self._reindex(obj)
         bucket[obj.id] = obj
         return obj
 
+    def increment(self, cls: Type[T], obj_id: str, deltas: Dict[str, float],
+                  averages: Optional[Dict[str, tuple]] = None) -> bool:
+        obj = self._bucket(cls).get(obj_id)
+        if obj is None:
+            return False
+        for field, delta in deltas.items():
+            setattr(obj, field, getattr(obj, field) + delta)
+        for field, (numerator, denominator) in (averages or {}).items():
+            count = getattr(obj, denominator)
+            setattr(obj, field, getattr(obj, numerator) / count if count > 0 else 0.0)
+        self._reindex(obj)
+        return True
+
     def delete(self, cls: Type[T], obj_id: str) -> None:
         bucket = self._bucket(cls)
         if obj_id in bucket:
             del bucket[obj_id]
+            self._unindex(cls, obj_id)
+
+    def add_many(self, objs: Iterable[T]) -> int:
+        count = 0
+        for obj in objs:
+            self.add(obj)
+            count += 1
+        return count
+
+    def update_many(self, objs: Iterable[T]) -> int:
+        count = 0
+        for obj in objs:
+            self.update(obj)
+            count += 1
+        return count
+
+    def delete_many(self, cls: Type[T], obj_ids: Iterable[str]) -> int:
+        bucket = self._bucket(cls)
+        count = 0
+        for obj_id in obj_ids:
+            if bucket.pop(obj_id, None) is not None:
+                self._unindex(cls, obj_id)
+                count += 1
+        return count
+
+
+def _walkable_ordering(ordering: List[Tuple[str, bool]],
+                       sorted_indexes: Dict[str, SortedIndex]) -> Optional[str]:
+    """
+    Field whose sorted index yields rows in exactly the spec ordering.
+
+    Index entries are ``(value, id)`` pairs, so ``ORDER BY f`` and
+    ``ORDER BY f, id`` (same direction) are both served by a walk.
+    """
+    if not ordering or ordering[0][0] not in sorted_indexes:
+        return None
+    if len(ordering) == 1:
+        return ordering[0][0]
+    if len(ordering) == 2 and ordering[1] == ("id", ordering[0][1]):
+        return ordering[0][0]
+    return None
+
+
+def _range_bounds(query: QuerySpec, field: str) -> Tuple[Any, Any, bool, bool]:
+    """Tightest (low, high, low_inclusive, high_inclusive) for ``field``."""
+    low, high = None, None
+    low_inclusive = high_inclusive = True
+    for name, op, value in query.conditions:
+        if name != field:
+            continue
+        if op in (GE, GT):
+            inclusive = op == GE
+            if low is None or value > low or (value == low and not inclusive):
+                low, low_inclusive = value, inclusive
+        elif op in (LE, LT):
+            inclusive = op == LE
+            if high is None or value < high or (value == high and not inclusive):
+                high, high_inclusive = value, inclusive
+    return low, high, low_inclusive, high_inclusive
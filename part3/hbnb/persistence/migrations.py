@@ -0,0 +1,95 @@
+"""
+In-place upgrades of databases created by earlier versions.
+
+``create_all()`` creates missing tables but never alters existing ones.
+``upgrade_schema`` brings an existing database up to Base.metadata: it
+adds the columns and indexes declared since the table was created and
+rewrites data whose stored format changed. Every step is idempotent, so
+it runs at startup and from ``flask --app app db upgrade``.
+"""
+from __future__ import annotations
+from typing import Dict, List
+from sqlalchemy import Column, inspect, literal, text
+from sqlalchemy.schema import CreateColumn
+from hbnb.bl.base import Base
+# Every model module, so Base.metadata describes every table
+from hbnb.bl import amenity, place, review, user  # noqa: F401
+
+# SQLite stores DateTime as text; before created_at was set client-side
+# the server default wrote it without the fractional seconds SQLAlchemy
+# writes ("YYYY-MM-DD HH:MM:SS" vs "YYYY-MM-DD HH:MM:SS.ffffff")
+_SECONDS_TEXT_LENGTH = 19
+
+# Added along with the other places rating aggregates; when an upgrade
+# adds it, the aggregates must be recomputed from the reviews
+RATING_COLUMN = "review_count"
+
+
+def normalize_timestamps(connection, table: str) -> int:
+    """
+    Rewrite a table's created_at values stored in the old SQLite format.
+
+    Keyset pages compare (created_at, id) as stored; a row written by the
+    old server default sorts before an equal timestamp bound by a cursor,
+    so rows sharing its second would be skipped. A no-op outside SQLite,
+    whose DATETIME columns are typed.
+
+    Returns:
+        Number of rows rewritten
+    """
+    if connection.dialect.name != "sqlite":
+        return 0
+    result = connection.execute(text(
+        f"UPDATE {table} SET created_at = created_at || '.000000' "
+        f"WHERE length(created_at) = {_SECONDS_TEXT_LENGTH}"))
+    return result.rowcount
+
+
+def add_column(connection, table: str, column: Column) -> None:
+    """
+    ALTER TABLE ... ADD COLUMN for a mapped column.
+
+    Existing rows get the column's scalar default, which a NOT NULL
+    column must have.
+    """
+    ddl = str(CreateColumn(column).compile(dialect=connection.dialect))
+    default = column.default
+    if default is not None and default.is_scalar:
+        value = literal(default.arg).compile(dialect=connection.dialect,
+                                             compile_kwargs={"literal_binds": True})
+        ddl = f"{ddl} DEFAULT {value}"
+    elif not column.nullable:
+        raise RuntimeError(f"cannot add NOT NULL column {table}.{column.name} "
+                           f"without a scalar default")
+    connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {ddl}"))
+
+
+def upgrade_schema(connection) -> Dict[str, List[str]]:
+    """
+    Upgrade existing tables to Base.metadata.
+
+    Args:
+        connection: SQLAlchemy Connection (run inside a transaction)
+
+    Returns:
+        Table name -> names of the columns and indexes added
+    """
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    created: Dict[str, List[str]] = {}
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in columns:
+                add_column(connection, table.name, column)
+                created.setdefault(table.name, []).append(column.name)
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in indexes:
+                index.create(connection)
+                created.setdefault(table.name, []).append(index.name)
+        if "created_at" in table.c:
+            normalize_timestamps(connection, table.name)
+    return created
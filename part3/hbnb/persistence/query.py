@@ -0,0 +1,184 @@
+"""
+Declarative query spec shared by all repositories.
+
+A QuerySpec describes equality, membership, range and bounding-box
+conditions together with ordering, a keyset seek position and a row limit. SQLAlchemyRepository
+compiles it into a WHERE / ORDER BY / LIMIT clause, MemoryRepository
+evaluates it natively.
+"""
+from __future__ import annotations
+import operator
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from hbnb.geo import BBox, in_bbox, validate_bbox
+
+EQ = "eq"
+IN = "in"
+GE = "ge"
+GT = "gt"
+LE = "le"
+LT = "lt"
+
+# The same operators work on plain values and on SQLAlchemy columns,
+# except membership which needs ``column.in_()`` on the SQL side.
+OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    EQ: operator.eq,
+    GE: operator.ge,
+    GT: operator.gt,
+    LE: operator.le,
+    LT: operator.lt,
+}
+
+
+def _null_first(value: Any) -> Tuple[bool, Any]:
+    """Sort key placing None before any value, like SQL NULLs in SQLite."""
+    return (value is not None, value)
+
+
+class QuerySpec:
+    """
+    Backend independent description of a list() query.
+
+    Example:
+        QuerySpec(place_id=pid).between("rating", 3, 5).order_by("-created_at").limit(10)
+    """
+
+    def __init__(self, **equals: Any):
+        """
+        Initialize the spec, optionally with equality conditions.
+
+        Args:
+            **equals: field=value pairs that must all match
+        """
+        self.conditions: List[Tuple[str, str, Any]] = []
+        self.ordering: List[Tuple[str, bool]] = []
+        self.after: Optional[Tuple[Any, ...]] = None
+        self.max_rows: Optional[int] = None
+        # (latitude field, longitude field, box) of a within() condition
+        self.geo: Optional[Tuple[str, str, BBox]] = None
+        for field, value in equals.items():
+            self.where(field, value)
+
+    def where(self, field: str, value: Any) -> "QuerySpec":
+        """Require ``field == value``."""
+        self.conditions.append((field, EQ, value))
+        return self
+
+    def where_in(self, field: str, values: Iterable[Any]) -> "QuerySpec":
+        """Require ``field IN values``."""
+        self.conditions.append((field, IN, list(values)))
+        return self
+
+    def between(self, field: str, low: Any = None, high: Any = None) -> "QuerySpec":
+        """Require ``low <= field <= high``; either bound may be omitted."""
+        if low is not None:
+            self.conditions.append((field, GE, low))
+        if high is not None:
+            self.conditions.append((field, LE, high))
+        return self
+
+    def greater_than(self, field: str, value: Any) -> "QuerySpec":
+        """Require ``field > value``."""
+        self.conditions.append((field, GT, value))
+        return self
+
+    def less_than(self, field: str, value: Any) -> "QuerySpec":
+        """Require ``field < value``."""
+        self.conditions.append((field, LT, value))
+        return self
+
+    def within(self, bbox: BBox, lat_field: str = "latitude",
+               lng_field: str = "longitude") -> "QuerySpec":
+        """
+        Require the point ``(lat_field, lng_field)`` to lie inside ``bbox``.
+
+        ``bbox`` is ``(south, west, north, east)``; west > east crosses the
+        antimeridian. Backends answer it from a spatial index when they
+        have one.
+        """
+        self.geo = (lat_field, lng_field, validate_bbox(bbox))
+        return self
+
+    def order_by(self, *fields: str) -> "QuerySpec":
+        """Order results by fields; prefix a field with '-' for descending."""
+        for field in fields:
+            if field.startswith("-"):
+                self.ordering.append((field[1:], True))
+            else:
+                self.ordering.append((field, False))
+        return self
+
+    def seek_after(self, key: Optional[Tuple[Any, ...]]) -> "QuerySpec":
+        """
+        Keyset pagination: only return rows ordered strictly after ``key``.
+
+        ``key`` holds one value per ordering field (typically the
+        ``(created_at, id)`` of the last row of the previous page). All
+        ordering fields must share the same direction.
+        """
+        if key is None:
+            self.after = None
+            return self
+        if len(key) != len(self.ordering):
+            raise ValueError("seek key must have one value per ordering field")
+        if len({descending for _, descending in self.ordering}) > 1:
+            raise ValueError("seek requires a single ordering direction")
+        self.after = tuple(key)
+        return self
+
+    def seek_descending(self) -> bool:
+        """Direction of the seek (the shared ordering direction)."""
+        return bool(self.ordering) and self.ordering[0][1]
+
+    def limit(self, count: Optional[int]) -> "QuerySpec":
+        """Return at most ``count`` rows."""
+        if count is not None and count < 0:
+            raise ValueError("limit must be >= 0")
+        self.max_rows = count
+        return self
+
+    def fields(self) -> List[str]:
+        """Names of all fields referenced by conditions or ordering."""
+        names = [field for field, _, _ in self.conditions]
+        names.extend(field for field, _ in self.ordering)
+        if self.geo is not None:
+            names.extend(self.geo[:2])
+        return names
+
+    # ----- In-memory evaluation -----
+    def matches(self, obj: Any) -> bool:
+        """Check whether a single object satisfies every condition."""
+        for field, op, value in self.conditions:
+            actual = getattr(obj, field, None)
+            if op == IN:
+                if actual not in value:
+                    return False
+            elif op == EQ:
+                if actual != value:
+                    return False
+            elif actual is None or not OPERATORS[op](actual, value):
+                return False
+        if self.geo is not None:
+            lat_field, lng_field, bbox = self.geo
+            if not in_bbox(getattr(obj, lat_field, None), getattr(obj, lng_field, None), bbox):
+                return False
+        if self.after is not None:
+            key = tuple(_null_first(getattr(obj, field, None)) for field, _ in self.ordering)
+            after = tuple(_null_first(value) for value in self.after)
+            if (key <= after) if not self.seek_descending() else (key >= after):
+                return False
+        return True
+
+    def sort(self, objects: List[Any]) -> List[Any]:
+        """Sort objects by the spec ordering (stable, one pass per key)."""
+        for field, descending in reversed(self.ordering):
+            objects.sort(key=lambda o: _null_first(getattr(o, field, None)), reverse=descending)
+        return objects
+
+    def apply(self, objects: Iterable[Any]) -> List[Any]:
+        """Filter, order and limit an iterable of objects."""
+        rows = [obj for obj in objects if self.matches(obj)]
+        if self.ordering:
+            self.sort(rows)
+        if self.max_rows is not None:
+            rows = rows[:self.max_rows]
+        return rows
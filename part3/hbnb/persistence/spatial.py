@@ -0,0 +1,92 @@
+"""
+SQLite R*Tree spatial index for point columns.
+
+For every table in SPATIAL_TABLES, a ``<table>_rtree`` virtual table
+holds one degenerate box (the point) per row, keyed by the row's rowid
+and kept in sync by triggers, so ORM writes, Core bulk inserts and raw
+SQL all maintain it. SQLAlchemyRepository uses it to answer bounding-box
+conditions; other databases fall back to range predicates on the
+composite (latitude, longitude) index.
+
+VACUUM may renumber the rowids of tables without an INTEGER PRIMARY
+KEY; run ``install_spatial_indexes(connection, rebuild=True)`` after one.
+"""
+from __future__ import annotations
+from typing import Dict, Tuple
+from sqlalchemy import Column, Float, Integer, MetaData, Table, event, text
+from sqlalchemy.exc import OperationalError
+from hbnb.bl.base import Base
+
+# Table name -> (latitude column, longitude column)
+SPATIAL_TABLES: Dict[str, Tuple[str, str]] = {
+    "places": ("latitude", "longitude"),
+}
+
+# Kept out of Base.metadata: create_all() must not try to create these
+_rtree_metadata = MetaData()
+
+
+def rtree_name(table: str) -> str:
+    return f"{table}_rtree"
+
+
+def rtree_table(table: str) -> Table:
+    """Core Table describing the R*Tree of ``table`` (for queries)."""
+    name = rtree_name(table)
+    if name not in _rtree_metadata.tables:
+        Table(name, _rtree_metadata,
+              Column("id", Integer, primary_key=True),
+              Column("min_lat", Float), Column("max_lat", Float),
+              Column("min_lng", Float), Column("max_lng", Float))
+    return _rtree_metadata.tables[name]
+
+
+def _statements(table: str, lat: str, lng: str):
+    rtree = rtree_name(table)
+    yield (f"CREATE VIRTUAL TABLE IF NOT EXISTS {rtree} "
+           f"USING rtree(id, min_lat, max_lat, min_lng, max_lng)")
+    yield (f"CREATE TRIGGER IF NOT EXISTS {rtree}_insert AFTER INSERT ON {table} BEGIN "
+           f"INSERT INTO {rtree} VALUES (new.rowid, new.{lat}, new.{lat}, new.{lng}, new.{lng}); END")
+    yield (f"CREATE TRIGGER IF NOT EXISTS {rtree}_update AFTER UPDATE OF {lat}, {lng} ON {table} BEGIN "
+           f"UPDATE {rtree} SET min_lat = new.{lat}, max_lat = new.{lat}, "
+           f"min_lng = new.{lng}, max_lng = new.{lng} WHERE id = new.rowid; END")
+    yield (f"CREATE TRIGGER IF NOT EXISTS {rtree}_delete AFTER DELETE ON {table} BEGIN "
+           f"DELETE FROM {rtree} WHERE id = old.rowid; END")
+
+
+def install_spatial_indexes(connection, rebuild: bool = False) -> bool:
+    """
+    Create the R*Trees and triggers and index rows not indexed yet.
+
+    Idempotent; a no-op outside SQLite or without the rtree module.
+
+    Args:
+        connection: SQLAlchemy Connection
+        rebuild: Empty each R*Tree and index every row again
+
+    Returns:
+        True if the spatial indexes are in place
+    """
+    if connection.dialect.name != "sqlite":
+        return False
+    for table, (lat, lng) in SPATIAL_TABLES.items():
+        if not connection.dialect.has_table(connection, table):
+            continue
+        try:
+            for statement in _statements(table, lat, lng):
+                connection.execute(text(statement))
+        except OperationalError:
+            # SQLite built without the rtree module: use range predicates
+            return False
+        rtree = rtree_name(table)
+        if rebuild:
+            connection.execute(text(f"DELETE FROM {rtree}"))
+        connection.execute(text(
+            f"INSERT INTO {rtree} SELECT rowid, {lat}, {lat}, {lng}, {lng} FROM {table} "
+            f"WHERE rowid NOT IN (SELECT id FROM {rtree})"))
+    return True
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_after_create(target, connection, **kw):
+    install_spatial_indexes(connection)
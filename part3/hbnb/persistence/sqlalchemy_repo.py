@@ -3,11 +3,40 @@ SQLAlchemy Repository implementation.
 Provides database persistence using SQLAlchemy ORM.
 """
 from __future__ import annotations
-from typing import Type, TypeVar, List, Optional, Callable
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice
+from typing import Any, Type, TypeVar, List, Optional, Callable, Iterator, Iterable, Dict, Set, Tuple
+from sqlalchemy import insert, inspect, and_, or_, select, literal_column, case
+from sqlalchemy import update as sql_update, delete as sql_delete
 from sqlalchemy.orm import Session
+from .query import QuerySpec, OPERATORS, IN
+from .spatial import SPATIAL_TABLES, rtree_name, rtree_table
+from .fulltext import TEXT_TABLES, fts_name, fts_table, install_fulltext_indexes
+from hbnb.geo import lng_ranges
+from hbnb.text import match_expression, tokenize
 
 T = TypeVar("T")
 
+# Rows per executemany batch, and ids per IN (...) list (kept well under
+# SQLite's bound-parameter limit).
+BULK_CHUNK_SIZE = 1000
+IN_CHUNK_SIZE = 500
+# Rows fetched per round trip when streaming
+STREAM_BATCH_SIZE = 1000
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield successive lists of at most ``size`` items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
 
 class SQLAlchemyRepository:
     """
@@ -23,11 +52,96 @@ class SQLAlchemyRepository:
             db_session: SQLAlchemy database session
         """
         self._session = db_session
+        # Unit-of-work nesting is tracked per thread, like a scoped session
+        self._uow = threading.local()
+        # Table name -> whether an R*Tree backs its bounding-box queries
+        self._rtrees: Dict[str, bool] = {}
+        # Table name -> whether an FTS5 index backs its text searches
+        self._fts: Dict[str, bool] = {}
+
+    # ===== Unit of work =====
+    def begin(self) -> None:
+        """
+        Open (or join) a unit of work.
+
+        While a unit of work is open, add/update/delete do not commit;
+        the outermost end() commits or rolls back everything at once.
+        """
+        if getattr(self._uow, "depth", 0) == 0:
+            self._uow.failed = False
+            self._uow.callbacks = []
+        self._uow.depth = getattr(self._uow, "depth", 0) + 1
+
+    def end(self, error: bool = False) -> None:
+        """
+        Close the current unit of work.
+
+        Args:
+            error: True if the work inside failed and must not be committed
+        """
+        depth = getattr(self._uow, "depth", 0)
+        if depth == 0:
+            raise RuntimeError("end() called without a matching begin()")
+        self._uow.failed = self._uow.failed or error
+        self._uow.depth = depth - 1
+        if self._uow.depth == 0:
+            callbacks, self._uow.callbacks = self._uow.callbacks, []
+            if self._uow.failed:
+                self._session.rollback()
+            else:
+                self._session.commit()
+                for callback in callbacks:
+                    callback()
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator["SQLAlchemyRepository"]:
+        """
+        Group several writes into one transaction.
+
+        Usage:
+            with repo.unit_of_work():
+                repo.add(a)
+                repo.update(b)
+
+        Nested blocks join the outer one; an exception anywhere inside
+        rolls back the whole unit.
+        """
+        self.begin()
+        try:
+            yield self
+        except BaseException:
+            self.end(error=True)
+            raise
+        self.end()
+
+    def in_unit_of_work(self) -> bool:
+        """Whether a unit of work is open on the current thread."""
+        return getattr(self._uow, "depth", 0) > 0
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Run ``callback`` once the current unit of work has committed.
+
+        Callbacks are dropped if the unit rolls back; outside a unit of
+        work (where writes commit immediately) it runs right away.
+        """
+        if self.in_unit_of_work():
+            self._uow.callbacks.append(callback)
+        else:
+            callback()
+
+    def _commit(self) -> None:
+        """Commit now, unless a unit of work will commit later."""
+        if not self.in_unit_of_work():
+            self._session.commit()
 
     def add(self, obj: T) -> T:
         """
         Add a new object to the database.
 
+        Inside a unit of work the object is flushed so its generated id
+        and timestamps are available, but not committed.
+
         Args:
             obj: The object to add
 
@@ -35,7 +149,10 @@ class SQLAlchemyRepository:
             The added object
         """
         self._session.add(obj)
-        self._session.commit()
+        if self.in_unit_of_work():
+            self._session.flush()
+        else:
+            self._session.commit()
         return obj
 
     def get(self, cls: Type[T], obj_id: str) -> Optional[T]:
@@ -51,25 +168,294 @@ class SQLAlchemyRepository:
         """
         return self._session.query(cls).filter_by(id=obj_id).first()
 
-    def list(self, cls: Type[T], predicate: Optional[Callable[[T], bool]] = None) -> List[T]:
+    def get_many(self, cls: Type[T], obj_ids: Iterable[str]) -> Dict[str, T]:
+        """
+        Retrieve many objects by id with chunked IN queries.
+
+        Args:
+            cls: The class type of the objects
+            obj_ids: The IDs to look up (duplicates are ignored)
+
+        Returns:
+            Dict mapping each found id to its object; missing ids are absent
+        """
+        found: Dict[str, T] = {}
+        for chunk in chunked(set(obj_ids), IN_CHUNK_SIZE):
+            for obj in self._session.query(cls).filter(cls.id.in_(chunk)):
+                found[obj.id] = obj
+        return found
+
+    def exists_many(self, cls: Type[T], obj_ids: Iterable[str]) -> Set[str]:
+        """
+        Check which ids exist, selecting only the id column.
+
+        Args:
+            cls: The class type of the objects
+            obj_ids: The IDs to check
+
+        Returns:
+            The subset of ``obj_ids`` that exist
         """
-        List all objects of a given type, optionally filtered by a predicate.
+        found: Set[str] = set()
+        for chunk in chunked(set(obj_ids), IN_CHUNK_SIZE):
+            found.update(obj_id for (obj_id,) in
+                         self._session.query(cls.id).filter(cls.id.in_(chunk)))
+        return found
+
+    def list(self, cls: Type[T], predicate: Optional[Callable[[T], bool]] = None,
+             query: Optional[QuerySpec] = None) -> List[T]:
+        """
+        List all objects of a given type, optionally filtered.
+
+        A QuerySpec is compiled into the SQL statement so only matching rows
+        are loaded. A Python predicate is still accepted for ad-hoc filters,
+        but it runs after the rows have been fetched.
 
         Args:
             cls: The class type of objects to list
             predicate: Optional filter function
+            query: Optional declarative filter/order/limit spec
 
         Returns:
             List of objects matching the criteria
         """
-        query = self._session.query(cls)
-        results = query.all()
-
-        if predicate:
-            return [obj for obj in results if predicate(obj)]
+        if not predicate:
+            return self._build_query(cls, query).all()
 
+        # The predicate runs in Python, so the limit has to be applied after it
+        results = self._build_query(cls, query, apply_limit=False).all()
+        results = [obj for obj in results if predicate(obj)]
+        if query is not None and query.max_rows is not None:
+            results = results[:query.max_rows]
         return results
 
+    def stream(self, cls: Type[T], query: Optional[QuerySpec] = None,
+               batch_size: int = STREAM_BATCH_SIZE) -> Iterator[T]:
+        """
+        Iterate over matching objects without materializing the result.
+
+        Uses a server-side cursor (stream_results) where the driver has
+        one, and yield_per so only ``batch_size`` rows are buffered.
+
+        Args:
+            cls: The class type of objects to list
+            query: Optional declarative filter/order/limit spec
+            batch_size: Rows fetched per round trip
+
+        Returns:
+            Iterator over the matching objects
+        """
+        statement = self._build_query(cls, query).statement
+        yield from self._session.scalars(
+            statement, execution_options={"stream_results": True, "yield_per": batch_size})
+
+    def rows(self, cls: Type[T], columns: Iterable[str], query: Optional[QuerySpec] = None,
+             batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Stored values of some columns of the rows matching ``query``.
+
+        Only those columns are selected; no object is loaded or tracked
+        by the session.
+
+        Args:
+            cls: The mapped class to query
+            columns: Table column names to select
+            query: Optional declarative filter/order/limit spec
+            batch_size: Rows fetched per round trip
+
+        Returns:
+            Iterator over dicts keyed by column name
+        """
+        names = list(columns)
+        for name in names:
+            cls.column_attribute(name)
+        selected = tuple(cls.__table__.c[name] for name in names)
+        for row in self._build_query(cls, query, columns=selected).yield_per(batch_size):
+            yield dict(zip(names, row))
+
+    def locate(self, cls: Type[T], query: Optional[QuerySpec] = None,
+               lat_field: str = "latitude", lng_field: str = "longitude") -> List[Tuple[str, float, float]]:
+        """
+        Coordinates of the rows matching ``query``, without loading objects.
+
+        Args:
+            cls: The mapped class to query
+            query: Optional declarative filter spec (typically with within())
+            lat_field, lng_field: Coordinate attributes, unless the spec's
+                within() condition names them
+
+        Returns:
+            List of ``(id, lat, lng)`` tuples
+        """
+        if query is not None and query.geo is not None:
+            lat_field, lng_field, _ = query.geo
+        columns = (cls.id, getattr(cls, lat_field), getattr(cls, lng_field))
+        return [tuple(row) for row in self._build_query(cls, query, columns=columns)]
+
+    def search(self, cls: Type[T], text: str, query: Optional[QuerySpec] = None,
+               limit: Optional[int] = None) -> List[Tuple[T, float]]:
+        """
+        Rows containing every token of ``text``, most relevant first.
+
+        On SQLite the FTS5 index finds the rows and ``bm25()`` ranks them;
+        elsewhere each token becomes a LIKE predicate over the text
+        columns and rows come back in id order with a score of 0.
+
+        Args:
+            cls: The mapped class to search (its table must be in TEXT_TABLES)
+            text: Free text; only its tokens matter
+            query: Optional filter spec (its ordering and limit are ignored)
+            limit: Maximum number of rows
+
+        Returns:
+            List of ``(obj, score)`` pairs, higher scores more relevant
+        """
+        table = cls.__table__.name
+        if table not in TEXT_TABLES:
+            raise ValueError(f"{cls.__name__} has no text index")
+        tokens = tokenize(text)
+        if not tokens:
+            return []
+        filters = QuerySpec()
+        if query is not None:
+            filters.conditions = list(query.conditions)
+            filters.geo = query.geo
+
+        if not self._has_fts(table):
+            columns = [getattr(cls, column) for column in TEXT_TABLES[table]]
+            q = self._build_query(cls, filters).order_by(cls.id)
+            for token in tokens:
+                q = q.filter(or_(*(column.ilike(f"%{token}%") for column in columns)))
+            if limit is not None:
+                q = q.limit(limit)
+            return [(obj, 0.0) for obj in q]
+
+        fts = fts_table(table)
+        weights = ", ".join(str(w) for w in TEXT_TABLES[table].values())
+        rank = literal_column(f"bm25({fts.name}, {weights})")
+        hits = select(fts.c.rowid, rank.label("rank")).where(
+            literal_column(fts.name).op("MATCH")(match_expression(tokens)))
+        if not filters.conditions and filters.geo is None and limit is not None:
+            # Nothing else can drop a match: let FTS5 keep only the best rows
+            hits = hits.order_by(rank).limit(limit)
+        hits = hits.subquery()
+        q = self._build_query(cls, filters, columns=(cls, hits.c.rank))
+        q = q.join(hits, literal_column(f"{table}.rowid") == hits.c.rowid)
+        q = q.order_by(hits.c.rank, cls.id)
+        if limit is not None:
+            q = q.limit(limit)
+        return [(obj, -rank) for obj, rank in q]
+
+    def rebuild_text_index(self, cls: Type[T]) -> int:
+        """
+        Re-index every row of ``cls`` (after bulk loads or a VACUUM).
+
+        Returns:
+            The number of rows in the table
+        """
+        table = cls.__table__.name
+        self._fts.pop(table, None)
+        if table in TEXT_TABLES:
+            install_fulltext_indexes(self._session.connection(), rebuild=True)
+        return self._session.query(cls).count()
+
+    def _build_query(self, cls: Type[T], query: Optional[QuerySpec], apply_limit: bool = True,
+                     columns: Optional[tuple] = None):
+        """
+        Compile a QuerySpec into an ORM query for ``cls``.
+
+        Args:
+            cls: The mapped class to query
+            query: The spec to compile, or None for every row
+            apply_limit: Whether to emit the spec's LIMIT clause
+            columns: Select only these columns instead of whole objects
+
+        Returns:
+            SQLAlchemy query object
+        """
+        q = self._session.query(*columns) if columns else self._session.query(cls)
+        if query is None:
+            return q
+
+        for field, op, value in query.conditions:
+            column = getattr(cls, field)
+            if op == IN:
+                q = q.filter(column.in_(value))
+            else:
+                q = q.filter(OPERATORS[op](column, value))
+
+        if query.geo is not None:
+            q = q.filter(self._geo_clause(cls, query))
+
+        if query.after is not None:
+            q = q.filter(self._seek_clause(cls, query))
+
+        for field, descending in query.ordering:
+            column = getattr(cls, field)
+            q = q.order_by(column.desc() if descending else column.asc())
+
+        if apply_limit and query.max_rows is not None:
+            q = q.limit(query.max_rows)
+
+        return q
+
+    def _geo_clause(self, cls: Type[T], query: QuerySpec):
+        """
+        Bounding-box condition of a spec.
+
+        Exact latitude/longitude ranges (served by the composite index on
+        MySQL), plus an R*Tree prefilter on SQLite when the table has one.
+        """
+        lat_field, lng_field, bbox = query.geo
+        lat, lng = getattr(cls, lat_field), getattr(cls, lng_field)
+        south, _, north, _ = bbox
+        ranges = lng_ranges(bbox)
+        clause = and_(lat.between(south, north),
+                      or_(*(lng.between(west, east) for west, east in ranges)))
+        table = cls.__table__.name
+        if SPATIAL_TABLES.get(table) != (lat.key, lng.key) or not self._has_rtree(table):
+            return clause
+        rtree = rtree_table(table)
+        boxes = or_(*(and_(rtree.c.max_lat >= south, rtree.c.min_lat <= north,
+                           rtree.c.max_lng >= west, rtree.c.min_lng <= east)
+                      for west, east in ranges))
+        rowid = literal_column(f"{table}.rowid")
+        return and_(rowid.in_(select(rtree.c.id).where(boxes)), clause)
+
+    def _has_rtree(self, table: str) -> bool:
+        if table not in self._rtrees:
+            connection = self._session.connection()
+            self._rtrees[table] = connection.dialect.name == "sqlite" and \
+                connection.dialect.has_table(connection, rtree_name(table))
+        return self._rtrees[table]
+
+    def _has_fts(self, table: str) -> bool:
+        if table not in self._fts:
+            connection = self._session.connection()
+            self._fts[table] = connection.dialect.name == "sqlite" and \
+                connection.dialect.has_table(connection, fts_name(table))
+        return self._fts[table]
+
+    @staticmethod
+    def _seek_clause(cls: Type[T], query: QuerySpec):
+        """
+        Row-value comparison ``(f1, f2, ...) > (v1, v2, ...)`` in index-friendly form.
+
+        Expanded as ``f1 >= v1 AND (f1 > v1 OR (f2 >= v2 AND (...)))`` so the
+        leading column can use a range scan on a composite index.
+        """
+        descending = query.seek_descending()
+        pairs = [(getattr(cls, field), value)
+                 for (field, _), value in zip(query.ordering, query.after)]
+        column, value = pairs[-1]
+        clause = column < value if descending else column > value
+        for column, value in reversed(pairs[:-1]):
+            if descending:
+                clause = and_(column <= value, or_(column < value, clause))
+            else:
+                clause = and_(column >= value, or_(column > value, clause))
+        return clause
+
     def update(self, obj: T) -> T:
         """
         Update an existing object in the database.
@@ -81,9 +467,43 @@ class SQLAlchemyRepository:
             The updated object
         """
         self._session.merge(obj)
-        self._session.commit()
+        self._commit()
         return obj
 
+    def increment(self, cls: Type[T], obj_id: str, deltas: Dict[str, float],
+                  averages: Optional[Dict[str, tuple]] = None) -> bool:
+        """
+        Atomically add ``deltas`` to numeric columns of one row.
+
+        Compiles to a single ``UPDATE ... SET f = f + :delta`` so concurrent
+        writers never lose an increment, and refreshes the identity map.
+
+        Args:
+            cls: The mapped class
+            obj_id: Id of the row to change
+            deltas: Column name -> amount to add
+            averages: Column name -> (numerator, denominator) columns; the
+                column is set to their ratio after the increment (0 when
+                the denominator is 0), in the same statement
+
+        Returns:
+            False if no row has that id
+        """
+        values = []
+        # Averages are computed from the pre-update values plus deltas and
+        # listed first: MySQL evaluates SET assignments left to right.
+        for field, (numerator, denominator) in (averages or {}).items():
+            total = getattr(cls, numerator) + deltas.get(numerator, 0)
+            count = getattr(cls, denominator) + deltas.get(denominator, 0)
+            values.append((getattr(cls, field), case((count > 0, total * 1.0 / count), else_=0.0)))
+        for field, delta in deltas.items():
+            column = getattr(cls, field)
+            values.append((column, column + delta))
+        statement = sql_update(cls).where(cls.id == obj_id).ordered_values(*values)
+        result = self._session.execute(statement, execution_options={"synchronize_session": "fetch"})
+        self._commit()
+        return result.rowcount > 0
+
     def delete(self, cls: Type[T], obj_id: str) -> None:
         """
         Delete an object from the database.
@@ -95,4 +515,147 @@ class SQLAlchemyRepository:
         obj = self.get(cls, obj_id)
         if obj:
             self._session.delete(obj)
-            self._session.commit()
+            self._commit()
+
+    # ===== Bulk writes =====
+    def add_many(self, objs: Iterable[T]) -> int:
+        """
+        Insert many new objects with executemany-style Core INSERTs.
+
+        The ORM unit of work is bypassed: ids and timestamps are filled in
+        on the objects up front, and the objects are not attached to the
+        session. Relationship collections are not persisted.
+
+        Attributes left unset fall back to their column's Python-side
+        default (scalar or callable), as an ORM flush would apply it.
+
+        Args:
+            objs: Objects of a single mapped class (any iterable)
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            ValueError: If the objects are of more than one class
+        """
+        count = 0
+        now = datetime.utcnow()
+        cls = None
+        for chunk in chunked(objs, BULK_CHUNK_SIZE):
+            cls = self._single_class(chunk, cls)
+            mapper = inspect(cls)
+            keys = self._column_keys(mapper)
+            defaults = {attr: mapper.columns[attr].default for attr, _ in keys}
+            rows = []
+            for obj in chunk:
+                if obj.id is None:
+                    obj.id = str(uuid.uuid4())
+                if obj.created_at is None:
+                    obj.created_at = now
+                if obj.updated_at is None:
+                    obj.updated_at = now
+                # Read loaded values straight from the instance dict,
+                # skipping the instrumented attribute descriptors
+                state = obj.__dict__
+                for attr, _ in keys:
+                    if attr not in state:
+                        setattr(obj, attr, self._python_default(defaults[attr]))
+                rows.append({column: state.get(attr) for attr, column in keys})
+            self._session.execute(insert(mapper.local_table), rows)
+            count += len(rows)
+        self._commit()
+        return count
+
+    def update_many(self, objs: Iterable[T]) -> int:
+        """
+        Write back many existing objects.
+
+        Objects already tracked by this session are flushed by the ORM,
+        which batches identical UPDATEs itself. Detached objects are
+        written with one executemany UPDATE by primary key per chunk,
+        without a SELECT per object as merge() would do.
+
+        Args:
+            objs: Objects of a single mapped class (any iterable)
+
+        Returns:
+            Number of objects written
+
+        Raises:
+            ValueError: If the objects are of more than one class
+        """
+        count = 0
+        cls = None
+        for chunk in chunked(objs, BULK_CHUNK_SIZE):
+            cls = self._single_class(chunk, cls)
+            mapper = inspect(cls)
+            rows = [
+                {prop.key: getattr(obj, prop.key) for prop in mapper.column_attrs}
+                for obj in chunk
+                if obj not in self._session
+            ]
+            if rows:
+                self._session.execute(sql_update(cls), rows)
+            count += len(chunk)
+        self._session.flush()
+        self._commit()
+        return count
+
+    def delete_many(self, cls: Type[T], obj_ids: Iterable[str]) -> int:
+        """
+        Delete many objects by id using chunked IN deletes.
+
+        Classes whose relationships cascade deletes or maintain an
+        association table are loaded chunk by chunk and deleted through
+        the ORM so those rules still apply; other classes are deleted
+        with a bulk DELETE ... WHERE id IN (...).
+
+        Args:
+            cls: The class type of the objects
+            obj_ids: Ids to delete (any iterable)
+
+        Returns:
+            Number of rows deleted
+        """
+        count = 0
+        orm_delete = self._needs_orm_delete(cls)
+        for chunk in chunked(obj_ids, IN_CHUNK_SIZE):
+            if orm_delete:
+                rows = self._session.query(cls).filter(cls.id.in_(chunk)).all()
+                for obj in rows:
+                    self._session.delete(obj)
+                count += len(rows)
+            else:
+                result = self._session.execute(sql_delete(cls).where(cls.id.in_(chunk)))
+                count += result.rowcount
+        self._commit()
+        return count
+
+    @staticmethod
+    def _single_class(chunk: List[T], cls: Optional[type]) -> type:
+        """The one class of a bulk chunk (and of the chunks before it)."""
+        cls = cls or type(chunk[0])
+        if any(type(obj) is not cls for obj in chunk):
+            raise ValueError(f"bulk writes take objects of a single class ({cls.__name__})")
+        return cls
+
+    @staticmethod
+    def _python_default(default) -> Any:
+        """Value of a Python-side column default; None for SQL or no default."""
+        if default is None or not (default.is_scalar or default.is_callable):
+            return None
+        # Callable defaults are wrapped to take the execution context
+        return default.arg(None) if default.is_callable else default.arg
+
+    @staticmethod
+    def _column_keys(mapper) -> List[tuple]:
+        """(attribute key, column key) pairs for a mapper's columns."""
+        return [(prop.key, prop.columns[0].key) for prop in mapper.column_attrs]
+
+    @staticmethod
+    def _needs_orm_delete(cls) -> bool:
+        """Whether deleting ``cls`` rows must go through ORM cascades."""
+        return any(
+            rel.cascade.delete or rel.secondary is not None
+            for rel in inspect(cls).relationships
+        )
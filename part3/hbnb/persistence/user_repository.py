@@ -2,8 +2,8 @@
 User Repository - Specialized repository for User operations.
 Extends SQLAlchemyRepository with user-specific query methods.
 """
-from typing import Optional
-from hbnb.persistence.sqlalchemy_repo import SQLAlchemyRepository
+from typing import Optional, Iterable, Dict
+from hbnb.persistence.sqlalchemy_repo import SQLAlchemyRepository, chunked, IN_CHUNK_SIZE
 from hbnb.bl.user import User
 
 
@@ -26,3 +26,22 @@ class UserRepository(SQLAlchemyRepository):
             User object if found, None otherwise
         """
         return self._session.query(User).filter_by(email=email).first()
+
+    def get_by_emails(self, emails: Iterable[str]) -> Dict[str, User]:
+        """
+        Find many users by email with chunked IN queries.
+
+        Used by bulk imports to skip existing users without one
+        query per row.
+
+        Args:
+            emails: Email addresses to look up
+
+        Returns:
+            Dict mapping each found email to its User
+        """
+        found: Dict[str, User] = {}
+        for chunk in chunked(set(emails), IN_CHUNK_SIZE):
+            for user in self._session.query(User).filter(User.email.in_(chunk)):
+                found[user.email] = user
+        return found
@@ -0,0 +1,138 @@
+"""
+Mergeable quantile sketch with relative-error guarantees.
+
+DDSketch-style: a positive value ``x`` is counted in the logarithmic
+bucket ``ceil(log_gamma(x))`` with ``gamma = (1 + alpha) / (1 - alpha)``,
+and every quantile is answered with a value within ``alpha`` (relative)
+of the true one. Unlike t-digest or KLL, the buckets are plain counts:
+two sketches merge by adding counts, and a value can be removed again,
+which is what lets sketches follow place updates and deletions.
+Values of zero or less share a single bucket reported as 0.
+"""
+from __future__ import annotations
+import math
+from typing import Dict, List, Optional, Sequence
+
+
+class QuantileSketch:
+    """Relative-error quantile sketch over non-negative values."""
+
+    __slots__ = ("alpha", "_gamma", "_log_gamma", "_buckets", "zeros", "count", "total")
+
+    def __init__(self, alpha: float = 0.01):
+        """
+        Args:
+            alpha: Relative accuracy of quantiles (0 < alpha < 1)
+        """
+        if not 0 < alpha < 1:
+            raise ValueError("alpha must be in (0, 1)")
+        self.alpha = alpha
+        self._gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """Count ``value`` ``weight`` times (a negative weight removes it)."""
+        self.count += weight
+        self.total += value * weight
+        if value <= 0:
+            self.zeros += weight
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        count = self._buckets.get(key, 0) + weight
+        if count:
+            self._buckets[key] = count
+        else:
+            del self._buckets[key]
+
+    def remove(self, value: float) -> None:
+        """Uncount a value added before."""
+        self.add(value, -1)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add the counts of a sketch with the same ``alpha``."""
+        if other.alpha != self.alpha:
+            raise ValueError("cannot merge sketches of different accuracy")
+        buckets = self._buckets
+        for key, count in other._buckets.items():
+            buckets[key] = buckets.get(key, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+
+    def _value(self, key: int) -> float:
+        # Midpoint (in relative terms) of the bucket (gamma^(key-1), gamma^key]
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def _sorted(self) -> List[tuple]:
+        return sorted(self._buckets.items())
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Value of rank ``fraction * (count - 1)`` (None when empty)."""
+        return self.quantiles([fraction])[0]
+
+    def quantiles(self, fractions: Sequence[float]) -> List[Optional[float]]:
+        """Several quantiles, walking the buckets once."""
+        if self.count <= 0:
+            return [None] * len(fractions)
+        order = sorted(range(len(fractions)), key=fractions.__getitem__)
+        results: List[Optional[float]] = [None] * len(fractions)
+        buckets = [(None, self.zeros)] + self._sorted()
+        position, seen = 0, buckets[0][1]
+        for i in order:
+            rank = fractions[i] * (self.count - 1)
+            while seen <= rank and position + 1 < len(buckets):
+                position += 1
+                seen += buckets[position][1]
+            key = buckets[position][0]
+            results[i] = 0.0 if key is None else self._value(key)
+        return results
+
+    @property
+    def min(self) -> Optional[float]:
+        if self.count <= 0:
+            return None
+        return 0.0 if self.zeros else self._value(min(self._buckets))
+
+    @property
+    def max(self) -> Optional[float]:
+        if self.count <= 0:
+            return None
+        return self._value(max(self._buckets)) if self._buckets else 0.0
+
+    def rank(self, value: float) -> Optional[float]:
+        """Share of the values at or below ``value`` (None when empty)."""
+        if self.count <= 0:
+            return None
+        below = self.zeros
+        if value > 0:
+            limit = math.ceil(math.log(value) / self._log_gamma)
+            below += sum(count for key, count in self._buckets.items() if key <= limit)
+        elif value < 0:
+            below = 0
+        return below / self.count
+
+    def histogram(self, low: float, high: float, bins: int) -> List[int]:
+        """
+        Counts in ``bins`` equal-width bins spanning ``[low, high]``.
+
+        Each bucket counts in the bin of its representative value, values
+        outside the span in the outer bins.
+        """
+        counts = [0] * bins
+        if bins <= 0:
+            return counts
+        width = (high - low) / bins
+        items = [(0.0, self.zeros)] if self.zeros else []
+        items += [(self._value(key), count) for key, count in self._buckets.items()]
+        for value, count in items:
+            i = int((value - low) / width) if width > 0 else 0
+            counts[min(max(i, 0), bins - 1)] += count
+        return counts
@@ -0,0 +1,51 @@
+"""
+Full-text helpers shared by the repositories.
+
+Tokenization follows SQLite FTS5's ``unicode61 remove_diacritics 2``
+tokenizer (letters and digits form tokens, case and accents are folded),
+and scoring follows its ``bm25()`` function, so the in-memory index and
+the FTS5 table find and rank the same rows.
+"""
+from __future__ import annotations
+import math
+import re
+import unicodedata
+from typing import List
+
+# FTS5 bm25() constants
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str | None) -> List[str]:
+    """Lower-cased, accent-free tokens of ``text``."""
+    if not text:
+        return []
+    folded = unicodedata.normalize("NFKD", text)
+    folded = "".join(c for c in folded if not unicodedata.combining(c))
+    return _TOKEN.findall(folded.lower())
+
+
+def match_expression(tokens: List[str]) -> str:
+    """FTS5 MATCH query requiring every token (each quoted, so user input
+    can never be read as query syntax)."""
+    return " ".join(f'"{token}"' for token in tokens)
+
+
+def bm25_idf(documents: int, matching: int) -> float:
+    """Inverse document frequency of a term, as FTS5 computes it."""
+    idf = math.log((documents - matching + 0.5) / (matching + 0.5))
+    return idf if idf > 0 else 1e-6
+
+
+def bm25_term(frequency: float, length: int, average_length: float, idf: float) -> float:
+    """
+    BM25 contribution of one term to a row's score.
+
+    ``frequency`` is the term's column-weighted count in the row and
+    ``length`` the row's token count over all columns.
+    """
+    norm = 1 - BM25_B + BM25_B * (length / average_length if average_length else 0.0)
+    return idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * norm)
@@ -1,7 +1,41 @@
-from typing import Tuple
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Tuple
+from hbnb.bl.base import ISO
+from hbnb.errors import BadRequest
 
-def paginate(items, page: int, per_page: int) -> Tuple[list, int]:
-    total = len(items)
-    start = (page - 1) * per_page
-    end = start + per_page
-    return items[start:end], total
+
+def encode_cursor(value: Any, obj_id: str, sort: Optional[str] = None) -> str:
+    """
+    Opaque keyset cursor for the row after which the next page starts.
+
+    ``value`` is the row's sort key: its ``created_at`` string for the
+    default order, or the value of the ``sort`` field otherwise.
+    """
+    key = [value, obj_id] if sort is None else [value, obj_id, sort]
+    raw = json.dumps(key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], sort: Optional[str] = None) -> Optional[Tuple[Any, str]]:
+    """
+    Turn a cursor back into a ``(value, id)`` seek key.
+
+    Without ``sort`` the value is the ``created_at`` datetime. A cursor
+    issued for a different sort order is rejected.
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(raw)
+        if sort is None:
+            created_at, obj_id = key
+            return datetime.strptime(created_at, ISO), str(obj_id)
+        value, obj_id, cursor_sort = key
+    except (ValueError, TypeError):
+        raise BadRequest("invalid cursor")
+    if cursor_sort != sort:
+        raise BadRequest("cursor does not match sort")
+    return value, str(obj_id)
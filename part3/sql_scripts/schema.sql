@@ -18,7 +18,8 @@ CREATE TABLE users (
     first_name VARCHAR(50) NOT NULL,
     last_name VARCHAR(50) NOT NULL,
     is_admin BOOLEAN NOT NULL DEFAULT FALSE,
-    INDEX idx_email (email)
+    INDEX idx_email (email),
+    INDEX idx_users_created_at_id (created_at, id)
 );
 
 -- Create places table
@@ -33,6 +34,20 @@ CREATE TABLE places (
     longitude FLOAT NOT NULL,
     owner_id VARCHAR(60) NOT NULL,
     amenity_ids TEXT NOT NULL DEFAULT '[]',
+    review_count INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_count_0 INTEGER NOT NULL DEFAULT 0,
+    rating_count_1 INTEGER NOT NULL DEFAULT 0,
+    rating_count_2 INTEGER NOT NULL DEFAULT 0,
+    rating_count_3 INTEGER NOT NULL DEFAULT 0,
+    rating_count_4 INTEGER NOT NULL DEFAULT 0,
+    rating_count_5 INTEGER NOT NULL DEFAULT 0,
+    rating FLOAT NOT NULL DEFAULT 0,
+    INDEX idx_places_owner_id (owner_id),
+    INDEX idx_places_created_at_id (created_at, id),
+    INDEX idx_places_price (price),
+    INDEX idx_places_latitude_longitude (latitude, longitude),
+    INDEX idx_places_rating (rating),
     FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE CASCADE,
     CONSTRAINT chk_price CHECK (price >= 0),
     CONSTRAINT chk_latitude CHECK (latitude >= -90.0 AND latitude <= 90.0),
@@ -48,6 +63,9 @@ CREATE TABLE reviews (
     user_id VARCHAR(60) NOT NULL,
     place_id VARCHAR(60) NOT NULL,
     rating INTEGER NOT NULL DEFAULT 0,
+    INDEX idx_reviews_user_id (user_id),
+    INDEX idx_reviews_place_id (place_id),
+    INDEX idx_reviews_created_at_id (created_at, id),
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
     FOREIGN KEY (place_id) REFERENCES places(id) ON DELETE CASCADE,
     CONSTRAINT chk_rating CHECK (rating >= 0 AND rating <= 5)
@@ -59,7 +77,8 @@ CREATE TABLE amenities (
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     name VARCHAR(50) NOT NULL,
-    description TEXT
+    description TEXT,
+    INDEX idx_amenities_created_at_id (created_at, id)
 );
 
 -- Create place_amenity association table (many-to-many)
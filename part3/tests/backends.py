@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Repository fixtures for tests run against both backends.
+
+Assertions live in a mixin with a ``seed()`` method filling ``self.repo``;
+each backend runs them by listing the mixin before the backend:
+
+    class TestMemoryX(XContract, MemoryBackend, unittest.TestCase): ...
+    class TestSQLAlchemyX(XContract, SQLAlchemyBackend, unittest.TestCase): ...
+"""
+from typing import List
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from hbnb.bl.base import Base
+from hbnb.persistence.memory_repo import MemoryRepository
+from hbnb.persistence.sqlalchemy_repo import SQLAlchemyRepository
+
+
+class MemoryBackend:
+    """``self.repo`` is a fresh MemoryRepository."""
+
+    def setUp(self):
+        self.repo = MemoryRepository()
+        self.seed()
+
+    def seed(self):
+        """Populate ``self.repo``; called by setUp."""
+
+
+class SQLAlchemyBackend:
+    """``self.repo`` is a SQLAlchemyRepository on an in-memory SQLite database."""
+
+    # Repository class wrapping the session
+    repository = SQLAlchemyRepository
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(self.engine)
+        self.repo = self.repository(self.session)
+        self.seed()
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def seed(self):
+        """Populate ``self.repo``; called by setUp."""
+
+    def record_statements(self) -> List[str]:
+        """List that collects the SQL of every statement run from now on."""
+        statements = []
+        event.listen(self.engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        return statements
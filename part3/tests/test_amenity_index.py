@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tests for the amenity bitmap index and amenity filtering/facets.
+"""
+import random
+import unittest
+from datetime import datetime
+from hbnb.facade import HbnbFacade
+from hbnb.bl.base import ISO
+from hbnb.bl.user import User
+from hbnb.errors import BadRequest
+from hbnb.indexes import Bitmap, PlaceAmenityIndex
+from tests.backends import MemoryBackend, SQLAlchemyBackend
+
+
+class TestBitmap(unittest.TestCase):
+    """Bitmap operations agree with Python sets."""
+
+    def test_matches_set_semantics(self):
+        rng = random.Random(11)
+        for _ in range(20):
+            a = {rng.randrange(300000) for _ in range(rng.randint(0, 400))}
+            b = {rng.randrange(300000) for _ in range(rng.randint(0, 400))} | set(list(a)[:50])
+            x, y = Bitmap.of(a), Bitmap.of(b)
+            self.assertEqual(list(x & y), sorted(a & b))
+            self.assertEqual(list(x | y), sorted(a | b))
+            self.assertEqual(list(x - y), sorted(a - b))
+            self.assertEqual(x.intersection_count(y), len(a & b))
+            self.assertEqual(len(x), len(a))
+
+    def test_dense_chunks(self):
+        values = list(range(3, 140000, 3))
+        self.assertEqual(list(Bitmap.of(values)), values)
+        self.assertEqual(len(Bitmap.of(values) - Bitmap.of(range(0, 140000, 2))), len(values) // 2)
+
+    def test_empty_chunks_are_dropped(self):
+        bitmap = Bitmap.of([5, 70000])
+        bitmap.discard(70000)
+        self.assertEqual(bitmap, Bitmap.of([5]))
+        self.assertIn(5, bitmap)
+        bitmap.discard(5)
+        self.assertFalse(bitmap)
+
+
+class TestPlaceAmenityIndex(unittest.TestCase):
+    """AND/OR selection, bounds, facets and ordinal reuse."""
+
+    def setUp(self):
+        self.index = PlaceAmenityIndex()
+        self.index.rebuild([
+            {"id": "a", "price": 50.0, "rating": 4.0, "amenity_ids": ["wifi", "pool"]},
+            {"id": "b", "price": 150.0, "rating": 2.0, "amenity_ids": ["wifi"]},
+            {"id": "c", "price": 80.0, "rating": 5.0, "amenity_ids": ["pool", "sauna"]},
+            {"id": "d", "price": 20.0, "rating": 0.0, "amenity_ids": []},
+        ])
+
+    def ids(self, *args, **kwargs):
+        return sorted(self.index.ids(self.index.select(*args, **kwargs)))
+
+    def test_and_or(self):
+        self.assertEqual(self.ids(["wifi", "pool"]), ["a"])
+        self.assertEqual(self.ids(["wifi", "pool"], match_all=False), ["a", "b", "c"])
+        self.assertEqual(self.ids(["wifi", "gym"]), [])
+        self.assertEqual(self.ids(), ["a", "b", "c", "d"])
+
+    def test_bounds_and_facets(self):
+        result = self.index.select(["pool"], max_price=100, min_rating=4.5)
+        self.assertEqual(self.index.ids(result), ["c"])
+        self.assertEqual(self.index.facets(self.index.select(["wifi"])), {"wifi": 2, "pool": 1})
+
+    def test_updates_and_ordinal_reuse(self):
+        self.index.add({"id": "b", "price": 150.0, "amenity_ids": ["pool"]})
+        self.assertEqual(self.ids(["wifi"]), ["a"])
+        self.index.remove("a")
+        self.index.add({"id": "e", "price": 10.0, "amenity_ids": ["wifi"]})
+        self.assertEqual(self.index._ordinals["e"], 0)
+        self.assertEqual(self.ids(["wifi"]), ["e"])
+        self.assertEqual(self.index.facets(self.index.select()), {"pool": 2, "sauna": 1, "wifi": 1})
+
+    def test_range_facets_and_bounds(self):
+        """Bucket counts and bucket-accelerated bounds agree with brute force."""
+        rng = random.Random(4)
+        index = PlaceAmenityIndex({"price": ("price", (0, 50, 100, 200)),
+                                   "lat": ("latitude", (-10, 0, 10))})
+        places = {}
+        for step in range(400):
+            place_id = f"p{rng.randrange(150)}"
+            if rng.random() < 0.15:
+                places.pop(place_id, None)
+                index.remove(place_id)
+                continue
+            places[place_id] = {"id": place_id, "price": float(rng.randrange(-5, 300)),
+                                "latitude": rng.uniform(-20, 20), "rating": rng.choice((0, 2.5, 4.0)),
+                                "amenity_ids": ["wifi"] if rng.random() < 0.5 else []}
+            index.add(dict(places[place_id]))
+        for low, high, rating in ((None, 100, None), (50, 200, 2.5), (73, 73, None), (-5, None, 4.0)):
+            expected = sorted(p["id"] for p in places.values()
+                              if (low is None or p["price"] >= low) and (high is None or p["price"] <= high)
+                              and (rating is None or p["rating"] >= rating))
+            result = index.select(min_price=low, max_price=high, min_rating=rating)
+            self.assertEqual(sorted(index.ids(result)), expected)
+        facets = index.range_facets(index.select(["wifi"]))
+        wifi = [p for p in places.values() if p["amenity_ids"]]
+        self.assertEqual([b["key"] for b in facets["price"]], ["0-50", "50-100", "100-200", "200+"])
+        self.assertEqual([b["count"] for b in facets["price"]],
+                         [sum(lo <= p["price"] < hi for p in wifi)
+                          for lo, hi in ((0, 50), (50, 100), (100, 200), (200, float("inf")))])
+        self.assertEqual(facets["lat"][-1]["count"], sum(p["latitude"] >= 10 for p in wifi))
+
+    def test_invalid_edges(self):
+        with self.assertRaises(ValueError):
+            PlaceAmenityIndex({"price": ("price", (100, 50))})
+
+
+class AmenityFilterContract:
+    """Facade amenity filters and facet counts."""
+
+    def seed(self):
+        self.facade = HbnbFacade(repo=self.repo)
+        owner = self.repo.add(User(email="o@x.com", password="pw", first_name="O", last_name="X"))
+        self.amenities = {name: self.facade.create_amenity({"name": name})["id"]
+                          for name in ("WiFi", "Pool", "Sauna")}
+        rng = random.Random(2)
+        self.expected = {}
+        for i in range(60):
+            names = [n for n in self.amenities if rng.random() < 0.5]
+            place = self.facade.create_place({
+                "name": f"P{i:02d}", "price": float(10 * (i % 10)), "latitude": 0.0,
+                "longitude": 0.0, "owner_id": owner.id,
+                "amenity_ids": [self.amenities[n] for n in names]})
+            self.expected[place["name"]] = (set(names), place["price"])
+
+    def wanted(self, names, match_all=True, max_price=None):
+        test = set(names).issubset if match_all else set(names).intersection
+        return sorted(n for n, (has, price) in self.expected.items()
+                      if test(has) and (max_price is None or price <= max_price))
+
+    def pages(self, **kwargs):
+        names, after = [], None
+        while True:
+            page = self.facade.list_places(after=after, limit=7, **kwargs)
+            names += [p["name"] for p in page]
+            if len(page) < 7:
+                return sorted(names)
+            after = (datetime.strptime(page[-1]["created_at"], ISO), page[-1]["id"])
+
+    def check_filters(self):
+        ids = self.facade.resolve_amenities(["wifi", "POOL"])
+        self.assertEqual(self.pages(amenity_ids=ids), self.wanted(["WiFi", "Pool"]))
+        self.assertEqual(self.pages(amenity_ids=ids, match_all=False),
+                         self.wanted(["WiFi", "Pool"], match_all=False))
+        self.assertEqual(self.pages(amenity_ids=ids[:1], max_price=40),
+                         self.wanted(["WiFi"], max_price=40))
+
+    def test_filters_through_id_lists(self):
+        """Small matches are passed to the query as id lists."""
+        self.check_filters()
+
+    def test_filters_while_streaming(self):
+        """Large matches filter the ordered rows instead."""
+        self.facade.AMENITY_IN_MAX = 1
+        self.check_filters()
+
+    def test_facets_follow_writes(self):
+        """Facet counts cover the whole result and see amenity changes."""
+        facets = self.facade.place_facets(amenity_ids=[self.amenities["Sauna"]])
+        with_sauna = self.wanted(["Sauna"])
+        self.assertEqual(facets["total"], len(with_sauna))
+        counts = {f["name"]: f["count"] for f in facets["amenities"]}
+        self.assertEqual(counts["Sauna"], len(with_sauna))
+        self.assertEqual(counts.get("Pool", 0), len(self.wanted(["Sauna", "Pool"])))
+
+        place_id = self.facade.list_places(amenity_ids=[self.amenities["Sauna"]], limit=1)[0]["id"]
+        self.facade.update_place(place_id, {"amenity_ids": []})
+        facets = self.facade.place_facets(amenity_ids=[self.amenities["Sauna"]])
+        self.assertEqual(facets["total"], len(with_sauna) - 1)
+
+    def test_range_facets(self):
+        """Price buckets count the filtered result; unknown facets are refused."""
+        facets = self.facade.place_facets(amenity_ids=[self.amenities["Pool"]],
+                                          max_price=60, facets=["price"])
+        with_pool = [price for has, price in self.expected.values() if "Pool" in has]
+        self.assertEqual(set(facets), {"total", "price"})
+        self.assertEqual([b["count"] for b in facets["price"]],
+                         [sum(p < 50 for p in with_pool), sum(50 <= p <= 60 for p in with_pool),
+                          0, 0, 0])
+        self.assertEqual(facets["total"], sum(p <= 60 for p in with_pool))
+        with self.assertRaises(BadRequest):
+            self.facade.place_facets(facets=["colour"])
+
+    def test_unknown_amenity(self):
+        with self.assertRaises(BadRequest):
+            self.facade.resolve_amenities(["WiFi", "jacuzzi"])
+        self.assertEqual(self.facade.resolve_amenities([self.amenities["Pool"]]),
+                         [self.amenities["Pool"]])
+
+
+class TestMemoryAmenityFilter(AmenityFilterContract, MemoryBackend, unittest.TestCase):
+    """Amenity filtering over MemoryRepository."""
+
+
+class TestSQLAlchemyAmenityFilter(AmenityFilterContract, SQLAlchemyBackend, unittest.TestCase):
+    """Amenity filtering over SQLAlchemyRepository on SQLite."""
+
+
+if __name__ == '__main__':
+    unittest.main()
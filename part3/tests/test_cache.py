@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tests for the read-through entity cache.
+"""
+import importlib
+import os
+import unittest
+from unittest import mock
+import config
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.bl.amenity import Amenity
+from hbnb.bl.place import Place
+from hbnb.persistence.cache import (CachedRepository, LRUCache, LocalSharedClient,
+                                    SharedCache, make_cache)
+from tests.backends import SQLAlchemyBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache(unittest.TestCase):
+    """Size and TTL bounds of the in-process backend."""
+
+    def test_size_bound_evicts_least_recently_used(self):
+        """The oldest untouched entry goes first."""
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get_many(["a", "b", "c"]), {"a": 1, "c": 3})
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_ttl_expiry(self):
+        """Expired entries miss and count as evictions."""
+        clock = FakeClock()
+        cache = LRUCache(ttl=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 9
+        self.assertEqual(cache.get("a"), 1)
+        clock.now = 10
+        self.assertIsNone(cache.get("a"))
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 1, 1))
+
+    def test_make_cache(self):
+        """Configuration picks the backend."""
+        self.assertIsNone(make_cache("none"))
+        self.assertIsInstance(make_cache("lru"), LRUCache)
+        self.assertIsInstance(make_cache("shared"), SharedCache)
+
+
+class TestCacheConfig(unittest.TestCase):
+    """Production never falls back to a per-process shared cache."""
+
+    def tearDown(self):
+        importlib.reload(config)
+
+    def production(self, **environ):
+        """ProductionConfig as loaded with only the given cache settings."""
+        with mock.patch.dict(os.environ, environ):
+            for name in ("CACHE_BACKEND", "CACHE_URL"):
+                if name not in environ:
+                    os.environ.pop(name, None)
+            return importlib.reload(config).ProductionConfig
+
+    def test_production_without_url_disables_caching(self):
+        """No CACHE_URL: nothing is cached rather than cached per worker."""
+        self.assertEqual(self.production().CACHE_BACKEND, "none")
+        self.assertEqual(self.production(CACHE_URL="redis://cache").CACHE_BACKEND,
+                         "shared")
+
+    def test_shared_without_url_outside_development(self):
+        """An explicit shared backend without CACHE_URL fails at startup."""
+        settings = self.production(CACHE_BACKEND="shared")
+        with self.assertRaises(RuntimeError):
+            make_cache(settings.CACHE_BACKEND, url=settings.CACHE_URL, local=False)
+        self.assertIsInstance(make_cache("shared", local=True), SharedCache)
+
+
+class CachedRepositoryContract:
+    """Read-through caching in front of a SQLite repository."""
+
+    # Whether users are cached (only outside shared backends)
+    caches_users = True
+
+    def make_cache(self):
+        raise NotImplementedError
+
+    def seed(self):
+        self.cache = self.make_cache()
+        self.repo = CachedRepository(self.repo, self.cache)
+        self.facade = HbnbFacade(repo=self.repo)
+        self.statements = self.record_statements()
+        self.owner = self.repo.add(User(email="o@x.com", password="pw", first_name="O", last_name="X"))
+        self.wifi = self.repo.add(Amenity(name="wifi"))
+        self.place = self.repo.add(Place(name="P", price=10.0, owner_id=self.owner.id,
+                                         amenity_ids=[self.wifi.id]))
+
+    def selects(self, func, *args, **kwargs):
+        self.session.expire_all()
+        self.statements.clear()
+        result = func(*args, **kwargs)
+        return result, [s for s in self.statements if s.lstrip().upper().startswith("SELECT")]
+
+    def uncached(self, selects):
+        """SELECTs other than those of classes the backend does not cache."""
+        return [s for s in selects if self.caches_users or "FROM users" not in s]
+
+    def test_hot_reads_skip_the_database(self):
+        """A repeated get_place is served without any SELECT."""
+        first, _ = self.selects(self.facade.get_place, self.place.id)
+        second, selects = self.selects(self.facade.get_place, self.place.id)
+        self.assertEqual(self.uncached(selects), [])
+        self.assertEqual(first, second)
+        _, selects = self.selects(self.facade.create_review, {
+            "text": "t", "rating": 5, "user_id": self.owner.id, "place_id": self.place.id})
+        self.assertEqual(self.uncached(selects), [])
+        self.assertGreater(self.cache.stats()["hits"], 0)
+
+    def test_update_invalidates(self):
+        """Updates are visible on the next read."""
+        self.facade.get_user(self.owner.id)
+        self.facade.update_user(self.owner.id, {"first_name": "Renamed"})
+        self.assertEqual(self.facade.get_place(self.place.id)["owner"]["first_name"], "Renamed")
+        self.assertEqual(self.facade.get_user(self.owner.id)["first_name"], "Renamed")
+
+    def test_hits_are_private_copies(self):
+        """Mutating a returned entity does not change the cached one."""
+        place = self.repo.get(Place, self.place.id)
+        place.name = "Scribbled"
+        self.assertEqual(self.repo.get(Place, self.place.id).name, "P")
+
+    def test_rolled_back_writes_are_not_cached(self):
+        """Rows read back inside a failed unit of work never reach the cache."""
+        with self.assertRaises(RuntimeError):
+            with self.repo.unit_of_work():
+                place = self.repo.get(Place, self.place.id)
+                place.name = "Uncommitted"
+                self.repo.update(place)
+                self.assertEqual(self.repo.get(Place, self.place.id).name, "Uncommitted")
+                raise RuntimeError("boom")
+        self.assertEqual(self.repo.get(Place, self.place.id).name, "P")
+
+    def test_delete_invalidates_cascaded_children(self):
+        """Deleting a user drops its cached places too."""
+        self.repo.get(Place, self.place.id)
+        self.repo.delete(User, self.owner.id)
+        self.assertIsNone(self.repo.get(User, self.owner.id))
+        self.assertIsNone(self.repo.get(Place, self.place.id))
+
+
+class TestLRUCachedRepository(CachedRepositoryContract, SQLAlchemyBackend, unittest.TestCase):
+    def make_cache(self):
+        return LRUCache()
+
+
+class TestSharedCachedRepository(CachedRepositoryContract, SQLAlchemyBackend,
+                                  unittest.TestCase):
+    caches_users = False
+
+    def make_cache(self):
+        self.client = LocalSharedClient()
+        return SharedCache(self.client)
+
+    def test_users_are_not_shared(self):
+        """Password hashes never reach the shared server."""
+        self.facade.get_place(self.place.id)
+        self.facade.get_user(self.owner.id)
+        keys = list(self.client.scan_iter(match="hbnb:*"))
+        self.assertTrue(keys)
+        self.assertFalse([key for key in keys if key.startswith("hbnb:User:")])
+        with self.assertRaises(ValueError):
+            CachedRepository(self.repo.repo, self.cache, classes=["User", "Place"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the place card projection.
+"""
+import random
+import unittest
+from datetime import datetime, timedelta
+from hbnb.facade import HbnbFacade
+from hbnb.bl.base import ISO
+from hbnb.bl.user import User
+from hbnb.indexes import PlaceCards
+from tests.backends import MemoryBackend, SQLAlchemyBackend
+
+CREATED = datetime(2025, 6, 1)
+
+
+class TestPlaceCards(unittest.TestCase):
+    """Cards stay in (created_at, id) order under random writes."""
+
+    def test_random_writes_and_pages(self):
+        rng = random.Random(22)
+        cards = PlaceCards()
+        places = {}
+        for step in range(800):
+            place_id = f"p{rng.randrange(150)}"
+            if rng.random() < 0.1:
+                places.pop(place_id, None)
+                cards.remove(place_id)
+                continue
+            places[place_id] = {"id": place_id, "name": f"N{step}", "price": float(step),
+                                "rating": rng.uniform(0, 5), "review_count": rng.randrange(9),
+                                "created_at": (CREATED + timedelta(hours=rng.randrange(40))).strftime(ISO),
+                                "description": "not on a card"}
+            cards.add(dict(places[place_id]))
+
+        expected = sorted(places.values(), key=lambda p: (p["created_at"], p["id"]))
+        self.assertEqual([c["id"] for c in cards.page()], [p["id"] for p in expected])
+        self.assertNotIn("description", cards.page(1)[0])
+        self.assertEqual(cards.page(1)[0]["name"], expected[0]["name"])
+        pages, after = [], None
+        while True:
+            page = cards.page(7, after)
+            pages += page
+            if len(page) < 7:
+                break
+            after = (page[-1]["created_at"], page[-1]["id"])
+        self.assertEqual([c["id"] for c in pages], [p["id"] for p in expected])
+
+        rebuilt = PlaceCards()
+        rebuilt.rebuild(dict(p) for p in places.values())
+        self.assertEqual(rebuilt.page(), cards.page())
+
+
+class PlaceCardsContract:
+    """Cards follow place writes and reviews."""
+
+    def test_follows_writes(self):
+        facade = HbnbFacade(repo=self.repo)
+        owner = self.repo.add(User(email="o@x.com", password="pw", first_name="O", last_name="X")).id
+        ids = [facade.create_place({"name": f"P{i}", "price": 10.0 * (i + 1), "latitude": 0.0,
+                                    "longitude": 0.0, "owner_id": owner})["id"]
+               for i in range(5)]
+        cards = facade.list_place_cards()
+        self.assertEqual([c["id"] for c in cards],
+                         [p["id"] for p in facade.list_places(limit=10)])
+        self.assertEqual(set(cards[0]), {"id", "name", "price", "created_at", "rating",
+                                         "review_count"})
+
+        facade.create_review({"text": "ok", "rating": 4, "user_id": owner, "place_id": ids[1]})
+        facade.update_place(ids[2], {"name": "Renamed", "price": 99.0})
+        facade.delete_place(ids[3])
+        by_id = {c["id"]: c for c in facade.list_place_cards()}
+        self.assertNotIn(ids[3], by_id)
+        self.assertEqual((by_id[ids[1]]["review_count"], by_id[ids[1]]["rating"]), (1, 4.0))
+        self.assertEqual((by_id[ids[2]]["name"], by_id[ids[2]]["price"]), ("Renamed", 99.0))
+
+        first = facade.list_place_cards(limit=2)
+        last = first[-1]
+        rest = facade.list_place_cards(
+            after=(datetime.strptime(last["created_at"], ISO), last["id"]), limit=10)
+        self.assertEqual(first + rest, facade.list_place_cards())
+
+
+class TestMemoryPlaceCards(PlaceCardsContract, MemoryBackend, unittest.TestCase):
+    """Place cards over MemoryRepository."""
+
+
+class TestSQLAlchemyPlaceCards(PlaceCardsContract, SQLAlchemyBackend, unittest.TestCase):
+    """Place cards over SQLAlchemyRepository on SQLite."""
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar place snapshot and the admin place statistics.
+"""
+import random
+import statistics
+import unittest
+from collections import Counter
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.errors import BadRequest
+from hbnb.indexes import PlaceColumns
+from hbnb.indexes.columns import quantile
+from tests.backends import MemoryBackend, SQLAlchemyBackend
+
+
+class TestPlaceColumns(unittest.TestCase):
+    """Column aggregates match brute force over random writes."""
+
+    def test_random_writes(self):
+        rng = random.Random(8)
+        columns = PlaceColumns()
+        places = {}
+        for step in range(600):
+            place_id = f"p{rng.randrange(200)}"
+            if rng.random() < 0.2:
+                places.pop(place_id, None)
+                columns.remove(place_id)
+                continue
+            reviews = rng.randrange(5)
+            places[place_id] = {"id": place_id, "price": float(rng.randrange(10, 400)),
+                                "latitude": rng.uniform(-60, 60), "longitude": rng.uniform(-180, 180),
+                                "owner_id": f"o{rng.randrange(12)}", "review_count": reviews,
+                                "rating_sum": reviews * rng.randrange(6)}
+            columns.add(dict(places[place_id]))
+
+        self.assertEqual(len(columns), len(places))
+        bbox = (-20.0, 150.0, 40.0, -150.0)  # crosses the antimeridian
+        inside = [p for p in places.values() if -20 <= p["latitude"] <= 40
+                  and (p["longitude"] >= 150 or p["longitude"] <= -150)]
+        for mask, expected in ((None, list(places.values())), (columns.mask(bbox), inside)):
+            prices = [p["price"] for p in expected]
+            summary = columns.summary(mask)
+            self.assertEqual(summary["places"], len(expected))
+            self.assertEqual(summary["owners"], len({p["owner_id"] for p in expected}))
+            self.assertEqual(summary["price_max"], max(prices))
+            self.assertAlmostEqual(summary["price_mean"], statistics.mean(prices))
+            self.assertEqual(summary["reviews"], sum(p["review_count"] for p in expected))
+            self.assertEqual(columns.quantiles("price", [0.5, 0.25], mask),
+                             [statistics.median(prices), statistics.quantiles(prices, method="inclusive")[0]])
+
+        counts = Counter(p["owner_id"] for p in places.values())
+        self.assertEqual(dict(columns.owner_counts(mask=columns.mask(), limit=None)), dict(counts))
+        self.assertEqual(columns.owner_counts(mask=columns.mask(owner_id="o3"), limit=None),
+                         [("o3", counts["o3"])])
+
+        sums = columns.group_sums(columns.cells(30.0), "price")
+        self.assertEqual(sum(count for count, _ in sums.values()), len(places))
+        cell = next(iter(sums))
+        members = [p["price"] for p in places.values()
+                   if (p["latitude"] // 30, p["longitude"] // 30) == cell]
+        self.assertEqual(sums[cell], (len(members), sum(members)))
+
+    def test_quantile(self):
+        self.assertIsNone(quantile([], 0.5))
+        self.assertEqual(quantile([10.0], 0.9), 10.0)
+        self.assertEqual(quantile([10.0, 20.0, 40.0], 0.75), 30.0)
+
+
+class PlaceStatsContract:
+    """Facade statistics follow writes."""
+
+    def seed(self):
+        self.facade = HbnbFacade(repo=self.repo)
+        self.owners = [self.repo.add(User(email=f"o{i}@x.com", password="pw", first_name=f"O{i}",
+                                          last_name="X")).id for i in range(2)]
+        self.ids = [self.facade.create_place({"name": f"P{i}", "price": price, "latitude": lat,
+                                              "longitude": lng, "owner_id": self.owners[i % 2]})["id"]
+                    for i, (price, lat, lng) in enumerate([(50.0, 48.8, 2.3), (150.0, 48.9, 2.4),
+                                                           (80.0, 51.5, -0.1), (20.0, 40.7, -74.0)])]
+
+    def test_stats_follow_writes(self):
+        self.assertEqual(self.facade.place_stats()["places"], 4)
+        self.facade.create_review({"text": "ok", "rating": 4, "user_id": self.owners[1],
+                                   "place_id": self.ids[0]})
+        self.facade.update_place(self.ids[1], {"price": 250.0})
+        self.facade.delete_place(self.ids[3])
+
+        stats = self.facade.place_stats()
+        self.assertEqual((stats["places"], stats["reviews"], stats["rating_mean"]), (3, 1, 4.0))
+        self.assertEqual(stats["price_max"], 250.0)
+        europe = self.facade.place_stats(bbox=(35.0, -10.0, 60.0, 10.0))
+        self.assertEqual(europe["places"], 3)
+        self.assertEqual(self.facade.place_price_percentiles([50], bbox=(45.0, 0.0, 50.0, 5.0)),
+                         {"places": 2, "percentiles": [{"percentile": 50, "price": 150.0}]})
+
+    def test_regions_and_owners(self):
+        regions = self.facade.place_price_by_region(cell_deg=10.0)
+        self.assertEqual(regions[0], {"south": 40.0, "west": 0.0, "north": 50.0, "east": 10.0,
+                                      "places": 2, "price_mean": 100.0})
+        self.assertEqual(len(regions), 3)
+        owners = self.facade.places_per_owner(limit=1)
+        self.assertEqual(owners, [{"owner_id": self.owners[0], "first_name": "O0",
+                                   "last_name": "X", "places": 2}])
+        with self.assertRaises(BadRequest):
+            self.facade.place_price_by_region(cell_deg=0)
+        with self.assertRaises(BadRequest):
+            self.facade.place_price_percentiles([101])
+
+
+class TestMemoryPlaceStats(PlaceStatsContract, MemoryBackend, unittest.TestCase):
+    """Place statistics over MemoryRepository."""
+
+
+class TestSQLAlchemyPlaceStats(PlaceStatsContract, SQLAlchemyBackend, unittest.TestCase):
+    """Place statistics over SQLAlchemyRepository on SQLite."""
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for HbnbFacade read/write paths against a SQLite database.
+"""
+import unittest
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.bl.amenity import Amenity
+from hbnb.bl.place import Place
+from hbnb.errors import BadRequest
+from tests.backends import SQLAlchemyBackend
+
+
+class FacadeTestCase(SQLAlchemyBackend, unittest.TestCase):
+    """Facade backed by SQLAlchemyRepository on an in-memory SQLite database."""
+
+    def seed(self):
+        self.facade = HbnbFacade(repo=self.repo)
+        self.statements = self.record_statements()
+
+    def count_queries(self, func, *args, **kwargs):
+        """Run func with a clean identity map and return the SELECT count."""
+        self.session.expire_all()
+        self.statements.clear()
+        func(*args, **kwargs)
+        return len([s for s in self.statements if s.lstrip().upper().startswith("SELECT")])
+
+    def add_user(self, email):
+        return self.repo.add(User(email=email, password="pw", first_name="F", last_name="L"))
+
+    def add_places(self, count, amenities):
+        start = len(self.repo.list(Place))
+        for i in range(start, start + count):
+            owner = self.add_user(f"owner{i}@x.com")
+            self.repo.add(Place(name=f"P{i}", price=10.0, owner_id=owner.id,
+                                amenity_ids=[a.id for a in amenities]))
+
+
+class TestPlaceExpansion(FacadeTestCase):
+    """Place expansion must not issue per-row queries."""
+
+    def test_list_places_query_count_is_constant(self):
+        """Listing 3 or 30 places costs the same number of queries."""
+        amenities = [self.repo.add(Amenity(name=f"A{i}")) for i in range(8)]
+        self.add_places(3, amenities)
+        small = self.count_queries(self.facade.list_places)
+        self.add_places(27, amenities)
+        large = self.count_queries(self.facade.list_places)
+        self.assertEqual(small, large)
+        self.assertLessEqual(large, 3)
+
+    def test_price_range(self):
+        """min_price/max_price are applied by the repository."""
+        owner = self.add_user("o@x.com")
+        for price in (10.0, 50.0, 90.0):
+            self.repo.add(Place(name="P", price=price, owner_id=owner.id))
+        places = self.facade.list_places(min_price=20, max_price=90)
+        self.assertEqual(sorted(p["price"] for p in places), [50.0, 90.0])
+
+    def test_expanded_payload(self):
+        """Owner and amenities are still embedded in each place."""
+        amenities = [self.repo.add(Amenity(name="WiFi"))]
+        self.add_places(2, amenities)
+        places = self.facade.list_places()
+        self.assertEqual(len(places), 2)
+        for place in places:
+            self.assertEqual(place["owner"]["id"], place["owner_id"])
+            self.assertEqual([a["name"] for a in place["amenities"]], ["WiFi"])
+
+
+class TestForeignKeyValidation(FacadeTestCase):
+    """FK checks use one id-only query per referenced table."""
+
+    def test_amenity_check_is_one_query(self):
+        """Validating 1 or 20 amenity ids costs the same."""
+        owner = self.add_user("o@x.com")
+        amenities = [self.repo.add(Amenity(name=f"A{i}")) for i in range(20)]
+        payload = {"name": "P", "price": 1.0, "owner_id": owner.id}
+        one = self.count_queries(self.facade._require_ids, Amenity,
+                                 [amenities[0].id], "bad")
+        many = self.count_queries(self.facade._require_ids, Amenity,
+                                  [a.id for a in amenities], "bad")
+        self.assertEqual(one, many)
+        place = self.facade.create_place(dict(payload, amenity_ids=[a.id for a in amenities]))
+        self.assertEqual(len(place["amenities"]), 20)
+
+    def test_missing_reference_is_rejected(self):
+        """Any unknown id fails the whole request."""
+        owner = self.add_user("o@x.com")
+        amenity = self.repo.add(Amenity(name="A"))
+        with self.assertRaises(BadRequest):
+            self.facade.create_place({"name": "P", "price": 1.0, "owner_id": owner.id,
+                                      "amenity_ids": [amenity.id, "nope"]})
+        with self.assertRaises(BadRequest):
+            self.facade.create_review({"text": "t", "rating": 3,
+                                       "user_id": owner.id, "place_id": "nope"})
+
+
+class TestUserWrites(FacadeTestCase):
+    """User writes run in their own unit of work."""
+
+    def test_failed_update_is_not_persisted(self):
+        """A rejected update leaves nothing for the next write to commit."""
+        user = self.facade.create_user({"email": "u@x.com", "password": "pw",
+                                        "first_name": "F", "last_name": "L"})
+        with self.assertRaises(ValueError):
+            self.facade.update_user(user["id"], {"email": "not-an-email"})
+        self.facade.create_amenity({"name": "WiFi"})
+        self.session.expire_all()
+        self.assertEqual(self.facade.get_user(user["id"])["email"], "u@x.com")
+
+
+if __name__ == '__main__':
+    unittest.main()
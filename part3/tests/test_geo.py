@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for bounding-box and radius searches over places.
+"""
+import unittest
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.bl.place import Place
+from hbnb.geo import bbox_around, haversine_km, in_bbox, parse_bbox
+from hbnb.persistence.memory_index import GridIndex
+from hbnb.persistence.query import QuerySpec
+from tests.backends import MemoryBackend, SQLAlchemyBackend
+
+# name -> (lat, lng)
+CITIES = {
+    "paris": (48.8566, 2.3522),
+    "versailles": (48.8049, 2.1204),
+    "orleans": (47.9030, 1.9093),
+    "london": (51.5074, -0.1278),
+    "suva": (-18.1248, 178.4501),
+    "apia": (-13.8333, -171.7667),
+}
+
+
+class TestGeoHelpers(unittest.TestCase):
+    """Distance and bounding-box math."""
+
+    def test_haversine(self):
+        """Paris-London is about 344 km."""
+        self.assertAlmostEqual(haversine_km(*CITIES["paris"], *CITIES["london"]), 343.5, delta=1)
+
+    def test_bbox_around_contains_circle(self):
+        """Points on the circle lie inside the prefilter box."""
+        box = bbox_around(60.0, 10.0, 100)
+        for lat, lng in ((60.0, 11.79), (60.0, 8.21), (60.89, 10.0), (59.11, 10.0)):
+            self.assertTrue(in_bbox(lat, lng, box))
+
+    def test_antimeridian(self):
+        """Boxes crossing the antimeridian wrap around."""
+        south, west, north, east = bbox_around(-16.0, 179.5, 200)
+        self.assertGreater(west, east)
+        self.assertTrue(in_bbox(-16.0, -179.5, (south, west, north, east)))
+        self.assertEqual(parse_bbox("170,-20,-170,-10"), (-20.0, 170.0, -10.0, -170.0))
+
+    def test_grid_index_moves_points(self):
+        """Re-inserting an object with new coordinates moves it between cells."""
+        grid = GridIndex()
+        place = Place(name="P", latitude=10.0, longitude=10.0, owner_id="o", id="p1")
+        grid.insert(place)
+        place.latitude = -10.0
+        grid.insert(place)
+        self.assertEqual(grid.within((5, 5, 15, 15)), [])
+        self.assertEqual(grid.within((-15, 5, -5, 15)), ["p1"])
+
+
+class GeoSearchContract:
+    """Bounding-box and radius place searches."""
+
+    def seed(self):
+        owner = self.repo.add(User(email="o@x.com", password="pw", first_name="O", last_name="X"))
+        for name, (lat, lng) in CITIES.items():
+            self.repo.add(Place(name=name, price=100.0, latitude=lat, longitude=lng,
+                                owner_id=owner.id))
+        self.facade = HbnbFacade(repo=self.repo)
+
+    def names(self, places):
+        return [p["name"] for p in places]
+
+    def test_radius_search_sorted_by_distance(self):
+        """Only places within the radius come back, nearest first."""
+        places = self.facade.list_places_near(48.85, 2.35, 150)
+        self.assertEqual(self.names(places), ["paris", "versailles", "orleans"])
+        self.assertLess(places[0]["distance_km"], places[1]["distance_km"])
+        self.assertEqual(self.names(self.facade.list_places_near(48.85, 2.35, 20)),
+                         ["paris", "versailles"])
+
+    def test_limit_keeps_nearest(self):
+        """A limit returns the k nearest, not the first k found."""
+        places = self.facade.list_places_near(47.9, 1.9, 500, limit=2)
+        self.assertEqual(self.names(places), ["orleans", "versailles"])
+
+    def test_bbox_across_antimeridian(self):
+        """Suva and Apia straddle 180 degrees."""
+        places = self.facade.list_places_in_bbox(parse_bbox("170,-25,-165,-10"))
+        self.assertEqual(sorted(self.names(places)), ["apia", "suva"])
+
+    def test_within_combines_with_filters(self):
+        """within() is one more condition of the spec."""
+        place = self.repo.list(Place, query=QuerySpec(name="london"))[0]
+        place.price = 10.0
+        self.repo.update(place)
+        spec = QuerySpec().between("price", 0, 50).within((40.0, -10.0, 60.0, 10.0))
+        self.assertEqual([p.name for p in self.repo.list(Place, query=spec)], ["london"])
+
+    def test_moved_place_is_found_at_new_location(self):
+        """Coordinate updates keep the spatial index in sync."""
+        place = self.repo.list(Place, query=QuerySpec(name="london"))[0]
+        self.facade.update_place(place.id, {"latitude": 48.86, "longitude": 2.34})
+        names = self.names(self.facade.list_places_near(48.85, 2.35, 5))
+        self.assertEqual(sorted(names), ["london", "paris"])
+
+
+class TestMemoryGeoSearch(GeoSearchContract, MemoryBackend, unittest.TestCase):
+    """Grid index in MemoryRepository."""
+
+    def test_grid_narrows_candidates(self):
+        """A small box only visits the places in its cells."""
+        spec = QuerySpec().within(bbox_around(48.85, 2.35, 20))
+        candidates, _ = self.repo._candidates(Place, spec)
+        self.assertEqual(len(candidates), 2)
+
+
+class TestSQLAlchemyGeoSearch(GeoSearchContract, SQLAlchemyBackend, unittest.TestCase):
+    """R*Tree prefilter in SQLAlchemyRepository on SQLite."""
+
+    def test_rtree_prefilter_is_used(self):
+        """Box queries select ids from the R*Tree, not the whole table."""
+        statements = self.record_statements()
+        self.repo.locate(Place, QuerySpec().within((48.0, 2.0, 49.0, 3.0)))
+        self.assertIn("places_rtree", statements[-1])
+        self.assertNotIn("places.name", statements[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the place KD-tree and the nearby-places facade method.
+"""
+import random
+import unittest
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.geo import haversine_km
+from hbnb.indexes import PlaceKDTree
+from tests.backends import SQLAlchemyBackend
+
+
+def record(place_id, lat, lng):
+    return {"id": place_id, "latitude": lat, "longitude": lng}
+
+
+class TestPlaceKDTree(unittest.TestCase):
+    """k-NN answers match a brute-force haversine ranking."""
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.points = {f"p{i}": (rng.uniform(-89, 89), rng.uniform(-180, 180)) for i in range(2000)}
+        self.tree = PlaceKDTree(rebuild_ratio=0.01, min_overlay=50)
+        self.tree.rebuild(record(i, *p) for i, p in self.points.items())
+
+    def brute_force(self, lat, lng, k, exclude=()):
+        ranked = sorted((haversine_km(lat, lng, *p), i)
+                        for i, p in self.points.items() if i not in exclude)
+        return [i for _, i in ranked[:k]]
+
+    def check(self, lat, lng, k=10, exclude=()):
+        found = self.tree.nearest(lat, lng, k, exclude=exclude)
+        self.assertEqual([i for _, i in found], self.brute_force(lat, lng, k, exclude))
+        for distance, i in found:
+            self.assertAlmostEqual(distance, haversine_km(lat, lng, *self.points[i]), places=6)
+
+    def test_matches_brute_force(self):
+        """Random queries, including near the poles and the antimeridian."""
+        for lat, lng in ((0, 0), (48.85, 2.35), (-88, 10), (10, 179.9), (10, -179.9)):
+            self.check(lat, lng)
+
+    def test_overlay_and_rebuild(self):
+        """Moves, inserts and removals are visible before and after a rebuild."""
+        self.points["p1"] = (48.85, 2.35)
+        self.tree.add(record("p1", 48.85, 2.35))
+        self.points["new"] = (48.86, 2.36)
+        self.tree.add(record("new", 48.86, 2.36))
+        del self.points["p2"]
+        self.tree.remove("p2")
+        self.check(48.85, 2.35, exclude=["p1"])
+        for i in range(3, 60):
+            del self.points[f"p{i}"]
+            self.tree.remove(f"p{i}")
+        self.assertEqual(self.tree._overlay, {})
+        self.check(48.85, 2.35)
+        self.assertEqual(len(self.tree), len(self.points))
+
+
+class TestNearbyPlaces(SQLAlchemyBackend, unittest.TestCase):
+    """Facade nearby queries follow committed place writes."""
+
+    def seed(self):
+        self.facade = HbnbFacade(repo=self.repo)
+        owner = self.repo.add(User(email="o@x.com", password="pw", first_name="O", last_name="X"))
+        self.owner_id = owner.id
+        self.ids = {}
+        for name, lat, lng in (("paris", 48.8566, 2.3522), ("versailles", 48.8049, 2.1204),
+                               ("london", 51.5074, -0.1278), ("rome", 41.9028, 12.4964)):
+            self.ids[name] = self.create(name, lat, lng)["id"]
+
+    def create(self, name, lat, lng):
+        return self.facade.create_place({"name": name, "price": 10.0, "latitude": lat,
+                                         "longitude": lng, "owner_id": self.owner_id})
+
+    def names(self, place_id, k=3):
+        return [p["name"] for p in self.facade.list_nearby_places(place_id, k)]
+
+    def test_nearest_first_without_self(self):
+        """The place itself is excluded and distances increase."""
+        self.assertEqual(self.names(self.ids["paris"]), ["versailles", "london", "rome"])
+
+    def test_writes_update_the_tree(self):
+        """Created, moved and deleted places are reflected."""
+        self.names(self.ids["paris"])
+        self.create("orsay", 48.86, 2.33)
+        self.facade.update_place(self.ids["rome"], {"latitude": 48.85, "longitude": 2.36})
+        self.facade.delete_place(self.ids["versailles"])
+        self.assertEqual(self.names(self.ids["paris"]), ["rome", "orsay", "london"])
+
+    def test_rolled_back_write_is_ignored(self):
+        """Indexes only see committed writes."""
+        self.names(self.ids["paris"])
+        with self.assertRaises(RuntimeError):
+            with self.repo.unit_of_work():
+                self.create("ghost", 48.8567, 2.3523)
+                raise RuntimeError("boom")
+        self.assertEqual(self.names(self.ids["paris"], 1), ["versailles"])
+
+
+if __name__ == '__main__':
+    unittest.main()
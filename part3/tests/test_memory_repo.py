@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for MemoryRepository secondary and range indexes.
+"""
+import unittest
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.bl.place import Place
+from hbnb.bl.review import Review
+from hbnb.persistence.memory_repo import MemoryRepository
+from hbnb.persistence.query import QuerySpec
+
+
+class TestHashIndexes(unittest.TestCase):
+    """Declared hash indexes stay in sync with writes."""
+
+    def setUp(self):
+        self.repo = MemoryRepository()
+        self.user = self.repo.add(User(email="a@x.com", password="pw", first_name="A", last_name="X"))
+
+    def by(self, cls, **equals):
+        return self.repo.list(cls, query=QuerySpec(**equals))
+
+    def test_unique_email(self):
+        """A second user with the same email is rejected."""
+        with self.assertRaises(ValueError):
+            self.repo.add(User(email="a@x.com", password="pw", first_name="B", last_name="X"))
+        self.assertEqual(HbnbFacade(repo=self.repo).get_user_by_email("a@x.com"), self.user)
+
+    def test_update_moves_entry(self):
+        """Changing an indexed field in place is picked up by update()."""
+        place = self.repo.add(Place(name="P", owner_id=self.user.id))
+        place.owner_id = "someone-else"
+        self.repo.update(place)
+        self.assertEqual(self.by(Place, owner_id=self.user.id), [])
+        self.assertEqual(self.by(Place, owner_id="someone-else"), [place])
+
+    def test_delete_removes_entry(self):
+        """Deleted rows disappear from index lookups."""
+        review = self.repo.add(Review(text="t", user_id=self.user.id, place_id="p1"))
+        self.repo.delete(Review, review.id)
+        self.assertEqual(self.by(Review, place_id="p1"), [])
+
+    def test_index_lookup_avoids_scan(self):
+        """Indexed equality only evaluates matching candidates."""
+        for i in range(50):
+            self.repo.add(Review(text="t", user_id=self.user.id, place_id=f"p{i % 5}"))
+        candidates, _ = self.repo._candidates(Review, QuerySpec(place_id="p3"))
+        self.assertEqual(len(candidates), 10)
+        self.assertEqual(len(self.by(Review, place_id="p3", user_id=self.user.id)), 10)
+
+
+class TestSortedIndexes(unittest.TestCase):
+    """Bisect range indexes answer ranges and top-k in order."""
+
+    def setUp(self):
+        self.repo = MemoryRepository()
+        self.places = [self.repo.add(Place(name=f"P{i}", price=float(p), owner_id="o"))
+                       for i, p in enumerate([80, 20, 150, 20, 300, 45])]
+
+    def prices(self, query):
+        return [p.price for p in self.repo.list(Place, query=query)]
+
+    def test_between(self):
+        """Inclusive and exclusive bounds match SQL semantics."""
+        self.assertEqual(sorted(self.prices(QuerySpec().between("price", 20, 80))), [20, 20, 45, 80])
+        spec = QuerySpec().greater_than("price", 20).less_than("price", 150)
+        self.assertEqual(sorted(self.prices(spec)), [45, 80])
+
+    def test_top_k_walks_index(self):
+        """ORDER BY an indexed field with LIMIT is served in index order."""
+        spec = QuerySpec().order_by("-price").limit(2)
+        rows, ordered = self.repo._candidates(Place, spec)
+        self.assertTrue(ordered)
+        self.assertEqual(self.prices(spec), [300, 150])
+        spec = QuerySpec().between("price", 30, 200).order_by("price").limit(2)
+        self.assertEqual(self.prices(spec), [45, 80])
+
+    def test_order_by_created_at(self):
+        """Timestamps are indexed too; equal stamps keep a stable order."""
+        spec = QuerySpec().order_by("created_at").limit(3)
+        self.assertEqual(len(self.repo.list(Place, query=spec)), 3)
+
+    def test_price_update_is_reflected(self):
+        """Changing a price through update() moves the entry."""
+        cheap = self.places[1]
+        cheap.price = 999.0
+        self.repo.update(cheap)
+        self.assertEqual(self.prices(QuerySpec().order_by("-price").limit(1)), [999.0])
+        self.assertEqual(self.prices(QuerySpec().between("price", 0, 30)), [20.0])
+        self.repo.delete(Place, cheap.id)
+        self.assertEqual(self.prices(QuerySpec().order_by("-price").limit(1)), [300.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for in-place upgrades of databases created by earlier versions.
+"""
+import unittest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+from hbnb.facade import HbnbFacade
+from hbnb.bl.base import Base
+from hbnb.bl.amenity import Amenity
+from hbnb.persistence.migrations import upgrade_schema
+from hbnb.persistence.sqlalchemy_repo import SQLAlchemyRepository
+
+
+class TestUpgradeSchema(unittest.TestCase):
+    """upgrade_schema on SQLite tables written by an older schema."""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def upgrade(self):
+        with self.engine.begin() as connection:
+            return upgrade_schema(connection)
+
+    def test_creates_missing_indexes(self):
+        """Indexes declared after the table was created are added once."""
+        with self.engine.begin() as connection:
+            connection.execute(text("DROP INDEX ix_amenities_created_at_id"))
+        self.assertEqual(self.upgrade(), {"amenities": ["ix_amenities_created_at_id"]})
+        self.assertEqual(self.upgrade(), {})
+        names = {index["name"] for index in inspect(self.engine).get_indexes("amenities")}
+        self.assertIn("ix_amenities_created_at_id", names)
+
+    def test_adds_missing_columns(self):
+        """Rating aggregates are added to an old places table with their defaults."""
+        with self.engine.begin() as connection:
+            connection.execute(text("DROP TABLE places"))
+            connection.execute(text(
+                "CREATE TABLE places (id VARCHAR(60) PRIMARY KEY, name VARCHAR(100) NOT NULL, "
+                "description TEXT, price FLOAT NOT NULL, latitude FLOAT NOT NULL, "
+                "longitude FLOAT NOT NULL, owner_id VARCHAR(60) NOT NULL, "
+                "amenity_ids TEXT NOT NULL, created_at DATETIME NOT NULL, "
+                "updated_at DATETIME NOT NULL)"))
+            connection.execute(text(
+                "INSERT INTO places VALUES ('p', 'P', NULL, 10, 0, 0, 'o', '[]', "
+                "'2025-01-01 10:00:00', '2025-01-01 10:00:00')"))
+        added = self.upgrade()["places"]
+        self.assertIn("review_count", added)
+        self.assertIn("ix_places_rating", added)
+        with self.engine.connect() as connection:
+            row = connection.execute(text(
+                "SELECT review_count, rating_count_5, rating FROM places")).one()
+        self.assertEqual(tuple(row), (0, 0, 0.0))
+        self.assertEqual(self.upgrade(), {})
+
+    def test_normalizes_server_default_timestamps(self):
+        """Rows sharing a second-precision timestamp page without gaps."""
+        with self.engine.begin() as connection:
+            for amenity_id in ("a", "b", "c"):
+                connection.execute(text(
+                    "INSERT INTO amenities (id, name, created_at, updated_at) "
+                    "VALUES (:id, :id, '2025-01-01 10:00:00', '2025-01-01 10:00:00')"),
+                    {"id": amenity_id})
+        self.upgrade()
+        with Session(self.engine) as session:
+            facade = HbnbFacade(repo=SQLAlchemyRepository(session))
+            seen, after = [], None
+            while True:
+                page = facade.repo.list(Amenity, query=facade._paged(None, after, 1))
+                if not page:
+                    break
+                seen.append(page[0].id)
+                after = (page[0].created_at, page[0].id)
+        self.assertEqual(seen, ["a", "b", "c"])
+
+
+if __name__ == '__main__':
+    unittest.main()
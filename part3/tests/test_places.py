@@ -27,5 +27,76 @@ class PlaceApiTest(unittest.TestCase):
         res = self.app.put(f'/api/v1/places/{pid}', json={"price": 120})
         self.assertEqual(res.status_code, 200)
 
+
+class SeededPlaceApiTest(unittest.TestCase):
+    """Two places of one owner offering WiFi, created through the facade."""
+
+    def setUp(self):
+        app = create_app("testing")
+        self.app = app.test_client()
+        facade = app.config["FACADE"]
+        with app.app_context():
+            owner = facade.create_user({"email": "o@x.com", "password": "pw",
+                                        "first_name": "O", "last_name": "X"})
+            wifi = facade.create_amenity({"name": "WiFi"})
+            for name in ("Loft", "Barn"):
+                facade.create_place({"name": name, "price": 50.0, "latitude": 0.0,
+                                     "longitude": 0.0, "owner_id": owner["id"],
+                                     "amenity_ids": [wifi["id"]]})
+        self.owner_id, self.amenity_id = owner["id"], wifi["id"]
+
+
+class PlaceCompoundApiTest(SeededPlaceApiTest):
+    """GET /places?compound=true side-loads owners and amenities."""
+
+    def test_compound_envelope(self):
+        res = self.app.get('/api/v1/places?compound=true')
+        self.assertEqual(res.status_code, 200)
+        body = res.get_json()
+        self.assertEqual(set(body), {"places", "included"})
+        self.assertEqual(len(body["places"]), 2)
+        for place in body["places"]:
+            self.assertNotIn("owner", place)
+            self.assertNotIn("amenities", place)
+            self.assertEqual(place["owner_id"], self.owner_id)
+            self.assertEqual(place["amenity_ids"], [self.amenity_id])
+        included = body["included"]
+        self.assertEqual([o["id"] for o in included["owners"]], [self.owner_id])
+        self.assertNotIn("password", included["owners"][0])
+        self.assertEqual([a["name"] for a in included["amenities"]], ["WiFi"])
+
+    def test_compound_with_fields(self):
+        res = self.app.get('/api/v1/places?compound=true&fields=name,owner')
+        body = res.get_json()
+        self.assertEqual(set(body["places"][0]), {"name", "owner_id"})
+        self.assertEqual(set(body["included"]), {"owners"})
+
+
+class PlaceFieldMaskApiTest(SeededPlaceApiTest):
+    """The X-Fields header selects fields unless ?fields= is given."""
+
+    def test_item_honours_header(self):
+        place_id = self.app.get('/api/v1/places').get_json()[0]["id"]
+        res = self.app.get(f'/api/v1/places/{place_id}',
+                           headers={"X-Fields": "name,owner{first_name}"})
+        self.assertEqual(res.status_code, 200)
+        body = res.get_json()
+        self.assertEqual(set(body), {"name", "owner"})
+        self.assertEqual(body["owner"], {"first_name": "O"})
+
+    def test_list_honours_header(self):
+        res = self.app.get('/api/v1/places', headers={"X-Fields": "id,price"})
+        self.assertEqual([set(place) for place in res.get_json()], [{"id", "price"}] * 2)
+        res = self.app.get('/api/v1/places', headers={"X-Fields": "*,owner{id}"})
+        self.assertEqual(res.get_json()[0]["owner"], {"id": self.owner_id})
+        self.assertIn("amenities", res.get_json()[0])
+
+    def test_fields_take_precedence(self):
+        res = self.app.get('/api/v1/places?fields=name', headers={"X-Fields": "id"})
+        self.assertEqual(set(res.get_json()[0]), {"name"})
+        res = self.app.get('/api/v1/places', headers={"X-Fields": "name{"})
+        self.assertEqual(res.status_code, 400)
+
+
 if __name__ == '__main__':
     unittest.main()
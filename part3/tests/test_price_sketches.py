@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the quantile sketch and the per-cell place price sketches.
+"""
+import math
+import random
+import unittest
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.geo import in_bbox
+from hbnb.indexes import PlacePriceSketches
+from hbnb.sketch import QuantileSketch
+from tests.backends import MemoryBackend, SQLAlchemyBackend
+
+FRACTIONS = (0.0, 0.25, 0.5, 0.75, 0.95, 1.0)
+
+
+def exact_quantile(ordered, fraction):
+    return ordered[math.floor(fraction * (len(ordered) - 1))]
+
+
+class QuantileAssertions:
+
+    def assertQuantiles(self, sketch, values, alpha=0.01):
+        ordered = sorted(values)
+        self.assertEqual(sketch.count, len(values))
+        self.assertAlmostEqual(sketch.total, sum(values), places=6)
+        for fraction, found in zip(FRACTIONS, sketch.quantiles(FRACTIONS)):
+            expected = exact_quantile(ordered, fraction)
+            self.assertLessEqual(abs(found - expected), alpha * expected + 1e-9, fraction)
+
+
+class TestQuantileSketch(QuantileAssertions, unittest.TestCase):
+    """Quantiles stay within alpha through merges and removals."""
+
+    def test_accuracy_merge_and_remove(self):
+        rng = random.Random(3)
+        values = [rng.lognormvariate(4, 1) for _ in range(5000)] + [0.0] * 20
+        left, right = QuantileSketch(), QuantileSketch()
+        for i, value in enumerate(values):
+            (left if i % 2 else right).add(value)
+        left.merge(right)
+        self.assertQuantiles(left, values)
+        self.assertEqual(left.min, 0.0)
+
+        removed = values[::3]
+        for value in removed:
+            left.remove(value)
+        kept = [v for i, v in enumerate(values) if i % 3]
+        self.assertQuantiles(left, kept)
+        self.assertAlmostEqual(left.rank(exact_quantile(sorted(kept), 0.5)), 0.5, delta=0.01)
+        self.assertEqual(sum(left.histogram(left.min, left.max, 7)), len(kept))
+
+    def test_empty(self):
+        sketch = QuantileSketch()
+        self.assertEqual(sketch.quantiles([0.5]), [None])
+        self.assertIsNone(sketch.min)
+        self.assertIsNone(sketch.rank(10.0))
+        with self.assertRaises(ValueError):
+            sketch.merge(QuantileSketch(alpha=0.05))
+
+
+class TestPlacePriceSketches(QuantileAssertions, unittest.TestCase):
+    """Box queries match brute force over random writes."""
+
+    def test_random_boxes(self):
+        rng = random.Random(6)
+        index = PlacePriceSketches(cell_sizes=(20.0, 4.0, 1.0))
+        places = {}
+        for step in range(3000):
+            place_id = f"p{rng.randrange(1500)}"
+            if rng.random() < 0.1:
+                places.pop(place_id, None)
+                index.remove(place_id)
+                continue
+            places[place_id] = {"id": place_id, "price": rng.uniform(5, 900),
+                                "latitude": rng.uniform(-50, 50), "longitude": rng.uniform(-180, 180)}
+            index.add(dict(places[place_id]))
+
+        prices = [p["price"] for p in places.values()]
+        self.assertQuantiles(index.sketch(), prices)
+        self.assertEqual(index.summary()[1], (min(prices), max(prices)))
+        boxes = [(-50.0, -180.0, 50.0, 180.0), (-10.5, 160.25, 30.0, -170.5)]
+        for _ in range(20):
+            south, north = sorted(rng.uniform(-55, 55) for _ in range(2))
+            boxes.append((south, rng.uniform(-180, 180), north, rng.uniform(-180, 180)))
+        for box in boxes:
+            inside = [p["price"] for p in places.values()
+                      if in_bbox(p["latitude"], p["longitude"], box)]
+            sketch, prices = index.summary(box)
+            if inside:
+                self.assertQuantiles(sketch, inside)
+                self.assertEqual(prices, (min(inside), max(inside)))
+            else:
+                self.assertEqual((sketch.count, prices), (0, None))
+
+    def test_cell_sizes_must_nest(self):
+        with self.assertRaises(ValueError):
+            PlacePriceSketches(cell_sizes=(10.0, 3.0))
+
+
+class PriceStatsContract:
+    """Facade price statistics follow place writes."""
+
+    def test_follows_writes(self):
+        facade = HbnbFacade(repo=self.repo)
+        owner = self.repo.add(User(email="o@x.com", password="pw", first_name="O", last_name="X"))
+        ids = [facade.create_place({"name": f"P{i}", "price": float(price), "latitude": 48.85,
+                                    "longitude": 2.35, "owner_id": owner.id})["id"]
+               for i, price in enumerate((40, 60, 80, 100, 500))]
+        paris = (48.0, 2.0, 49.0, 3.0)
+        stats = facade.place_price_stats(paris, bins=4, price=70.0)
+        self.assertEqual((stats["count"], stats["mean"], stats["price_rank"]), (5, 156.0, 0.4))
+        self.assertEqual((stats["min"], stats["max"]), (40.0, 500.0))
+        self.assertAlmostEqual(stats["percentiles"]["p50"], 80.0, delta=0.8)
+        self.assertEqual([b["count"] for b in stats["histogram"]], [4, 0, 0, 1])
+
+        facade.update_place(ids[4], {"price": 120.0})
+        facade.update_place(ids[0], {"latitude": 10.0})
+        facade.delete_place(ids[1])
+        stats = facade.place_price_stats(paris)
+        self.assertEqual((stats["count"], stats["mean"]), (3, 100.0))
+        self.assertEqual((stats["min"], stats["max"]), (80.0, 120.0))
+        self.assertEqual(facade.place_price_stats()["count"], 4)
+
+
+class TestMemoryPriceStats(PriceStatsContract, MemoryBackend, unittest.TestCase):
+    """Price statistics over MemoryRepository."""
+
+
+class TestSQLAlchemyPriceStats(PriceStatsContract, SQLAlchemyBackend, unittest.TestCase):
+    """Price statistics over SQLAlchemyRepository on SQLite."""
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for sparse place fieldsets and opt-in relation expansion.
+"""
+import unittest
+from hbnb.facade import HbnbFacade
+from hbnb.bl.place import Place
+from hbnb.bl.user import User
+from hbnb.errors import BadRequest
+from hbnb.persistence.query import QuerySpec
+from tests.backends import MemoryBackend, SQLAlchemyBackend
+
+
+class ProjectionContract:
+    """Column selection and relation expansion of place reads."""
+
+    def seed(self):
+        self.facade = HbnbFacade(repo=self.repo)
+        self.owner = self.repo.add(User(email="o@x.com", password="pw", first_name="O",
+                                        last_name="X")).id
+        self.wifi = self.facade.create_amenity({"name": "WiFi"})["id"]
+        self.ids = [self.facade.create_place({"name": f"P{i}", "description": "long text",
+                                              "price": 10.0 * (i + 1), "latitude": 0.0,
+                                              "longitude": 0.0, "owner_id": self.owner,
+                                              "amenity_ids": [self.wifi]})["id"]
+                    for i in range(4)]
+
+    def test_rows(self):
+        rows = list(self.repo.rows(Place, ["id", "price", "amenity_ids"],
+                                   QuerySpec().order_by("price").limit(2)))
+        self.assertEqual([set(row) for row in rows], [{"id", "price", "amenity_ids"}] * 2)
+        self.assertEqual([row["price"] for row in rows], [10.0, 20.0])
+        self.assertEqual(Place.row_to_dict(rows[0])["amenity_ids"], [self.wifi])
+        with self.assertRaises(ValueError):
+            list(self.repo.rows(Place, ["nope"]))
+
+    def test_fields(self):
+        places = self.facade.list_places(limit=2, fields=["name", "rating_histogram"])
+        self.assertEqual([p["name"] for p in places], ["P0", "P1"])
+        self.assertNotIn("description", places[0])
+        self.assertNotIn("owner", places[0])
+        self.assertEqual(places[0]["rating_histogram"], [0] * 6)
+        self.assertFalse({"price", "latitude", "owner_id"} & set(places[0]))
+        # The cursor key is always read
+        self.assertIn("created_at", places[0])
+        by_price = self.facade.list_places(sort="-price", fields=["name"], limit=1)
+        self.assertEqual((by_price[0]["name"], by_price[0]["price"]), ("P3", 40.0))
+        with self.assertRaises(BadRequest):
+            self.facade.list_places(fields=["password"])
+
+    def test_expand(self):
+        full = self.facade.list_places(limit=1)[0]
+        self.assertEqual(full["owner"]["first_name"], "O")
+        self.assertEqual(full["amenities"][0]["name"], "WiFi")
+        bare = self.facade.list_places(limit=1, expand=[])[0]
+        self.assertNotIn("owner", bare)
+        self.assertNotIn("amenities", bare)
+        self.assertEqual(bare["amenity_ids"], [self.wifi])
+        # A relation outside the fields is not expanded
+        place = self.facade.list_places(limit=1, fields=["name", "amenities"])[0]
+        self.assertNotIn("owner", place)
+        self.assertEqual(place["amenities"][0]["name"], "WiFi")
+        top = self.facade.list_places(sort="top", limit=1, fields=["owner"], expand=["owner"])
+        self.assertEqual(top[0]["owner"]["id"], self.owner)
+        self.assertIn("score", top[0])
+        filtered = self.facade.list_places(amenity_ids=[self.wifi], fields=["name"], expand=[])
+        self.assertEqual(sorted(p["name"] for p in filtered), ["P0", "P1", "P2", "P3"])
+        self.assertNotIn("owner", self.facade.get_place(self.ids[0], expand=["amenities"]))
+        with self.assertRaises(BadRequest):
+            self.facade.list_places(expand=["reviews"])
+
+    def test_included(self):
+        """Side-loaded relations list each owner and amenity once."""
+        pool = self.facade.create_amenity({"name": "Pool"})["id"]
+        other = self.repo.add(User(email="p@x.com", password="pw", first_name="P",
+                                   last_name="Y")).id
+        self.facade.create_place({"name": "P4", "price": 50.0, "latitude": 0.0, "longitude": 0.0,
+                                  "owner_id": other, "amenity_ids": [pool, self.wifi]})
+        places = self.facade.list_places(expand=[])
+        included = self.facade.place_included(places)
+        self.assertEqual([o["id"] for o in included["owners"]], [self.owner, other])
+        self.assertEqual([a["name"] for a in included["amenities"]], ["WiFi", "Pool"])
+        self.assertEqual(self.facade.place_included(places, expand=["owner"]).keys(), {"owners"})
+        self.assertEqual(self.facade.place_included([]), {"owners": [], "amenities": []})
+
+
+class TestMemoryProjection(ProjectionContract, MemoryBackend, unittest.TestCase):
+    """Projection over MemoryRepository."""
+
+
+class TestSQLAlchemyProjection(ProjectionContract, SQLAlchemyBackend, unittest.TestCase):
+    """Projection over SQLAlchemyRepository on SQLite."""
+
+    def test_statements(self):
+        """Only the needed columns are selected, and unexpanded tables are not read."""
+        statements = self.record_statements()
+        self.facade.list_places(limit=2, fields=["name", "price"])
+        self.assertEqual(len(statements), 1)
+        self.assertNotIn("description", statements[0])
+        self.assertNotIn("amenity_ids", statements[0])
+        self.assertNotIn("users", statements[0])
+
+        statements.clear()
+        self.facade.list_places(limit=2, fields=["name", "owner"])
+        self.assertEqual(len(statements), 2)
+        self.assertIn("users", statements[1])
+        self.assertNotIn("amenities", " ".join(statements))
+
+
+if __name__ == '__main__':
+    unittest.main()
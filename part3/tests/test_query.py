@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for QuerySpec evaluation in both repository backends.
+"""
+import unittest
+from sqlalchemy import event
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.bl.place import Place
+from hbnb.bl.review import Review
+from hbnb.persistence.query import QuerySpec
+from tests.backends import MemoryBackend, SQLAlchemyBackend
+
+
+class QuerySpecContract:
+    """Filters, ordering and keyset seeks over places and reviews."""
+
+    def seed(self):
+        """Add one owner, three places and a few reviews."""
+        repo = self.repo
+        self.owner = repo.add(User(email="o@x.com", password="pw", first_name="O", last_name="X"))
+        other = repo.add(User(email="p@x.com", password="pw", first_name="P", last_name="X"))
+        for name, price in (("A", 50.0), ("B", 120.0), ("C", 300.0)):
+            place = repo.add(Place(name=name, price=price, owner_id=self.owner.id))
+            for rating in (2, 5):
+                repo.add(Review(text="t", rating=rating, user_id=other.id, place_id=place.id))
+
+    def test_equality(self):
+        """Equality conditions only return matching rows."""
+        places = self.repo.list(Place, query=QuerySpec(name="B"))
+        self.assertEqual([p.name for p in places], ["B"])
+
+    def test_in_and_range(self):
+        """IN and range conditions combine with AND."""
+        spec = QuerySpec().where_in("name", ["A", "B", "C"]).between("price", 100, 300)
+        names = sorted(p.name for p in self.repo.list(Place, query=spec))
+        self.assertEqual(names, ["B", "C"])
+
+    def test_order_and_limit(self):
+        """Ordering is applied before the limit."""
+        spec = QuerySpec().order_by("-price").limit(2)
+        self.assertEqual([p.name for p in self.repo.list(Place, query=spec)], ["C", "B"])
+
+    def test_predicate_runs_before_limit(self):
+        """A Python predicate never sees rows cut by the limit."""
+        spec = QuerySpec().order_by("price").limit(1)
+        places = self.repo.list(Place, predicate=lambda p: p.price > 100, query=spec)
+        self.assertEqual([p.name for p in places], ["B"])
+
+    def test_keyset_pages_cover_everything_once(self):
+        """Seeking past (created_at, id) walks every row exactly once."""
+        seen, after = [], None
+        while True:
+            spec = QuerySpec().order_by("created_at", "id").seek_after(after).limit(4)
+            page = self.repo.list(Review, query=spec)
+            if not page:
+                break
+            seen.extend(r.id for r in page)
+            after = (page[-1].created_at, page[-1].id)
+        self.assertEqual(sorted(seen), sorted(r.id for r in self.repo.list(Review)))
+        self.assertEqual(len(seen), 6)
+
+    def test_facade_paging(self):
+        """Facade list methods accept a seek key and limit."""
+        facade = HbnbFacade(repo=self.repo)
+        first = facade.list_places(limit=2)
+        last = self.repo.get(Place, first[-1]["id"])
+        rest = facade.list_places(after=(last.created_at, last.id), limit=5)
+        self.assertEqual(len(first) + len(rest), 3)
+        self.assertFalse({p["id"] for p in first} & {p["id"] for p in rest})
+
+    def test_facade_reviews_for_place(self):
+        """Facade per-place and per-owner reads go through the spec."""
+        facade = HbnbFacade(repo=self.repo)
+        place = self.repo.list(Place, query=QuerySpec(name="A"))[0]
+        reviews = facade.list_reviews_for_place(place.id)
+        self.assertEqual(sorted(r["rating"] for r in reviews), [2, 5])
+        self.assertEqual(len(facade.list_places_by_owner(self.owner.id)), 3)
+        self.assertEqual(facade.get_user_by_email("o@x.com").id, self.owner.id)
+
+
+class TestMemoryQuerySpec(QuerySpecContract, MemoryBackend, unittest.TestCase):
+    """QuerySpec against MemoryRepository."""
+
+
+class TestSQLAlchemyQuerySpec(QuerySpecContract, SQLAlchemyBackend, unittest.TestCase):
+    """QuerySpec against SQLAlchemyRepository on SQLite."""
+
+    def test_filter_is_compiled_to_sql(self):
+        """Per-place review reads filter in the WHERE clause."""
+        statements = self.record_statements()
+        place = self.repo.list(Place, query=QuerySpec(name="A"))[0]
+        self.repo.list(Review, query=QuerySpec(place_id=place.id))
+        self.assertIn("WHERE reviews.place_id", statements[-1])
+
+    def test_seek_uses_where_not_offset(self):
+        """Keyset pages compile to a range predicate with a zero offset."""
+        statements = []
+        event.listen(self.engine, "before_cursor_execute",
+                     lambda conn, cursor, stmt, params, *args: statements.append((stmt, params)))
+        first = self.repo.list(Review, query=QuerySpec().order_by("created_at", "id").limit(1))[0]
+        spec = QuerySpec().order_by("created_at", "id").seek_after((first.created_at, first.id))
+        self.repo.list(Review, query=spec.limit(2))
+        statement, params = statements[-1]
+        self.assertIn("reviews.created_at >=", statement)
+        # SQLite always renders "LIMIT ? OFFSET ?"; the offset must stay 0
+        self.assertEqual(params[-2:], (2, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-place rating aggregates maintained by review writes.
+"""
+import unittest
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.bl.place import Place
+from hbnb.bl.review import Review
+from tests.backends import MemoryBackend, SQLAlchemyBackend
+
+
+class RatingContract:
+    """Review writes keep the place rating aggregates in step."""
+
+    def seed(self):
+        self.facade = HbnbFacade(repo=self.repo)
+        self.user_id = self.repo.add(User(email="u@x.com", password="pw",
+                                          first_name="U", last_name="X")).id
+        self.places = {}
+        for name in ("a", "b", "c"):
+            place = self.repo.add(Place(name=name, price=10.0, owner_id=self.user_id))
+            self.places[name] = place.id
+
+    def review(self, place, rating):
+        return self.facade.create_review({"text": "ok", "rating": rating,
+                                          "user_id": self.user_id,
+                                          "place_id": self.places[place]})
+
+    def place(self, name):
+        return self.facade.get_place(self.places[name])
+
+    def test_create_update_delete(self):
+        """Count, mean and histogram follow every review write."""
+        first = self.review("a", 5)
+        self.review("a", 3)
+        place = self.place("a")
+        self.assertEqual((place["review_count"], place["rating"]), (2, 4.0))
+        self.assertEqual(place["rating_histogram"], [0, 0, 0, 1, 0, 1])
+
+        self.facade.update_review(first["id"], {"rating": 1})
+        self.assertEqual(self.place("a")["rating"], 2.0)
+        self.facade.update_review(first["id"], {"place_id": self.places["b"]})
+        self.assertEqual(self.place("a")["review_count"], 1)
+        self.assertEqual(self.place("b")["rating_histogram"], [0, 1, 0, 0, 0, 0])
+
+        self.facade.delete_review(first["id"])
+        place = self.place("b")
+        self.assertEqual((place["review_count"], place["rating"]), (0, 0.0))
+
+    def test_min_rating_and_sort(self):
+        """Rating filters and keyset pages over the rating order."""
+        for name, rating in (("a", 2), ("b", 5), ("c", 4)):
+            self.review(name, rating)
+        names = [p["name"] for p in self.facade.list_places(min_rating=3, sort="-rating")]
+        self.assertEqual(names, ["b", "c"])
+
+        first = self.facade.list_places(sort="-rating", limit=2)
+        after = (first[-1]["rating"], first[-1]["id"])
+        rest = self.facade.list_places(sort="-rating", after=after, limit=2)
+        self.assertEqual([p["name"] for p in first + rest], ["b", "c", "a"])
+
+    def test_recompute(self):
+        """Aggregates can be rebuilt from the reviews table."""
+        self.repo.add(Review(text="x", rating=4, user_id=self.user_id, place_id=self.places["c"]))
+        self.repo.add(Review(text="y", rating=2, user_id=self.user_id, place_id=self.places["c"]))
+        self.assertEqual(self.place("c")["review_count"], 0)
+        self.assertEqual(self.facade.recompute_place_ratings(batch_size=2), 3)
+        place = self.place("c")
+        self.assertEqual((place["review_count"], place["rating"]), (2, 3.0))
+
+
+class TestMemoryRatings(RatingContract, MemoryBackend, unittest.TestCase):
+    """Aggregates in MemoryRepository."""
+
+
+class TestSQLAlchemyRatings(RatingContract, SQLAlchemyBackend, unittest.TestCase):
+    """Aggregates in SQLAlchemyRepository on SQLite."""
+
+    def test_increment_is_atomic(self):
+        """Counters are bumped in SQL rather than read-modify-written."""
+        statements = self.record_statements()
+        self.review("a", 4)
+        updates = [s for s in statements if s.startswith("UPDATE places")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn("review_count + ", updates[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
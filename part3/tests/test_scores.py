@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for the top places score index and the sort=top listing.
+"""
+import random
+import unittest
+from datetime import datetime, timedelta
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.indexes import PlaceScores
+from tests.backends import MemoryBackend, SQLAlchemyBackend
+
+CREATED = datetime(2025, 6, 1)
+
+
+def record(place_id, reviews=0, rating_sum=0, created_at=CREATED):
+    return {"id": place_id, "review_count": reviews, "rating_sum": rating_sum,
+            "created_at": created_at}
+
+
+class TestPlaceScores(unittest.TestCase):
+    """Scoring rules and the ordered list under random writes."""
+
+    def test_bayesian_average_and_recency(self):
+        scores = PlaceScores(prior_mean=3.5, prior_weight=5, recency_weight=0.1)
+        one_five = scores.score(record("a", 1, 5))
+        many_good = scores.score(record("b", 100, 480))
+        self.assertLess(one_five, many_good)
+        newer = scores.score(record("c", created_at=CREATED + timedelta(days=365.25)))
+        self.assertAlmostEqual(newer - scores.score(record("d")), 0.1, delta=0.01)
+        self.assertEqual(scores.score(record("e", created_at=None)), 3.5)
+
+    def test_recency_bonus_is_bounded(self):
+        """An unreviewed new place does not beat a well-reviewed old one."""
+        scores = PlaceScores(prior_mean=3.5, prior_weight=5, recency_weight=0.1)
+        old = scores.score(record("a", 20, 90, created_at=datetime(2020, 1, 1)))
+        for year in (2027, 2030, 2050, 2200):
+            new = scores.score(record("b", created_at=datetime(year, 1, 1)))
+            self.assertLess(new, old, year)
+            self.assertLessEqual(new, 3.5 + scores.recency_max)
+
+    def test_random_writes_and_pages(self):
+        rng = random.Random(9)
+        scores = PlaceScores()
+        places = {}
+        for step in range(800):
+            place_id = f"p{rng.randrange(120)}"
+            if rng.random() < 0.1:
+                places.pop(place_id, None)
+                scores.remove(place_id)
+                continue
+            reviews = rng.randrange(20)
+            places[place_id] = record(place_id, reviews, reviews * rng.randint(1, 5),
+                                      CREATED + timedelta(days=rng.randrange(900)))
+            scores.add(places[place_id])
+
+        expected = sorted(places, key=lambda p: (-scores.score(places[p]), p))
+        self.assertEqual([p for p, _ in scores.top(10)], expected[:10])
+        pages, after = [], None
+        while True:
+            page = scores.top(7, after)
+            pages += [p for p, _ in page]
+            if len(page) < 7:
+                break
+            after = (page[-1][1], page[-1][0])
+        self.assertEqual(pages, expected)
+        self.assertEqual([p for p, _ in scores.iter_top(chunk=5)], expected)
+
+
+class TopPlacesContract:
+    """sort=top follows reviews and combines with filters."""
+
+    def seed(self):
+        self.facade = HbnbFacade(repo=self.repo)
+        self.user = self.repo.add(User(email="o@x.com", password="pw",
+                                       first_name="O", last_name="X")).id
+        self.ids = [self.facade.create_place({"name": f"P{i}", "price": 10.0 * (i + 1),
+                                              "latitude": 0.0, "longitude": 0.0,
+                                              "owner_id": self.user})["id"]
+                    for i in range(6)]
+
+    def names(self, **kwargs):
+        return [p["name"] for p in self.facade.list_places(sort="top", **kwargs)]
+
+    def review(self, i, rating):
+        return self.facade.create_review({"text": "ok", "rating": rating, "user_id": self.user,
+                                          "place_id": self.ids[i]})
+
+    def test_reviews_reorder(self):
+        """Newest first until reviews come in; then the best rated lead."""
+        self.assertEqual(len(self.names()), 6)
+        for rating in (5, 5, 5, 4):
+            self.review(1, rating)
+        low = self.review(3, 1)
+        places = self.facade.list_places(sort="top", limit=6)
+        self.assertEqual(places[0]["name"], "P1")
+        self.assertEqual(places[-1]["name"], "P3")
+        self.assertGreater(places[0]["score"], places[1]["score"])
+
+        self.facade.delete_review(low["id"])
+        self.facade.delete_place(self.ids[1])
+        self.assertNotIn("P1", self.names())
+        self.assertNotEqual(self.names()[-1], "P3")
+
+    def test_filters_and_pages(self):
+        self.review(0, 5)
+        self.assertEqual(self.names(max_price=30.0)[0], "P0")
+        self.assertEqual(sorted(self.names(max_price=30.0)), ["P0", "P1", "P2"])
+        first = self.facade.list_places(sort="top", limit=4)
+        rest = self.facade.list_places(sort="top", limit=4,
+                                       after=(first[-1]["score"], first[-1]["id"]))
+        self.assertEqual([p["name"] for p in first + rest], self.names())
+
+
+class TestMemoryTopPlaces(TopPlacesContract, MemoryBackend, unittest.TestCase):
+    """sort=top over MemoryRepository."""
+
+
+class TestSQLAlchemyTopPlaces(TopPlacesContract, SQLAlchemyBackend, unittest.TestCase):
+    """sort=top over SQLAlchemyRepository on SQLite."""
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for full-text place search (FTS5 on SQLite, TextIndex in memory).
+"""
+import random
+import unittest
+from sqlalchemy import text
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.bl.place import Place
+from hbnb.persistence.fulltext import install_fulltext_indexes
+from hbnb.persistence.memory_repo import MemoryRepository
+from hbnb.persistence.query import QuerySpec
+from hbnb.text import tokenize
+from tests.backends import MemoryBackend, SQLAlchemyBackend
+
+# name -> (description, price)
+PLACES = {
+    "Beach house": ("A lovely house right on the beach", 120.0),
+    "Mountain cabin": ("Cosy cabin near the ski slopes", 80.0),
+    "Beach hut": ("Small hut with beach access", 40.0),
+    "Café flat": ("Près de la plage", 60.0),
+}
+
+WORDS = "beach house cabin ski lake view garden pool city loft quiet sunny".split()
+
+
+class TestTokenize(unittest.TestCase):
+    """Tokens follow FTS5's unicode61 tokenizer."""
+
+    def test_folds_case_accents_and_punctuation(self):
+        self.assertEqual(tokenize("Café, PRÈS-de_la plage!"), ["cafe", "pres", "de", "la", "plage"])
+        self.assertEqual(tokenize(None), [])
+
+
+class SearchContract:
+    """Full-text place search and its ranking."""
+
+    def seed(self):
+        self.owner_id = self.repo.add(User(email="o@x.com", password="pw",
+                                           first_name="O", last_name="X")).id
+        for name, (description, price) in PLACES.items():
+            self.repo.add(Place(name=name, description=description, price=price,
+                                owner_id=self.owner_id))
+        self.facade = HbnbFacade(repo=self.repo)
+
+    def names(self, q, **kwargs):
+        return [place.name for place, _ in self.repo.search(Place, q, **kwargs)]
+
+    def test_every_token_must_match(self):
+        """Multi-word queries are ANDed; case and accents are ignored."""
+        self.assertEqual(sorted(self.names("beach house")), ["Beach house"])
+        self.assertEqual(sorted(self.names("BEACH")), ["Beach house", "Beach hut"])
+        self.assertEqual(self.names("cafe pres"), ["Café flat"])
+        self.assertEqual(self.names("beach castle"), [])
+        self.assertEqual(self.names('" OR *'), [])
+
+    def test_filters_and_limit(self):
+        """Spec conditions apply before the limit."""
+        spec = QuerySpec().between("price", None, 50)
+        self.assertEqual(self.names("beach", query=spec, limit=1), ["Beach hut"])
+        self.assertEqual(len(self.names("beach", limit=1)), 1)
+
+    def test_writes_keep_the_index_in_sync(self):
+        """Updated and deleted places are re-indexed."""
+        place = self.repo.search(Place, "cabin")[0][0]
+        self.facade.update_place(place.id, {"description": "Lake view"})
+        self.assertEqual(self.names("ski"), [])
+        self.assertEqual(self.names("lake"), ["Mountain cabin"])
+        self.facade.delete_place(place.id)
+        self.assertEqual(self.names("cabin"), [])
+
+    def test_facade_search(self):
+        """search_places returns expanded places, most relevant first."""
+        places = self.facade.search_places("beach", min_price=100)
+        self.assertEqual([p["name"] for p in places], ["Beach house"])
+        self.assertIn("amenities", places[0])
+
+
+class TestMemorySearch(SearchContract, MemoryBackend, unittest.TestCase):
+    """Inverted index in MemoryRepository."""
+
+
+class TestSQLAlchemySearch(SearchContract, SQLAlchemyBackend, unittest.TestCase):
+    """FTS5 index in SQLAlchemyRepository on SQLite."""
+
+    def test_existing_rows_are_indexed(self):
+        """Creating the index (or rebuilding it) indexes rows already there."""
+        self.session.execute(text("DROP TABLE places_fts"))
+        install_fulltext_indexes(self.session.connection())
+        self.assertEqual(len(self.names("beach")), 2)
+        self.session.execute(text("INSERT INTO places_fts(places_fts) VALUES ('delete-all')"))
+        self.assertEqual(self.names("beach"), [])
+        self.assertEqual(self.facade.rebuild_search_index(), len(PLACES))
+        self.assertEqual(len(self.names("beach")), 2)
+
+    def test_ranking_matches_memory_index(self):
+        """bm25() and the in-memory BM25 agree on order and scores."""
+        self.repo.delete_many(Place, [p.id for p in self.repo.list(Place)])
+        memory = MemoryRepository()
+        rng = random.Random(3)
+        for i in range(200):
+            place = dict(id=f"p{i:03d}", owner_id=self.owner_id, price=10.0,
+                         name=" ".join(rng.choices(WORDS, k=rng.randint(1, 3))),
+                         description=" ".join(rng.choices(WORDS, k=rng.randint(0, 12))))
+            self.repo.add(Place(**place))
+            memory.add(Place(**place))
+        for q in ("beach house", "ski", "pool view quiet"):
+            expected = [(p.id, round(s, 6)) for p, s in memory.search(Place, q, limit=20)]
+            found = [(p.id, round(s, 6)) for p, s in self.repo.search(Place, q, limit=20)]
+            self.assertEqual(found, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
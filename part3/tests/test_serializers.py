@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled API encoders and JSON backends.
+"""
+import json
+import unittest
+from flask_restx import Model, fields, marshal
+from hbnb.api.serializers import compile_encoder, json_backend, orjson
+from hbnb.api.v1.places import place_model, place_page_model, place_card_model
+
+OWNER = {"id": "o1", "first_name": "Ada", "last_name": "L", "email": "ada@x.com"}
+PLACE = {"id": "p1", "name": "Loft", "description": None, "price": 120, "latitude": 48.8,
+         "longitude": 2.3, "owner_id": "o1", "amenity_ids": ["a1"], "owner": OWNER,
+         "amenities": [{"id": "a1", "name": "WiFi", "created_at": "x"}], "review_count": "3",
+         "rating": 4, "rating_histogram": [0, 0, 0, 1, 1, 1], "created_at": "2025-01-01",
+         "rating_sum": 12}
+
+
+class TestCompiledEncoders(unittest.TestCase):
+    """Compiled encoders produce what marshal produces."""
+
+    def check(self, data, model, mask=None):
+        self.assertEqual(compile_encoder(model, mask)(data), marshal(data, model, mask=mask))
+
+    def test_place(self):
+        self.check(PLACE, place_model)
+        self.check(dict(PLACE, owner=None, amenities=None), place_model)
+        self.check({}, place_model)
+        self.check(PLACE, place_card_model)
+
+    def test_masks(self):
+        for mask in ("id,name", "name,owner", "owner{first_name},amenities{name}", "price"):
+            self.check(PLACE, place_model, mask)
+
+    def test_envelope(self):
+        """Wildcard facets and skip_none nested models."""
+        body = {"places": [PLACE], "total": 1,
+                "facets": {"price": [{"key": "100-200", "min": 100.0, "max": 200.0, "count": 1}],
+                           "amenities": [{"id": "a1", "name": "WiFi", "count": 1}]},
+                "included": {"owners": [OWNER]}}
+        self.check(body, place_page_model)
+        self.check(body, place_page_model, "places{id},included")
+
+    def test_field_options(self):
+        model = Model("Options", {
+            "renamed": fields.String(attribute="source"),
+            "fallback": fields.Integer(default=7),
+            "flag": fields.Boolean,
+            "nullable": fields.Nested(Model("Inner", {"a": fields.Float}), allow_null=True),
+            "tags": fields.List(fields.String),
+            "raw": fields.Raw,
+            "when": fields.DateTime,
+        })
+        self.check({"source": 5, "flag": 1, "tags": [1, "b"], "raw": {"x": [1]},
+                    "when": "2025-01-01T00:00:00"}, model)
+        self.check({"nullable": {"a": "2.5"}, "fallback": 3}, model)
+
+
+class TestJsonBackends(unittest.TestCase):
+    """Backends encode to the same JSON."""
+
+    def test_backends(self):
+        data = [{"name": "Café", "price": 1.5, "tags": ["a"], "n": None}]
+        encoded = json_backend("json")(data)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(json.loads(encoded), data)
+        self.assertEqual(json.loads(json_backend("auto")(data)), data)
+        if orjson is not None:
+            self.assertEqual(json.loads(json_backend("orjson")(data)), data)
+        with self.assertRaises(ValueError):
+            json_backend("yaml")
+
+
+if __name__ == '__main__':
+    unittest.main()
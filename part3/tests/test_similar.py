@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the similar places index.
+"""
+import math
+import random
+import unittest
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.errors import NotFound
+from hbnb.indexes import PlaceSimilarity
+from tests.backends import MemoryBackend, SQLAlchemyBackend
+
+AMENITIES = [f"a{i}" for i in range(12)]
+
+
+class TestPlaceSimilarity(unittest.TestCase):
+    """Batched candidates plus exact re-ranking match an exhaustive search."""
+
+    def setUp(self):
+        self.rng = random.Random(12)
+        self.index = PlaceSimilarity()
+        self.places = {f"p{i}": self.record(f"p{i}") for i in range(400)}
+        self.index.rebuild(dict(p) for p in self.places.values())
+
+    def record(self, place_id):
+        rng = self.rng
+        return {"id": place_id, "price": rng.lognormvariate(4.5, 0.9),
+                "latitude": rng.uniform(-60, 60), "longitude": rng.uniform(-180, 180),
+                "amenity_ids": [a for a in AMENITIES if rng.random() < 0.3]}
+
+    def vector(self, place):
+        """Full feature vector, built independently of the index's lanes."""
+        amenity_weight, price_weight, geo_weight = self.index.weights
+        z, x, y, w = self.index._dense(place)
+        amenities = place["amenity_ids"]
+        vector = [amenity_weight / math.sqrt(len(amenities)) if a in amenities else 0.0
+                  for a in AMENITIES]
+        return vector + [price_weight * z, geo_weight * x, geo_weight * y, geo_weight * w]
+
+    def cosine(self, a, b):
+        va, vb = self.vector(a), self.vector(b)
+        dot = sum(x * y for x, y in zip(va, vb))
+        return dot / math.sqrt(sum(x * x for x in va) * sum(y * y for y in vb))
+
+    def check(self, place_id, k=8):
+        expected = sorted(((self.cosine(self.places[place_id], p), p["id"])
+                           for p in self.places.values() if p["id"] != place_id),
+                          key=lambda pair: (-pair[0], pair[1]))[:k]
+        found = self.index.similar(place_id, k)
+        self.assertEqual([p for p, _ in found], [p for _, p in expected], place_id)
+        for (_, similarity), (cosine, _) in zip(found, expected):
+            self.assertAlmostEqual(similarity, cosine)
+
+    def test_matches_exhaustive_search(self):
+        for place_id in ("p0", "p17", "p123"):
+            self.check(place_id)
+
+    def test_random_writes(self):
+        """Updated, new and deleted rows are reflected in the lanes."""
+        for step in range(300):
+            place_id = f"p{self.rng.randrange(500)}"
+            if self.rng.random() < 0.2:
+                self.places.pop(place_id, None)
+                self.index.remove(place_id)
+            else:
+                self.places[place_id] = self.record(place_id)
+                self.index.add(dict(self.places[place_id]))
+        for place_id in self.rng.sample(sorted(self.places), 5):
+            self.check(place_id)
+        self.assertEqual(self.index.similar("missing"), [])
+
+
+class SimilarPlacesContract:
+    """Similar places follow place updates."""
+
+    def test_follows_updates(self):
+        facade = HbnbFacade(repo=self.repo)
+        owner = self.repo.add(User(email="o@x.com", password="pw", first_name="O", last_name="X"))
+        wifi = facade.create_amenity({"name": "WiFi"})["id"]
+        pool = facade.create_amenity({"name": "Pool"})["id"]
+        ids = {name: facade.create_place({"name": name, "price": price, "latitude": lat,
+                                          "longitude": lng, "owner_id": owner.id,
+                                          "amenity_ids": amenities})["id"]
+               for name, price, lat, lng, amenities in [
+                   ("Loft", 120.0, 48.86, 2.35, [wifi]), ("Flat", 110.0, 48.85, 2.34, [wifi]),
+                   ("Villa", 900.0, 43.7, 7.26, [wifi, pool]), ("Room", 60.0, 35.68, 139.7, [])]}
+
+        similar = facade.list_similar_places(ids["Loft"], k=3)
+        self.assertEqual([p["name"] for p in similar], ["Flat", "Villa", "Room"])
+        self.assertGreater(similar[0]["similarity"], 0.99)
+
+        facade.update_place(ids["Villa"], {"price": 120.0, "latitude": 48.86, "longitude": 2.35,
+                                           "amenity_ids": [wifi]})
+        facade.delete_place(ids["Flat"])
+        similar = facade.list_similar_places(ids["Loft"], k=3)
+        self.assertEqual([p["name"] for p in similar], ["Villa", "Room"])
+        self.assertAlmostEqual(similar[0]["similarity"], 1.0)
+        with self.assertRaises(NotFound):
+            facade.list_similar_places(ids["Flat"])
+
+
+class TestMemorySimilarPlaces(SimilarPlacesContract, MemoryBackend, unittest.TestCase):
+    """Similar places over MemoryRepository."""
+
+
+class TestSQLAlchemySimilarPlaces(SimilarPlacesContract, SQLAlchemyBackend, unittest.TestCase):
+    """Similar places over SQLAlchemyRepository on SQLite."""
+
+
+if __name__ == '__main__':
+    unittest.main()
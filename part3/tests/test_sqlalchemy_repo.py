@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for SQLAlchemyRepository transaction and batch behaviour.
+"""
+import unittest
+from sqlalchemy import event, text
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.bl.amenity import Amenity
+from hbnb.bl.place import Place
+from hbnb.bl.review import Review
+from hbnb.persistence.user_repository import UserRepository
+from hbnb.persistence.query import QuerySpec
+from tests.backends import SQLAlchemyBackend
+
+
+class RepositoryTestCase(SQLAlchemyBackend, unittest.TestCase):
+    """SQLAlchemyRepository on an in-memory SQLite database."""
+
+    def seed(self):
+        self.commits = 0
+        event.listen(self.engine, "commit", self._count_commit)
+
+    def _count_commit(self, conn):
+        self.commits += 1
+
+
+class TestUnitOfWork(RepositoryTestCase):
+    """Writes inside unit_of_work() share one transaction."""
+
+    def test_single_commit_for_many_writes(self):
+        """Several writes commit once at the end of the block."""
+        with self.repo.unit_of_work():
+            for i in range(5):
+                self.repo.add(Amenity(name=f"A{i}"))
+            self.assertEqual(self.commits, 0)
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(len(self.repo.list(Amenity)), 5)
+
+    def test_nested_blocks_join_outer(self):
+        """Only the outermost block commits."""
+        with self.repo.unit_of_work():
+            with self.repo.unit_of_work():
+                self.repo.add(Amenity(name="inner"))
+            self.assertEqual(self.commits, 0)
+        self.assertEqual(self.commits, 1)
+
+    def test_error_rolls_back_everything(self):
+        """An exception discards every write in the unit."""
+        with self.assertRaises(RuntimeError):
+            with self.repo.unit_of_work():
+                self.repo.add(Amenity(name="lost"))
+                raise RuntimeError("boom")
+        self.assertEqual(self.repo.list(Amenity), [])
+
+    def test_facade_write_is_atomic(self):
+        """A facade write that fails validation leaves nothing behind."""
+        facade = HbnbFacade(repo=self.repo)
+        owner = self.repo.add(User(email="o@x.com", password="pw", first_name="O", last_name="X"))
+        place = facade.create_place({"name": "P", "price": 10.0, "owner_id": owner.id})
+        with self.assertRaises(ValueError):
+            facade.update_place(place["id"], {"price": -1})
+        self.session.expire_all()
+        self.assertEqual(self.repo.get(Place, place["id"]).price, 10.0)
+
+    def test_without_unit_of_work_commits_each_call(self):
+        """Outside a unit of work every write still commits immediately."""
+        self.repo.add(Amenity(name="A"))
+        self.repo.add(Amenity(name="B"))
+        self.assertEqual(self.commits, 2)
+
+
+class TestBulkWrites(RepositoryTestCase):
+    """add_many / update_many / delete_many."""
+
+    repository = UserRepository
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.repo.add(User(email="o@x.com", password="pw", first_name="O", last_name="X"))
+
+    def make_places(self, count):
+        return [Place(name=f"P{i}", price=float(i), owner_id=self.owner.id,
+                      amenity_ids=["a1"]) for i in range(count)]
+
+    def test_add_many_inserts_with_ids(self):
+        """Bulk insert fills ids and round-trips column values."""
+        places = self.make_places(1200)
+        self.assertEqual(self.repo.add_many(iter(places)), 1200)
+        self.assertTrue(all(p.id for p in places))
+        stored = self.repo.get(Place, places[10].id)
+        self.assertEqual((stored.name, stored.amenity_ids), ("P10", ["a1"]))
+        self.assertEqual(len(self.repo.list(Place)), 1200)
+
+    def test_add_many_applies_column_defaults(self):
+        """Unset attributes get their column default, not an explicit NULL."""
+        places = self.make_places(2)
+        del places[0].review_count
+        del places[0].rating
+        self.repo.add_many(places)
+        self.session.expire_all()
+        stored = self.repo.get(Place, places[0].id)
+        self.assertEqual((stored.review_count, stored.rating), (0, 0.0))
+
+    def test_bulk_writes_reject_mixed_classes(self):
+        """Objects of several classes are not written under one mapper."""
+        mixed = self.make_places(1) + [Amenity(name="A")]
+        with self.assertRaises(ValueError):
+            self.repo.add_many(mixed)
+        with self.assertRaises(ValueError):
+            self.repo.update_many(mixed)
+        self.assertEqual(self.repo.list(Place), [])
+
+    def test_update_many_detached_and_attached(self):
+        """Both session-tracked and detached objects are written."""
+        places = self.make_places(3)
+        self.repo.add_many(places)
+        attached = self.repo.get(Place, places[0].id)
+        attached.price = 99.0
+        places[1].price = 42.0
+        self.repo.update_many([attached, places[1]])
+        self.session.expire_all()
+        self.assertEqual(self.repo.get(Place, places[0].id).price, 99.0)
+        self.assertEqual(self.repo.get(Place, places[1].id).price, 42.0)
+
+    def test_delete_many_chunks_and_cascades(self):
+        """Bulk delete spans several IN chunks and keeps ORM cascades."""
+        places = self.make_places(1100)
+        self.repo.add_many(places)
+        self.repo.add(Review(text="t", rating=3, user_id=self.owner.id, place_id=places[0].id))
+        deleted = self.repo.delete_many(Place, [p.id for p in places[:1050]])
+        self.assertEqual(deleted, 1050)
+        self.assertEqual(len(self.repo.list(Place)), 50)
+        self.assertEqual(self.repo.list(Review), [])
+
+    def test_get_by_emails(self):
+        """Bulk email lookup only returns existing users."""
+        found = self.repo.get_by_emails(["o@x.com", "missing@x.com"])
+        self.assertEqual(list(found), ["o@x.com"])
+
+
+class TestTimestamps(RepositoryTestCase):
+    """Timestamps are written client-side with the same precision."""
+
+    def stored_lengths(self):
+        return tuple(self.session.execute(text(
+            "SELECT length(created_at), length(updated_at) FROM amenities")).one())
+
+    def test_insert_and_update_keep_microseconds(self):
+        """updated_at is stored like created_at on insert and on update."""
+        amenity = self.repo.add(Amenity(name="WiFi"))
+        self.assertEqual(self.stored_lengths(), (26, 26))
+        created = amenity.updated_at
+        amenity.name = "Pool"
+        self.session.commit()
+        self.assertEqual(self.stored_lengths(), (26, 26))
+        self.assertGreaterEqual(amenity.updated_at, created)
+
+
+class TestStreaming(RepositoryTestCase):
+    """stream() and the facade iterators."""
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.repo.add(User(email="o@x.com", password="pw", first_name="O", last_name="X"))
+        self.repo.add_many(Place(name=f"P{i}", price=float(i), owner_id=self.owner.id)
+                           for i in range(25))
+
+    def test_stream_is_lazy_and_complete(self):
+        """stream() returns an iterator honouring the query spec."""
+        rows = self.repo.stream(Place, QuerySpec().between("price", 10, 19), batch_size=4)
+        self.assertFalse(isinstance(rows, list))
+        self.assertEqual(sorted(p.price for p in rows), [float(i) for i in range(10, 20)])
+
+    def test_facade_iter_places(self):
+        """Expanded places are produced batch by batch."""
+        facade = HbnbFacade(repo=self.repo)
+        places = list(facade.iter_places(batch_size=7))
+        self.assertEqual(len(places), 25)
+        self.assertEqual(len({p["id"] for p in places}), 25)
+        self.assertTrue(all(p["owner"]["id"] == self.owner.id for p in places))
+        self.assertEqual(len(list(facade.iter_users())), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
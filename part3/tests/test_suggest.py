@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for the place name autocomplete index.
+"""
+import random
+import unittest
+from hbnb.facade import HbnbFacade
+from hbnb.bl.user import User
+from hbnb.indexes import PlaceSuggester
+from hbnb.indexes.suggest import name_keys
+from tests.backends import SQLAlchemyBackend
+
+SYLLABLES = "ba be mou ta lo ri ca sa".split()
+
+
+class TestPlaceSuggester(unittest.TestCase):
+    """Suggestions match a brute-force ranking under random writes."""
+
+    def setUp(self):
+        self.rng = random.Random(5)
+        self.places = {}
+        for i in range(300):
+            self.places[f"p{i:03d}"] = self.record(f"p{i:03d}")
+        self.index = PlaceSuggester(max_limit=5, cache_threshold=8)
+        self.index.rebuild(dict(p) for p in self.places.values())
+
+    def word(self):
+        return "".join(self.rng.choices(SYLLABLES, k=self.rng.randint(1, 3)))
+
+    def record(self, place_id):
+        name = " ".join(self.word() for _ in range(self.rng.randint(1, 3)))
+        return {"id": place_id, "name": name, "review_count": self.rng.randint(0, 9)}
+
+    def brute_force(self, prefix, limit):
+        matches = [p for p in self.places.values()
+                   if any(key.startswith(prefix) for key in name_keys(p["name"]))]
+        matches.sort(key=lambda p: (-p["review_count"], p["name"].lower(), p["id"]))
+        return [p["id"] for p in matches[:limit]]
+
+    def check(self, prefix, limit=5):
+        found = [s["id"] for s in self.index.suggest(prefix, limit)]
+        self.assertEqual(found, self.brute_force(prefix, limit), prefix)
+
+    def test_word_starts_and_folding(self):
+        """Any word start matches, across words, ignoring case and accents."""
+        index = PlaceSuggester()
+        index.add({"id": "a", "name": "Cosy Mountain Café", "review_count": 1})
+        for prefix in ("cos", "MOUNT", "mountain caf", "café", "Cafe"):
+            self.assertEqual([s["id"] for s in index.suggest(prefix)], ["a"], prefix)
+        self.assertEqual(index.suggest("ountain"), [])
+        self.assertEqual(index.suggest("  "), [])
+
+    def test_random_writes(self):
+        """Ranked lists stay exact through count changes, renames, inserts and deletes."""
+        for step in range(500):
+            place_id = self.rng.choice(sorted(self.places))
+            action = self.rng.random()
+            if action < 0.6:
+                place = self.places[place_id]
+                place["review_count"] = max(0, place["review_count"] + self.rng.choice((1, 1, -1)))
+                self.index.add(dict(place))
+            elif action < 0.7:
+                self.places[place_id]["name"] = self.word()
+                self.index.add(dict(self.places[place_id]))
+            elif action < 0.8:
+                del self.places[place_id]
+                self.index.remove(place_id)
+            else:
+                self.places[f"n{step}"] = self.record(f"n{step}")
+                self.index.add(dict(self.places[f"n{step}"]))
+            self.check(self.word()[:self.rng.randint(1, 4)])
+
+
+class TestSuggestPlaces(SQLAlchemyBackend, unittest.TestCase):
+    """Facade suggestions follow reviews without touching the database."""
+
+    def seed(self):
+        self.facade = HbnbFacade(repo=self.repo)
+        owner = self.repo.add(User(email="o@x.com", password="pw",
+                                   first_name="O", last_name="X"))
+        self.owner_id = owner.id
+        self.ids = {name: self.facade.create_place({"name": name, "price": 10.0,
+                                                    "latitude": 0.0, "longitude": 0.0,
+                                                    "owner_id": owner.id})["id"]
+                    for name in ("Mountain cabin", "Moulin rouge", "Beach house")}
+
+    def names(self, prefix):
+        return [s["name"] for s in self.facade.suggest_places(prefix)]
+
+    def test_ranked_by_reviews(self):
+        """A new review moves a place up; no SQL runs for suggestions."""
+        self.assertEqual(self.names("mou"), ["Moulin rouge", "Mountain cabin"])
+        self.facade.create_review({"text": "ok", "rating": 5, "user_id": self.owner_id,
+                                   "place_id": self.ids["Mountain cabin"]})
+        statements = self.record_statements()
+        self.assertEqual(self.names("mou"), ["Mountain cabin", "Moulin rouge"])
+        self.assertEqual(statements, [])
+
+    def test_renamed_and_deleted_places(self):
+        """Place writes update the suggestions."""
+        self.names("b")
+        self.facade.update_place(self.ids["Beach house"], {"name": "Mouette"})
+        self.facade.delete_place(self.ids["Moulin rouge"])
+        self.assertEqual(self.names("mou"), ["Mouette", "Mountain cabin"])
+        self.assertEqual(self.names("beach"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -168,23 +168,38 @@ function checkAuthentication() {
     return token;
 }
 
+// Largest page the API serves (PAGE_SIZE_MAX)
+const PLACES_PAGE_SIZE = 500;
+
 async function fetchPlaces() {
     const token = checkAuthentication();
 
     try {
         const headers = token ? { 'Authorization': `Bearer ${token}` } : {};
+        const places = [];
+        let cursor = null;
+
+        // Follow the next-page cursor until the last page
+        do {
+            const params = new URLSearchParams({ limit: PLACES_PAGE_SIZE });
+            if (cursor) {
+                params.set('cursor', cursor);
+            }
 
-        const response = await fetch(`${API_BASE_URL}/places`, {
-            method: 'GET',
-            headers: headers
-        });
+            const response = await fetch(`${API_BASE_URL}/places/cards?${params}`, {
+                method: 'GET',
+                headers: headers
+            });
 
-        if (response.ok) {
-            const places = await response.json();
-            displayPlaces(places);
-        } else {
-            console.error('Failed to fetch places:', response.statusText);
-        }
+            if (!response.ok) {
+                console.error('Failed to fetch places:', response.statusText);
+                break;
+            }
+            places.push(...await response.json());
+            cursor = response.headers.get('X-Next-Cursor');
+        } while (cursor);
+
+        displayPlaces(places);
     } catch (error) {
         console.error('Error fetching places:', error);
     }
@@ -201,10 +216,14 @@ function displayPlaces(places) {
         const card = document.createElement('div');
         card.className = 'place-card';
         card.setAttribute('data-price', place.price);
+        const rating = place.review_count > 0
+            ? `<p class="rating">⭐ ${place.rating.toFixed(1)} (${place.review_count})</p>`
+            : '';
 
         card.innerHTML = `
             <h3>${place.name}</h3>
             <p class="price">$${place.price} per night</p>
+            ${rating}
             <button class="details-button" onclick="window.location.href='place.html?place_id=${place.id}'">View Details</button>
         `;
 
@@ -302,6 +321,44 @@ function displayPlaceDetails(place) {
     }
 }
 
+async function fetchSimilarPlaces(placeId) {
+    try {
+        const response = await fetch(`${API_BASE_URL}/places/${placeId}/similar?k=4`);
+
+        if (response.ok) {
+            const places = await response.json();
+            displaySimilarPlaces(places);
+        } else {
+            console.error('Failed to fetch similar places:', response.statusText);
+        }
+    } catch (error) {
+        console.error('Error fetching similar places:', error);
+    }
+}
+
+function displaySimilarPlaces(places) {
+    const section = document.getElementById('similar-places');
+    const similarList = document.getElementById('similar-list');
+
+    if (!section || !similarList) return;
+
+    similarList.innerHTML = '';
+    section.style.display = places.length > 0 ? 'block' : 'none';
+
+    places.forEach(place => {
+        const card = document.createElement('div');
+        card.className = 'place-card';
+
+        card.innerHTML = `
+            <h3>${place.name}</h3>
+            <p class="price">$${place.price} per night</p>
+            <button class="details-button" onclick="window.location.href='place.html?place_id=${place.id}'">View Details</button>
+        `;
+
+        similarList.appendChild(card);
+    });
+}
+
 function displayReviews(reviews) {
     const reviewsList = document.getElementById('reviews-list');
 
@@ -434,6 +491,7 @@ document.addEventListener('DOMContentLoaded', () => {
         const placeId = getPlaceIdFromURL();
         if (placeId) {
             fetchPlaceDetails(placeId);
+            fetchSimilarPlaces(placeId);
         }
     } else if (page === 'add_review.html') {
         handleAddReview();